@@ -1,3 +1,4 @@
 # -*- coding: utf-8 -*-
 
 from .tensorboard_logger import *
+from .remote import RemoteLogger
@@ -0,0 +1,218 @@
+# -*- coding: utf-8 -*-
+""" Adapters turning array-likes (NumPy arrays, CPU tensors, memoryviews
+and other objects with ``__array__``, ``__array_interface__`` or the
+buffer protocol) into NumPy views without copying them.
+Data in dtypes NumPy can't compute with efficiently (float16, bfloat16,
+non-native byte order, integers) is converted in fixed-size chunks,
+so peak memory does not grow with the array size.
+"""
+import numpy as np
+
+
+CHUNK_SIZE = 1 << 16
+
+_BFLOAT16 = 'bfloat16'
+
+
+def as_array(value):
+    """ Return a NumPy view of value without copying it when possible.
+    bfloat16 data is returned as a view of its raw bits with a
+    "bfloat16" dtype name preserved, see ``is_bfloat16``.
+
+    Example:
+        >>> import array
+        >>> buf = array.array('f', [1, 2, 3])
+        >>> view = as_array(memoryview(buf))
+        >>> view[0] = 10
+        >>> buf[0]
+        10.0
+    """
+    if isinstance(value, np.ndarray):
+        return value
+    if getattr(value, 'requires_grad', False):
+        value = value.detach()  # torch tensors requiring grad
+    if str(getattr(value, 'dtype', '')).endswith(_BFLOAT16) and hasattr(
+            value, 'view') and not hasattr(value, '__array_interface__'):
+        # torch bfloat16 tensors can not be converted to NumPy,
+        # take a view of their raw bits instead.
+        import torch
+        return _BFloat16Bits(np.asarray(value.view(torch.int16)))
+    return np.asarray(value)
+
+
+class _BFloat16Bits(np.ndarray):
+    """ Raw bits of a bfloat16 array, as an int16 ndarray view.
+    """
+    def __new__(cls, bits):
+        return bits.view(cls)
+
+
+def is_bfloat16(array):
+    return (isinstance(array, _BFloat16Bits) or
+            array.dtype.name == _BFLOAT16)
+
+
+def float_chunks(array, chunk_size=CHUNK_SIZE):
+    """ Iterate over flat chunks of array as float32 or float64 arrays.
+    Contiguous float32 and float64 arrays are not copied at all,
+    other dtypes are converted one chunk at a time.
+
+    Example:
+        >>> [c.tolist() for c in float_chunks(np.arange(5, dtype='>i4'), 2)]
+        [[0.0, 1.0], [2.0, 3.0], [4.0]]
+    """
+    bfloat16 = is_bfloat16(array)
+    if bfloat16:
+        array = array.view(np.uint16)
+    if array.flags.c_contiguous or array.flags.f_contiguous:
+        flat = array.reshape(-1, order='A')
+        for start in range(0, flat.shape[0], chunk_size):
+            yield _to_float(flat[start:start + chunk_size], bfloat16)
+    else:
+        # Buffered iteration copies at most chunk_size elements at a time,
+        # however large rows are. The buffer is reused, so chunks
+        # which are not converted are copied.
+        iterator = np.nditer(
+            array, flags=['external_loop', 'buffered', 'zerosize_ok'],
+            buffersize=chunk_size)
+        for chunk in iterator:
+            converted = _to_float(chunk, bfloat16)
+            yield converted.copy() if converted is chunk else converted
+
+
+def _to_float(chunk, bfloat16):
+    if bfloat16:
+        return (chunk.astype(np.uint32) << 16).view(np.float32)
+    dtype = chunk.dtype
+    if dtype.isnative and dtype in (np.float32, np.float64):
+        return chunk
+    if dtype.kind == 'f' and dtype.itemsize <= 4:
+        return chunk.astype(np.float32)
+    return chunk.astype(np.float64)
+
+
+def as_scalar(value):
+    """ Return a float from a number, a NumPy scalar, or a one-element
+    array-like (e.g. a 0-d array or tensor).
+
+    Example:
+        >>> as_scalar(np.array(1.5, dtype=np.float16))
+        1.5
+    """
+    if isinstance(value, float):
+        return value
+    array = as_array(value)
+    if array.size != 1:
+        raise TypeError('"value" should be a scalar, got an array of shape {}'
+                        .format(array.shape))
+    if is_bfloat16(array):
+        return float(next(float_chunks(array))[0])
+    return float(array.reshape(()))
+
+
+def array_stats(array, chunk_size=CHUNK_SIZE):
+    """ Compute min, max, count, sum and sum of squares in one
+    chunked pass.
+
+    Example:
+        >>> array_stats(np.array([1, 2, 3], dtype=np.float16))
+        (1.0, 3.0, 3, 6.0, 14.0)
+    """
+    min_, max_ = np.inf, -np.inf
+    num = 0
+    sum_ = sum_squares = 0.0
+    for chunk in float_chunks(array, chunk_size):
+        if not chunk.size:
+            continue
+        min_ = min(min_, float(chunk.min()))
+        max_ = max(max_, float(chunk.max()))
+        num += chunk.size
+        chunk = chunk.astype(np.float64, copy=False)
+        sum_ += float(chunk.sum())
+        sum_squares += float(np.dot(chunk, chunk))
+    return min_, max_, num, sum_, sum_squares
+
+
+def histogram(array, bins=10, value_range=None, chunk_size=CHUNK_SIZE):
+    """ Like ``np.histogram(array, bins)`` with an integer number of bins,
+    but computed in chunks.
+
+    Example:
+        >>> counts, edges = histogram(np.arange(10, dtype=np.float16), 5)
+        >>> counts.tolist(), edges.tolist()
+        ([2, 2, 2, 2, 2], [0.0, 1.8, 3.6, 5.4, 7.2, 9.0])
+    """
+    if value_range is None:
+        min_, max_ = array_stats(array, chunk_size)[:2]
+    else:
+        min_, max_ = value_range
+    if min_ > max_:  # empty array
+        min_, max_ = 0., 1.
+    elif min_ == max_:
+        min_, max_ = min_ - 0.5, max_ + 0.5
+    edges = np.linspace(min_, max_, bins + 1)
+    counts = np.zeros(bins, dtype=np.int64)
+    for chunk in float_chunks(array, chunk_size):
+        counts += np.histogram(chunk, bins=edges)[0]
+    return counts, edges
+
+
+TENSOR_STATS = ('mean', 'std', 'min', 'max', 'l2_norm', 'zero_fraction',
+                'nonfinite_fraction')
+
+
+def tensor_stats(array, stats=TENSOR_STATS, chunk_size=CHUNK_SIZE):
+    """ Compute requested statistics in one chunked pass, returning
+    a list of (stat, value) pairs in the order of stats.
+    "mean", "std", "min", "max" and "l2_norm" are computed over finite
+    values, and "zero_fraction" and "nonfinite_fraction" over all values.
+    Chunk means and squared deviations are merged pairwise, so "std" is
+    accurate even when the mean is large compared to the spread.
+
+    Example:
+        >>> tensor_stats(np.array([0, 1, 2, np.inf], dtype=np.float16))
+        ... # doctest: +NORMALIZE_WHITESPACE
+        [('mean', 1.0), ('std', 0.816496580927726), ('min', 0.0), ('max', 2.0),
+         ('l2_norm', 2.23606797749979), ('zero_fraction', 0.25),
+         ('nonfinite_fraction', 0.25)]
+    """
+    unknown = set(stats) - set(TENSOR_STATS)
+    if unknown:
+        raise ValueError('unknown stats {}, expected some of {}'.format(
+            ', '.join(sorted(unknown)), ', '.join(TENSOR_STATS)))
+    total = num = zeros = 0
+    mean = m2 = 0.0
+    min_, max_ = np.inf, -np.inf
+    for chunk in float_chunks(array, chunk_size):
+        total += chunk.size
+        finite = np.isfinite(chunk)
+        if not finite.all():
+            chunk = chunk[finite]
+        if not chunk.size:
+            continue
+        zeros += chunk.size - np.count_nonzero(chunk)
+        min_ = min(min_, float(chunk.min()))
+        max_ = max(max_, float(chunk.max()))
+        chunk = chunk.astype(np.float64, copy=False)
+        chunk_mean = float(chunk.mean())
+        deviations = chunk - chunk_mean
+        chunk_m2 = float(np.dot(deviations, deviations))
+        # Chan et al. pairwise update of mean and sum of squared deviations
+        delta = chunk_mean - mean
+        new_num = num + chunk.size
+        mean += delta * chunk.size / new_num
+        m2 += chunk_m2 + delta * delta * num * chunk.size / new_num
+        num = new_num
+    if not total:
+        raise ValueError('can not compute stats of an empty array')
+    nan = float('nan')
+    values = {
+        'mean': mean if num else nan,
+        'std': np.sqrt(m2 / num) if num else nan,
+        'min': min_ if num else nan,
+        'max': max_ if num else nan,
+        'l2_norm': float(np.sqrt(m2 + num * mean * mean)),
+        'zero_fraction': zeros / float(total),
+        'nonfinite_fraction': (total - num) / float(total),
+    }
+    return [(stat, float(values[stat])) for stat in stats]
@@ -0,0 +1,246 @@
+# -*- coding: utf-8 -*-
+""" Collector service receiving pre-encoded event records from
+``RemoteLogger`` clients and writing each run's event files locally.
+
+Run it with::
+
+    python -m tensorboard_logger.collector --logdir runs --port 6007
+
+or ``--unix /tmp/collector.sock`` to listen on a Unix socket.
+
+Protocol: after connecting, a client sends a HELLO message with its run name
+and event file name, and the collector replies with the sequence number of
+the last batch it has written for this file (0 for a new file).
+Then the client sends batches of records, each with an increasing sequence
+number, and the collector acknowledges each batch after writing it.
+Batches with already written sequence numbers (resent after a reconnect)
+are acknowledged but not written again.
+"""
+import argparse
+import os
+import posixpath
+import socket
+import struct
+import threading
+
+from six.moves import socketserver
+
+
+MAGIC = b'TBL1'
+_HELLO_HEADER = struct.Struct('!HH')  # run and filename lengths
+_BATCH_HEADER = struct.Struct('!QI')  # sequence number, payload length
+_ACK = struct.Struct('!Q')  # sequence number
+
+
+def hello_message(run, filename):
+    run, filename = run.encode('utf8'), filename.encode('utf8')
+    return b''.join([
+        MAGIC, _HELLO_HEADER.pack(len(run), len(filename)), run, filename])
+
+
+def batch_message(seq, payload):
+    return _BATCH_HEADER.pack(seq, len(payload)) + payload
+
+
+def recv_exactly(sock, n):
+    """ Read exactly n bytes from a socket, raise EOFError if the
+    connection is closed before that.
+    """
+    chunks = []
+    while n:
+        chunk = sock.recv(n)
+        if not chunk:
+            raise EOFError('connection closed')
+        chunks.append(chunk)
+        n -= len(chunk)
+    return b''.join(chunks)
+
+
+def recv_ack(sock):
+    seq, = _ACK.unpack(recv_exactly(sock, _ACK.size))
+    return seq
+
+
+def check_run_path(run, filename):
+    """ Make sure run and filename can not escape the collector logdir.
+
+    Example:
+        >>> check_run_path('exp/rank0', 'events.out.tfevents.1.host')
+        >>> check_run_path('../etc', 'events.out.tfevents.1.host')
+        Traceback (most recent call last):
+        ...
+        ValueError: invalid run name "../etc"
+    """
+    parts = run.split('/')
+    if (not run or posixpath.isabs(run) or '\\' in run or
+            any(part in ('', '.', '..') for part in parts)):
+        raise ValueError('invalid run name "{}"'.format(run))
+    if ('/' in filename or '\\' in filename or
+            not filename.startswith('events.out.tfevents.')):
+        raise ValueError('invalid event file name "{}"'.format(filename))
+
+
+class _RunFile(object):
+    def __init__(self, path, buffer_size):
+        self.lock = threading.Lock()
+        self.last_seq = 0
+        dirname = os.path.dirname(path)
+        if not os.path.exists(dirname):
+            os.makedirs(dirname)
+        self._file = open(path, 'ab', buffer_size)
+
+    def write(self, seq, payload):
+        with self.lock:
+            if seq > self.last_seq:
+                self._file.write(payload)
+                self.last_seq = seq
+
+    def flush(self):
+        with self.lock:
+            self._file.flush()
+
+    def close(self):
+        with self.lock:
+            self._file.close()
+
+
+class _Handler(socketserver.BaseRequestHandler):
+    def handle(self):
+        collector = self.server.collector
+        sock = self.request
+        try:
+            if recv_exactly(sock, len(MAGIC)) != MAGIC:
+                return
+            run_len, filename_len = _HELLO_HEADER.unpack(
+                recv_exactly(sock, _HELLO_HEADER.size))
+            run = recv_exactly(sock, run_len).decode('utf8')
+            filename = recv_exactly(sock, filename_len).decode('utf8')
+            run_file = collector.run_file(run, filename)
+            sock.sendall(_ACK.pack(run_file.last_seq))
+            while True:
+                seq, size = _BATCH_HEADER.unpack(
+                    recv_exactly(sock, _BATCH_HEADER.size))
+                run_file.write(seq, recv_exactly(sock, size))
+                sock.sendall(_ACK.pack(seq))
+        except (EOFError, ValueError, socket.error):
+            pass
+
+
+class _TCPServer(socketserver.ThreadingMixIn, socketserver.TCPServer):
+    daemon_threads = True
+    allow_reuse_address = True
+
+
+if hasattr(socketserver, 'UnixStreamServer'):
+    class _UnixServer(socketserver.ThreadingMixIn,
+                      socketserver.UnixStreamServer):
+        daemon_threads = True
+
+
+class Collector(object):
+    """ Collector server: writes records received from ``RemoteLogger``
+    clients into ``<logdir>/<run>/<event file name>``.
+    Files are written with large buffers and flushed every ``flush_secs``.
+
+    Args:
+        logdir (str): root directory for all runs.
+        address: (host, port) tuple to listen on TCP,
+            or a path to listen on a Unix socket.
+        flush_secs (float): how often to flush run files.
+        buffer_size (int): size of write buffer for each run file.
+    """
+    def __init__(self, logdir, address=('127.0.0.1', 0), flush_secs=2,
+                 buffer_size=1 << 20):
+        self.logdir = logdir
+        self.flush_secs = flush_secs
+        self.buffer_size = buffer_size
+        self._files = {}
+        self._files_lock = threading.Lock()
+        self._stopped = threading.Event()
+        if isinstance(address, tuple):
+            self._server = _TCPServer(address, _Handler)
+        else:
+            if os.path.exists(address):
+                os.unlink(address)
+            self._server = _UnixServer(address, _Handler)
+        self._server.collector = self
+        self.address = self._server.server_address
+        self._threads = []
+
+    def run_file(self, run, filename):
+        check_run_path(run, filename)
+        key = (run, filename)
+        with self._files_lock:
+            try:
+                return self._files[key]
+            except KeyError:
+                path = os.path.join(self.logdir, run, filename)
+                run_file = self._files[key] = _RunFile(path, self.buffer_size)
+                return run_file
+
+    def flush(self):
+        with self._files_lock:
+            files = list(self._files.values())
+        for run_file in files:
+            run_file.flush()
+
+    def _flush_loop(self):
+        while not self._stopped.wait(self.flush_secs):
+            self.flush()
+
+    def serve_forever(self):
+        flusher = threading.Thread(target=self._flush_loop)
+        flusher.daemon = True
+        flusher.start()
+        self._threads.append(flusher)
+        self._server.serve_forever()
+
+    def start(self):
+        """ Serve in a background thread.
+        """
+        thread = threading.Thread(target=self.serve_forever)
+        thread.daemon = True
+        thread.start()
+        self._threads.append(thread)
+
+    def shutdown(self):
+        """ Stop serving, flush and close all run files.
+        """
+        self._stopped.set()
+        self._server.shutdown()
+        self._server.server_close()
+        for thread in self._threads:
+            thread.join()
+        with self._files_lock:
+            for run_file in self._files.values():
+                run_file.close()
+            self._files.clear()
+        if not isinstance(self.address, tuple):
+            os.unlink(self.address)
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description='Collect events from RemoteLogger clients')
+    parser.add_argument('--logdir', required=True,
+                        help='root directory to write runs into')
+    parser.add_argument('--host', default='127.0.0.1')
+    parser.add_argument('--port', type=int, default=6007)
+    parser.add_argument('--unix', help='listen on this Unix socket path '
+                                       'instead of TCP')
+    parser.add_argument('--flush-secs', type=float, default=2)
+    parser.add_argument('--buffer-size', type=int, default=1 << 20)
+    args = parser.parse_args()
+    address = args.unix or (args.host, args.port)
+    collector = Collector(args.logdir, address, flush_secs=args.flush_secs,
+                          buffer_size=args.buffer_size)
+    try:
+        collector.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        collector.shutdown()
+
+
+if __name__ == '__main__':
+    main()
@@ -1,5 +1,11 @@
 import array
 
+try:
+    # Optional C implementation, much faster than the pure Python one below
+    from google_crc32c import value as _native_crc32c
+except ImportError:
+    _native_crc32c = None
+
 
 CRC_TABLE = (
     0x00000000, 0xf26b8303, 0xe13b70f7, 0x1350f3f4,
@@ -120,4 +126,6 @@ def crc32c(data):
     Returns:
       32-bit CRC-32C checksum of data as long.
     """
+    if _native_crc32c is not None and isinstance(data, bytes):
+        return _native_crc32c(data)
     return crc_finalize(crc_update(CRC_INIT, data))
@@ -0,0 +1,171 @@
+# -*- coding: utf-8 -*-
+""" Downsampling of long scalar series to a fixed number of points
+that keep their visual shape, in O(n) NumPy time:
+
+* "lttb": Largest-Triangle-Three-Buckets: one point per bucket, the one
+  forming the largest triangle with the point selected in the previous
+  bucket and the average of the next bucket;
+* "min_max": the minimum and maximum of each bucket;
+* "stride": evenly spaced points.
+
+The first and last points are always kept.
+"""
+import re
+import threading
+
+import numpy as np
+
+
+METHODS = ('lttb', 'min_max', 'stride')
+
+
+def downsample(x, y, n_points, method='lttb'):
+    """ Return (x, y) with at most n_points points.
+
+    Example:
+        >>> x = np.arange(10)
+        >>> y = np.array([0, 0, 9, 0, 0, 0, 0, -9, 0, 0])
+        >>> downsample(x, y, 4)
+        (array([0, 2, 7, 9]), array([ 0,  9, -9,  0]))
+    """
+    indices = downsample_indices(x, y, n_points, method=method)
+    return np.asarray(x)[indices], np.asarray(y)[indices]
+
+
+def downsample_indices(x, y, n_points, method='lttb'):
+    """ Return sorted indices of at most n_points points to keep.
+    """
+    if method not in METHODS:
+        raise ValueError('unknown downsampling method "{}", expected one of {}'
+                         .format(method, ', '.join(METHODS)))
+    if n_points < 2:
+        raise ValueError('n_points should be at least 2')
+    n = len(y)
+    if n <= n_points:
+        return np.arange(n)
+    if n_points == 2 or (method == 'min_max' and n_points < 4):
+        return np.array([0, n - 1])
+    if method == 'stride':
+        return np.unique(np.round(
+            np.linspace(0, n - 1, n_points)).astype(np.intp))
+    x = np.asarray(x, dtype=np.float64)
+    y = np.asarray(y, dtype=np.float64)
+    if method == 'lttb':
+        return lttb_indices(x, y, n_points)
+    return min_max_indices(y, n_points)
+
+
+def _bucket_starts(n, n_buckets):
+    """ Start indices of n_buckets buckets splitting points 1 .. n - 2
+    (first and last points are kept separately), followed by n - 1.
+    """
+    return np.linspace(1, n - 1, n_buckets + 1).astype(np.intp)
+
+
+def lttb_indices(x, y, n_points):
+    """ Largest-Triangle-Three-Buckets. The selected point of each bucket
+    depends on the previous bucket, so buckets are visited in order,
+    but the work within each bucket is vectorized.
+    """
+    n = len(y)
+    starts = _bucket_starts(n, n_points - 2)
+    # Average point of each bucket, and of the last point after them
+    counts = np.diff(starts)
+    avg_x = np.append(np.add.reduceat(x, starts[:-1]) / counts, x[-1])
+    avg_y = np.append(np.add.reduceat(y, starts[:-1]) / counts, y[-1])
+    indices = np.empty(n_points, dtype=np.intp)
+    indices[0] = a = 0
+    for i in range(n_points - 2):
+        start, end = starts[i], starts[i + 1]
+        bx, by = x[start:end], y[start:end]
+        ax, ay = x[a], y[a]
+        # Twice the triangle area, sign does not matter
+        area = np.abs((ax - avg_x[i + 1]) * (by - ay) -
+                      (ax - bx) * (avg_y[i + 1] - ay))
+        a = indices[i + 1] = start + int(np.argmax(area))
+    indices[-1] = n - 1
+    return indices
+
+
+def min_max_indices(y, n_points):
+    """ Minimum and maximum of (n_points - 2) // 2 buckets, plus the first
+    and last points. Buckets with NaNs only are skipped.
+    """
+    n = len(y)
+    starts = _bucket_starts(n, (n_points - 2) // 2)
+    inner = y[1:-1]
+    offsets = starts[:-1] - 1
+    bucket = np.repeat(np.arange(len(offsets)), np.diff(starts))
+    selected = [[0], [n - 1]]
+    for reduce in [np.fmin, np.fmax]:
+        extremes = reduce.reduceat(inner, offsets)
+        # First index in each bucket where the extreme is reached
+        hits = np.flatnonzero(inner == extremes[bucket])
+        first = np.ones(len(hits), dtype=bool)
+        first[1:] = bucket[hits[1:]] != bucket[hits[:-1]]
+        selected.append(hits[first] + 1)
+    return np.unique(np.concatenate(selected))
+
+
+class StreamDownsampler(object):
+    """ Write-time downsampling of scalars for ``Logger(downsample=...)``:
+    values of each tag are kept in memory until there are ``window``
+    of them, and only ``points`` representative points of them are written.
+    Remaining values are written when the logger is closed.
+
+    Args:
+        method (str): "lttb", "min_max" or "stride".
+        window (int): number of values of a tag downsampled at once.
+        points (int): number of points written for each window.
+        tags (str): regular expression matched against tag names:
+            only values of matching tags are downsampled (all by default).
+    """
+    def __init__(self, method='lttb', window=1000, points=100, tags=None):
+        if method not in METHODS:
+            raise ValueError('unknown downsampling method "{}", expected '
+                             'one of {}'.format(method, ', '.join(METHODS)))
+        if not 2 <= points <= window:
+            raise ValueError('points should be between 2 and window')
+        self.method = method
+        self.window = window
+        self.points = points
+        self.tags = None if tags is None else re.compile(tags)
+        self._series = {}  # tf_name -> list of (step, value, wall_time)
+        self._lock = threading.Lock()
+
+    def matches(self, tf_name):
+        return self.tags is None or self.tags.search(tf_name) is not None
+
+    def add(self, tf_name, step, value, wall_time):
+        """ Add a value, return (step, value, wall_time) points to write
+        when a window is complete, else an empty list.
+        """
+        with self._lock:
+            series = self._series.setdefault(tf_name, [])
+            series.append((step, value, wall_time))
+            if len(series) < self.window:
+                return []
+            del self._series[tf_name]
+        return self._select(series)
+
+    def clear(self):
+        """ Forget values of incomplete windows, in a forked child process
+        (the parent process writes them).
+        """
+        self._series = {}
+        self._lock = threading.Lock()
+
+    def pop_all(self):
+        """ Return (tf_name, points) for all incomplete windows.
+        """
+        with self._lock:
+            series, self._series = self._series, {}
+        return [(tf_name, self._select(points))
+                for tf_name, points in sorted(series.items())]
+
+    def _select(self, series):
+        steps = np.array([step for step, _, _ in series], dtype=np.float64)
+        values = np.array([value for _, value, _ in series], dtype=np.float64)
+        indices = downsample_indices(
+            steps, values, self.points, method=self.method)
+        return [series[i] for i in indices]
@@ -0,0 +1,94 @@
+# -*- coding: utf-8 -*-
+
+
+class AdaptiveFlush(object):
+    """ Adaptive flush schedule for ``Logger(adaptive_flush=...)``.
+
+    Records are written and flushed in batches by a background thread,
+    as soon as ``batch_bytes`` are waiting, or when the oldest waiting
+    record was logged ``interval`` seconds ago. After each flush,
+    an exponential moving average of write and flush latency is updated,
+    and the interval is set so that flushing takes about ``duty_cycle``
+    of the time: on a fast local disk records are written almost
+    immediately, while on a slow network filesystem batches get larger.
+    The interval is capped so that records are visible at most
+    ``max_staleness`` seconds after they are logged (unless a single
+    flush takes longer), and ``batch_bytes`` follows the incoming data
+    rate over one interval.
+
+    Args:
+        max_staleness (float): target maximum delay in seconds between
+            logging a record and having it flushed.
+        min_interval (float): minimum flush interval in seconds.
+        max_interval (float): maximum flush interval in seconds.
+        min_batch (int): minimum batch size in bytes.
+        max_batch (int): maximum batch size in bytes.
+        duty_cycle (float): target fraction of time spent writing.
+        alpha (float): weight of the latest measurement in moving averages.
+
+    Example:
+        >>> flush = AdaptiveFlush(max_staleness=2, min_batch=1024)
+        >>> flush.update(n_bytes=2048, latency=0.3, staleness=0.3, now=10.)
+        >>> flush.interval, flush.batch_bytes
+        (1.7, 1024)
+    """
+    def __init__(self, max_staleness=2., min_interval=0., max_interval=10.,
+                 min_batch=1 << 12, max_batch=1 << 22, duty_cycle=0.1,
+                 alpha=0.2):
+        if not 0 < duty_cycle <= 1:
+            raise ValueError('duty_cycle should be in (0, 1]')
+        self.max_staleness = max_staleness
+        self.min_interval = min_interval
+        self.max_interval = max_interval
+        self.min_batch = min_batch
+        self.max_batch = max_batch
+        self.duty_cycle = duty_cycle
+        self.alpha = alpha
+        self.interval = min_interval
+        self.batch_bytes = min_batch
+        self.latency = None
+        self.rate = None  # incoming bytes per second
+        self.staleness = None
+        self.max_observed_staleness = 0.
+        self.flushes = 0
+        self._updated_at = None
+
+    def update(self, n_bytes, latency, staleness, now):
+        """ Update the schedule after writing and flushing a batch.
+
+        Args:
+            n_bytes (int): batch size.
+            latency (float): seconds spent writing and flushing it.
+            staleness (float): seconds since its oldest record was logged.
+            now (float): current time.
+        """
+        self.flushes += 1
+        self.latency = self._average(self.latency, latency)
+        self.staleness = self._average(self.staleness, staleness)
+        self.max_observed_staleness = max(
+            self.max_observed_staleness, staleness)
+        if self._updated_at is not None and now > self._updated_at:
+            self.rate = self._average(
+                self.rate, n_bytes / (now - self._updated_at))
+        self._updated_at = now
+        interval = min(self.latency / self.duty_cycle, self.max_interval,
+                       self.max_staleness - self.latency)
+        self.interval = max(self.min_interval, interval)
+        batch_bytes = (self.rate or 0.) * self.interval
+        self.batch_bytes = int(
+            max(self.min_batch, min(self.max_batch, batch_bytes)))
+
+    def _average(self, average, value):
+        if average is None:
+            return value
+        return self.alpha * value + (1 - self.alpha) * average
+
+    def stats(self):
+        return {
+            'interval': self.interval,
+            'batch_bytes': self.batch_bytes,
+            'latency': self.latency or 0.,
+            'staleness': self.staleness or 0.,
+            'max_staleness': self.max_observed_staleness,
+            'flushes': self.flushes,
+        }
@@ -0,0 +1,247 @@
+# -*- coding: utf-8 -*-
+""" Integrity check and repair of event files.
+
+Check all event files in some directories (recursively)::
+
+    python -m tensorboard_logger.fsck runs/ --jobs 16
+
+Length and data CRCs of every record are verified. Files are checked
+in parallel by a pool of processes, and each file is memory-mapped,
+so it is not read into memory. The exit status is 1 if any file is damaged.
+
+With ``--repair-dir``, a copy of each damaged file with all its valid
+records is written at the same relative path under this directory.
+After a corrupt record, checking continues from the next offset where
+a record with valid CRCs starts, so records after a damaged region are kept.
+"""
+from __future__ import print_function
+
+import argparse
+import mmap
+import multiprocessing
+import os
+import sys
+
+from .reader import _HEADER, _FOOTER, HEADER_SIZE, FOOTER_SIZE, \
+    is_event_file
+from .tensorboard_logger import masked_crc32c
+
+
+def scan_records(buf):
+    """ Yield (offset, length, error) for each record in buf, where error
+    is None for a valid record, or describes why the record at this offset
+    is corrupt. Corrupt regions are skipped up to the next valid record.
+    Bytes after the last valid record that do not form a complete record
+    are reported as a "truncated record".
+
+    Example:
+        >>> from tensorboard_logger.tensorboard_logger import make_record
+        >>> buf = make_record(b'first') + b'garbage' + make_record(b'second')
+        >>> for offset, length, error in scan_records(buf[:-1]):
+        ...     print(offset, length, error)
+        0 5 None
+        21 None length CRC mismatch
+        28 None truncated record
+    """
+    pos = 0
+    end = len(buf)
+    while pos < end:
+        length, error = _check_record(buf, pos, end)
+        if error is None:
+            yield pos, length, None
+            pos += HEADER_SIZE + length + FOOTER_SIZE
+            continue
+        next_pos, truncated_pos = _resync(buf, pos + 1, end)
+        if truncated_pos is not None and error != 'truncated record':
+            # A crashed writer leaves a truncated record at the end,
+            # report it as such after the corrupt region before it.
+            yield pos, None, error
+            pos, error = truncated_pos, 'truncated record'
+        yield pos, None, error
+        if next_pos is None:
+            return
+        pos = next_pos
+
+
+def _check_record(buf, pos, end):
+    if pos + HEADER_SIZE > end:
+        return None, 'truncated record'
+    length, length_crc = _HEADER.unpack_from(buf, pos)
+    if length_crc != masked_crc32c(buf[pos:pos + 8]):
+        return None, 'length CRC mismatch'
+    data_end = pos + HEADER_SIZE + length
+    if data_end + FOOTER_SIZE > end:
+        return None, 'truncated record'
+    data_crc, = _FOOTER.unpack_from(buf, data_end)
+    if data_crc != masked_crc32c(buf[pos + HEADER_SIZE:data_end]):
+        return None, 'data CRC mismatch'
+    return length, None
+
+
+def _resync(buf, pos, end):
+    """ Return (offset of the first valid record at or after pos, None),
+    or if there is none, (None, offset of the first valid header
+    of a record cut by the end of buf, or None).
+    """
+    truncated_pos = None
+    while pos + HEADER_SIZE <= end:
+        length, length_crc = _HEADER.unpack_from(buf, pos)
+        if not length and not length_crc:
+            pass  # zero-filled region, such a header is never valid
+        elif pos + HEADER_SIZE + length + FOOTER_SIZE > end:
+            if truncated_pos is None and \
+                    length_crc == masked_crc32c(buf[pos:pos + 8]):
+                truncated_pos = pos
+        elif _check_record(buf, pos, end)[1] is None:
+            return pos, None
+        pos += 1
+    return None, truncated_pos
+
+
+def check_file(path, repair_path=None):
+    """ Check all records of an event file. Return a dict with
+    the file "path", its "size", number of valid "records", and "errors":
+    a list of (offset, message) for each corrupt region.
+
+    Args:
+        path (str): event file path.
+        repair_path (str): if the file is damaged, write its valid
+            records to this path, which must not be the checked file.
+    """
+    if repair_path is not None and os.path.exists(repair_path) and \
+            os.path.samefile(path, repair_path):
+        raise ValueError('can not repair {} in place'.format(path))
+    report = {'path': path, 'size': 0, 'records': 0, 'errors': []}
+    with open(path, 'rb') as f:
+        size = report['size'] = os.fstat(f.fileno()).st_size
+        if size == 0:
+            return report  # mmap can't map empty files
+        buf = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        try:
+            valid = []
+            for offset, length, error in scan_records(buf):
+                if error is None:
+                    valid.append((offset, length))
+                else:
+                    report['errors'].append((offset, error))
+            report['records'] = len(valid)
+            if report['errors'] and repair_path is not None:
+                _write_records(buf, valid, repair_path)
+                report['repair_path'] = repair_path
+        finally:
+            buf.close()
+    return report
+
+
+def _write_records(buf, records, path):
+    """ Write records to a temporary file renamed to path when complete,
+    so that a file being read is never truncated.
+    """
+    dirname = os.path.dirname(path)
+    if dirname and not os.path.exists(dirname):
+        os.makedirs(dirname)
+    tmp_path = '{}.tmp{}'.format(path, os.getpid())
+    try:
+        with open(tmp_path, 'wb') as f:
+            for offset, length in records:
+                f.write(
+                    buf[offset:offset + HEADER_SIZE + length + FOOTER_SIZE])
+        os.replace(tmp_path, path)
+    except BaseException:
+        if os.path.exists(tmp_path):
+            os.unlink(tmp_path)
+        raise
+
+
+def find_event_files(paths):
+    """ Return (path, relative path) for event files among paths
+    and in directories among paths, recursively.
+    """
+    found = []
+    for root in paths:
+        if not os.path.isdir(root):
+            found.append((root, os.path.basename(root)))
+            continue
+        for dirpath, _, filenames in os.walk(root):
+            for filename in filenames:
+                if is_event_file(filename):
+                    path = os.path.join(dirpath, filename)
+                    found.append((path, os.path.relpath(path, root)))
+    return found
+
+
+def fsck(paths, jobs=None, repair_dir=None):
+    """ Check all event files in paths (files or directories)
+    with a pool of ``jobs`` processes (by default, one per CPU),
+    yielding reports of ``check_file`` as they are ready.
+    """
+    tasks = []
+    for path, rel_path in find_event_files(paths):
+        repair_path = None
+        if repair_dir is not None:
+            repair_path = os.path.join(repair_dir, rel_path)
+        tasks.append((path, repair_path))
+    # Largest files first, not to end waiting for one large file
+    tasks.sort(key=lambda task: -_getsize(task[0]))
+    if jobs == 1 or len(tasks) <= 1:
+        for task in tasks:
+            yield _check_task(task)
+        return
+    pool = multiprocessing.Pool(jobs)
+    try:
+        for report in pool.imap_unordered(_check_task, tasks):
+            yield report
+    finally:
+        pool.terminate()
+        pool.join()
+
+
+def _check_task(task):
+    path, repair_path = task
+    try:
+        return check_file(path, repair_path)
+    except (IOError, OSError, ValueError) as e:
+        return {'path': path, 'size': 0, 'records': 0,
+                'errors': [(0, str(e))]}
+
+
+def _getsize(path):
+    try:
+        return os.path.getsize(path)
+    except OSError:
+        return 0
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(
+        description='Check (and repair) event files')
+    parser.add_argument('paths', nargs='+',
+                        help='event files or directories to check')
+    parser.add_argument('--jobs', '-j', type=int,
+                        help='number of processes (default: number of CPUs)')
+    parser.add_argument('--repair-dir',
+                        help='write copies of damaged files with all their '
+                             'valid records into this directory')
+    args = parser.parse_args(argv)
+    n_files = n_records = n_bytes = n_damaged = 0
+    for report in fsck(args.paths, jobs=args.jobs,
+                       repair_dir=args.repair_dir):
+        n_files += 1
+        n_records += report['records']
+        n_bytes += report['size']
+        if report['errors']:
+            n_damaged += 1
+            for offset, error in report['errors']:
+                print('{}: {} at offset {}'.format(
+                    report['path'], error, offset))
+            if 'repair_path' in report:
+                print('{}: {} valid records written to {}'.format(
+                    report['path'], report['records'],
+                    report['repair_path']))
+    print('{} files, {} records, {} bytes checked, {} damaged'.format(
+        n_files, n_records, n_bytes, n_damaged))
+    return 1 if n_damaged else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
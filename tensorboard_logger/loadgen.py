@@ -0,0 +1,391 @@
+# -*- coding: utf-8 -*-
+""" Load generator for benchmarking and soak testing the logger.
+
+Log ``--tags`` tags for ``--steps`` steps from ``--threads`` threads in each
+of ``--processes`` processes, with a mix of scalars, histograms and images::
+
+    python -m tensorboard_logger.loadgen --logdir /tmp/load \\
+        --tags 200 --steps 1000 --threads 4 --processes 2 \\
+        --mix scalar=0.9,histogram=0.08,image=0.02
+
+and report throughput, latency percentiles per call type, RSS of all
+processes over time and bytes written. With ``--api module``, the
+module-level ``configure`` and ``log_*`` functions are used instead of
+``Logger`` instances.
+
+Replay an existing event file through the logger, checking that
+the output has the same values (wall times are not compared)::
+
+    python -m tensorboard_logger.loadgen --logdir /tmp/replay \\
+        --replay runs/run-1234/events.out.tfevents.1500000000.host
+"""
+from __future__ import print_function
+
+import argparse
+import json
+import multiprocessing
+import os
+import sys
+import threading
+import time
+
+import numpy as np
+import six
+
+from . import tensorboard_logger as tl
+from .reader import is_event_file, read_events
+from .stats import RESERVED_PREFIX, perf_counter
+from .tensorboard_logger import Logger, summary_pb2
+
+
+KINDS = ('scalar', 'histogram', 'image')
+
+PERCENTILES = (50, 90, 99, 99.9)
+
+
+def parse_mix(mix):
+    """ Parse a workload mix into normalized fractions of each call type.
+
+    Example:
+        >>> sorted(parse_mix('scalar=3,image=1').items())
+        [('histogram', 0.0), ('image', 0.25), ('scalar', 0.75)]
+    """
+    fractions = dict.fromkeys(KINDS, 0.0)
+    for item in mix.split(','):
+        kind, _, fraction = item.partition('=')
+        kind = kind.strip()
+        if kind not in fractions:
+            raise ValueError('unknown call type "{}", expected one of {}'
+                             .format(kind, ', '.join(KINDS)))
+        fractions[kind] = float(fraction)
+    total = sum(fractions.values())
+    if total <= 0:
+        raise ValueError('mix should have a positive fraction')
+    return {kind: fraction / total for kind, fraction in fractions.items()}
+
+
+def tag_kinds(n_tags, mix):
+    """ Assign a call type to each of n_tags tags according to the mix.
+
+    Example:
+        >>> tag_kinds(4, {'scalar': 0.75, 'histogram': 0.25, 'image': 0.0})
+        ['scalar', 'scalar', 'scalar', 'histogram']
+    """
+    kinds = []
+    cumulative = 0.0
+    for kind in KINDS:
+        cumulative += mix.get(kind, 0.0)
+        kinds.extend([kind] * (int(round(cumulative * n_tags)) - len(kinds)))
+    return kinds[:n_tags]
+
+
+def rss_bytes(pid=None):
+    """ Resident set size of a process in bytes, read from /proc,
+    or peak RSS of this process if /proc is not available.
+    """
+    try:
+        with open('/proc/{}/statm'.format(pid or 'self')) as f:
+            return int(f.read().split()[1]) * os.sysconf('SC_PAGE_SIZE')
+    except (IOError, OSError, ValueError):
+        if pid is not None and pid != os.getpid():
+            return 0
+        import resource
+        # ru_maxrss is in kilobytes on Linux
+        return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss * 1024
+
+
+class RSSSampler(object):
+    """ Sample total RSS of this process and given child processes
+    every interval seconds in a background thread.
+    """
+    def __init__(self, interval=0.5, pids=()):
+        self.interval = interval
+        self.pids = list(pids)
+        self.samples = []  # (seconds since start, bytes)
+        self._stopped = threading.Event()
+        self._started_at = time.time()
+        self._thread = threading.Thread(target=self._run)
+        self._thread.daemon = True
+
+    def start(self):
+        self._started_at = time.time()
+        self._thread.start()
+        return self
+
+    def stop(self):
+        self._stopped.set()
+        self._thread.join()
+        self._sample()
+
+    def _sample(self):
+        total = rss_bytes() + sum(rss_bytes(pid) for pid in self.pids)
+        self.samples.append((time.time() - self._started_at, total))
+
+    def _run(self):
+        self._sample()
+        while not self._stopped.wait(self.interval):
+            self._sample()
+
+
+def run_worker(logdir, n_tags, n_steps, n_threads, mix, api='logger',
+               hist_size=1000, image_size=32, seed=0, logger_kwargs=None):
+    """ Log the workload from n_threads threads into logdir,
+    return a dict with call latencies in seconds for each call type.
+    """
+    kinds = tag_kinds(n_tags, mix)
+    rng = np.random.RandomState(seed)
+    data = {
+        'scalar': rng.rand(n_steps),
+        'histogram': rng.normal(size=hist_size),
+        'image': rng.rand(1, image_size, image_size).astype(np.float32),
+    }
+    if api == 'module':
+        tl.configure(logdir)
+        logger = tl
+    else:
+        logger = Logger(logdir, **(logger_kwargs or {}))
+    log = {'scalar': logger.log_value, 'histogram': logger.log_histogram,
+           'image': logger.log_images}
+    latencies = [{kind: [] for kind in KINDS} for _ in range(n_threads)]
+
+    def log_tags(thread_idx):
+        thread_latencies = latencies[thread_idx]
+        tags = [('load/{}/{}'.format(kind, i), kind, log[kind],
+                 thread_latencies[kind])
+                for i, kind in enumerate(kinds) if i % n_threads == thread_idx]
+        for step in range(n_steps):
+            scalar = data['scalar'][step]
+            for name, kind, log_fn, times in tags:
+                value = scalar if kind == 'scalar' else data[kind]
+                t0 = perf_counter()
+                log_fn(name, value, step)
+                times.append(perf_counter() - t0)
+
+    threads = [threading.Thread(target=log_tags, args=(i,))
+               for i in range(n_threads)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    if api == 'module':
+        tl._default_logger.close()
+        tl.unconfigure()
+    else:
+        logger.close()
+    return {kind: np.concatenate([np.asarray(thread_latencies[kind])
+                                  for thread_latencies in latencies])
+            for kind in KINDS}
+
+
+def _process_worker(results, idx, kwargs):
+    try:
+        results.put((idx, run_worker(**kwargs)))
+    except Exception as e:
+        results.put((idx, e))
+        raise
+
+
+def run_load(logdir, n_tags=100, n_steps=100, n_threads=1, n_processes=1,
+             mix='scalar=1', api='logger', rss_secs=0.5, **kwargs):
+    """ Run the workload and return a report dict, see ``format_report``.
+    Each process writes into its own "proc-<i>" subdirectory of logdir.
+    """
+    if isinstance(mix, six.string_types):
+        mix = parse_mix(mix)
+    worker_kwargs = [
+        dict(kwargs, logdir=os.path.join(logdir, 'proc-{}'.format(i)),
+             n_tags=n_tags, n_steps=n_steps, n_threads=n_threads, mix=mix,
+             api=api, seed=i)
+        for i in range(n_processes)]
+    t0 = time.time()
+    if n_processes == 1:
+        sampler = RSSSampler(rss_secs).start()
+        results = [run_worker(**worker_kwargs[0])]
+    else:
+        queue = multiprocessing.Queue()
+        processes = [multiprocessing.Process(
+                        target=_process_worker, args=(queue, i, kw))
+                     for i, kw in enumerate(worker_kwargs)]
+        for process in processes:
+            process.daemon = True
+            process.start()
+        sampler = RSSSampler(rss_secs, [p.pid for p in processes]).start()
+        results = [None] * n_processes
+        for _ in processes:
+            idx, result = queue.get()
+            if isinstance(result, Exception):
+                raise result
+            results[idx] = result
+        for process in processes:
+            process.join()
+    elapsed = time.time() - t0
+    sampler.stop()
+    latencies = {kind: np.concatenate([r[kind] for r in results])
+                 for kind in KINDS}
+    n_calls = sum(len(lat) for lat in latencies.values())
+    n_bytes = disk_usage(logdir)
+    return {
+        'calls': n_calls,
+        'seconds': elapsed,
+        'calls_per_sec': n_calls / elapsed if elapsed else 0.0,
+        'bytes': n_bytes,
+        'bytes_per_sec': n_bytes / elapsed if elapsed else 0.0,
+        'latency': {kind: latency_stats(lat)
+                    for kind, lat in latencies.items() if len(lat)},
+        'rss': sampler.samples,
+    }
+
+
+def latency_stats(latencies):
+    """ Count, mean, max and percentiles of call latencies, in seconds.
+
+    Example:
+        >>> stats = latency_stats(np.arange(1, 101) / 1000.)
+        >>> stats['count'], stats['p50'], stats['max']
+        (100, 0.0505, 0.1)
+    """
+    latencies = np.asarray(latencies, dtype=np.float64)
+    stats = {'count': int(latencies.size),
+             'mean': float(latencies.mean()),
+             'max': float(latencies.max())}
+    for p, value in zip(PERCENTILES, np.percentile(latencies, PERCENTILES)):
+        stats['p{:g}'.format(p)] = round(float(value), 9)
+    return stats
+
+
+def disk_usage(logdir):
+    return sum(os.path.getsize(os.path.join(dirpath, filename))
+               for dirpath, _, filenames in os.walk(logdir)
+               for filename in filenames)
+
+
+def replay(path, logdir, **logger_kwargs):
+    """ Log all values from an event file with a new ``Logger`` in logdir:
+    single scalars with ``log_value``, other single values are logged
+    unchanged, and events with several values or with reserved tags
+    (logger stats and resources) are written unchanged as whole events.
+    Return (report, path of the new event file).
+    """
+    events = [event for event in read_events(path)
+              if event.HasField('summary')]
+    existing = set(os.listdir(logdir)) if os.path.isdir(logdir) else set()
+    logger = Logger(logdir, **logger_kwargs)
+    latencies = {'scalar': [], 'summary': [], 'event': []}
+    t0 = time.time()
+    for event in events:
+        values = event.summary.value
+        t1 = perf_counter()
+        if len(values) != 1 or values[0].tag.startswith(RESERVED_PREFIX):
+            event.wall_time = logger._time()
+            logger._write_event(event)
+            latencies['event'].append(perf_counter() - t1)
+        elif values[0].HasField('simple_value'):
+            logger.log_value(values[0].tag, values[0].simple_value, event.step)
+            latencies['scalar'].append(perf_counter() - t1)
+        else:
+            tf_name = logger._ensure_tf_name(values[0].tag, 'summaries')
+            logger._log(tf_name, _copy_summary, values[0], event.step)
+            latencies['summary'].append(perf_counter() - t1)
+    logger.close()
+    elapsed = time.time() - t0
+    n_calls = sum(len(lat) for lat in latencies.values())
+    n_bytes = disk_usage(logdir)
+    report = {
+        'calls': n_calls,
+        'seconds': elapsed,
+        'calls_per_sec': n_calls / elapsed if elapsed else 0.0,
+        'bytes': n_bytes,
+        'bytes_per_sec': n_bytes / elapsed if elapsed else 0.0,
+        'latency': {kind: latency_stats(lat)
+                    for kind, lat in latencies.items() if lat},
+    }
+    filename, = [f for f in os.listdir(logdir)
+                 if is_event_file(f) and f not in existing]
+    return report, os.path.join(logdir, filename)
+
+
+def _copy_summary(tf_name, value, step=None):
+    summary = summary_pb2.Summary()
+    summary.value.add().CopyFrom(value)
+    summary.value[0].tag = tf_name
+    return summary
+
+
+def compare_events(expected_path, actual_path):
+    """ Return the number of events with a summary that differ between
+    two event files, ignoring wall times.
+    """
+    def summaries(path):
+        return [(event.step,
+                 event.summary.SerializeToString(deterministic=True))
+                for event in read_events(path) if event.HasField('summary')]
+    expected, actual = summaries(expected_path), summaries(actual_path)
+    n_different = sum(e != a for e, a in zip(expected, actual))
+    return n_different + abs(len(expected) - len(actual))
+
+
+def format_report(report):
+    lines = ['{calls} calls in {seconds:.2f} s: {calls_per_sec:.0f} calls/s, '
+             '{bytes} bytes written ({mb_per_sec:.2f} MB/s)'.format(
+                 mb_per_sec=report['bytes_per_sec'] / 2**20, **report)]
+    for kind, stats in sorted(report['latency'].items()):
+        lines.append('{:<10} n={:<8} mean={:.1f}us {} max={:.1f}us'.format(
+            kind, stats['count'], stats['mean'] * 1e6,
+            ' '.join('p{:g}={:.1f}us'.format(p, stats['p{:g}'.format(p)] * 1e6)
+                     for p in PERCENTILES),
+            stats['max'] * 1e6))
+    if report.get('rss'):
+        lines.append('RSS MB: ' + ' '.join(
+            '{:.1f}s={:.1f}'.format(t, rss / 2**20)
+            for t, rss in report['rss']))
+    return '\n'.join(lines)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(
+        description='Benchmark the logger with a synthetic workload '
+                    'or by replaying an event file')
+    parser.add_argument('--logdir', required=True,
+                        help='directory to write events into')
+    parser.add_argument('--tags', type=int, default=100)
+    parser.add_argument('--steps', type=int, default=100)
+    parser.add_argument('--threads', type=int, default=1)
+    parser.add_argument('--processes', type=int, default=1)
+    parser.add_argument('--mix', default='scalar=1',
+                        help='fractions of call types, '
+                             'e.g. "scalar=0.9,histogram=0.08,image=0.02"')
+    parser.add_argument('--api', choices=['logger', 'module'],
+                        default='logger')
+    parser.add_argument('--hist-size', type=int, default=1000,
+                        help='number of values in each histogram')
+    parser.add_argument('--image-size', type=int, default=32)
+    parser.add_argument('--rss-secs', type=float, default=0.5,
+                        help='RSS sampling interval')
+    parser.add_argument('--replay', help='replay this event file instead '
+                                         'of a synthetic workload')
+    parser.add_argument('--json', action='store_true',
+                        help='print the report as JSON')
+    args = parser.parse_args(argv)
+    status = 0
+    if args.replay:
+        report, output = replay(args.replay, args.logdir)
+        report['different_values'] = compare_events(args.replay, output)
+        status = 1 if report['different_values'] else 0
+    else:
+        report = run_load(
+            args.logdir, n_tags=args.tags, n_steps=args.steps,
+            n_threads=args.threads, n_processes=args.processes,
+            mix=args.mix, api=args.api, rss_secs=args.rss_secs,
+            hist_size=args.hist_size, image_size=args.image_size)
+    if args.json:
+        print(json.dumps(report, indent=2, sort_keys=True))
+    else:
+        print(format_report(report))
+        if args.replay:
+            print('{} values differ from {}'.format(
+                report['different_values'], args.replay))
+    return status
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,199 @@
+# -*- coding: utf-8 -*-
+from collections import deque
+import threading
+import time
+
+
+OVERLOAD_POLICIES = ('block', 'drop_newest', 'drop_oldest', 'drop_large')
+
+
+class RecordQueue(object):
+    """ Queue of encoded records waiting to be written, holding at most
+    ``max_bytes`` bytes and ``max_records`` records (None for no limit),
+    including records being written. What happens to a record which
+    does not fit depends on the overload policy:
+
+    * "block": wait until it fits, for at most ``timeout`` seconds
+      (None to wait forever), then drop it;
+    * "drop_newest": drop it;
+    * "drop_oldest": drop the oldest queued records to make room;
+    * "drop_large": drop queued non-scalar records (images, histograms,
+      tensors), oldest first, to make room. Only a scalar record can make
+      room by dropping older scalars, so scalars keep being written while
+      a backlog of large records is dropped.
+
+    A batch being written holds at most half of the budget, so that
+    queued records can always be replaced while writing is stalled.
+    Records put with ``keep=True`` (the first records of a file)
+    are never dropped, and are queued even when the budget is full.
+
+    Example:
+        >>> queue = RecordQueue(max_records=2, policy='drop_large')
+        >>> [queue.put(r, scalar) for r, scalar in [
+        ...     (b'image', False), (b'scalar', True), (b'scalar2', True)]]
+        [True, True, True]
+        >>> queue.get_batch(block=False), queue.stats()['dropped']
+        ([b'scalar'], 1)
+    """
+    def __init__(self, max_bytes=None, max_records=None, policy='block',
+                 timeout=None):
+        if policy not in OVERLOAD_POLICIES:
+            raise ValueError('unknown overload policy "{}", expected one of {}'
+                             .format(policy, ', '.join(OVERLOAD_POLICIES)))
+        self.max_bytes = max_bytes
+        self.max_records = max_records
+        self.policy = policy
+        self.timeout = timeout
+        self._queue = deque()  # (record, scalar, time queued, keep) tuples
+        self._bytes = 0  # of queued records and records being written
+        self._records = 0
+        self._queued_bytes = 0
+        # When the oldest record of the last batch was queued
+        self.batch_queued_at = None
+        self._closed = False
+        self._cond = threading.Condition()
+        self.dropped = 0
+        self.dropped_bytes = 0
+        self.dropped_scalars = 0
+
+    def put(self, record, scalar=True, keep=False):
+        """ Queue a record, return False if it was dropped.
+        """
+        with self._cond:
+            if self._closed:
+                raise ValueError('write to closed Logger')
+            if not keep and not self._fits(len(record)):
+                if self.policy == 'block':
+                    self._wait_for_room(len(record))
+                elif self.policy == 'drop_oldest':
+                    self._drop_queued(len(record), lambda s: True)
+                elif self.policy == 'drop_large':
+                    self._drop_queued(len(record), lambda s: not s)
+                    if scalar:
+                        self._drop_queued(len(record), lambda s: True)
+                if not self._fits(len(record)):
+                    self._count_dropped(record, scalar)
+                    return False
+            self._queue.append((record, scalar, time.time(), keep))
+            self._bytes += len(record)
+            self._queued_bytes += len(record)
+            self._records += 1
+            self._cond.notify_all()
+            return True
+
+    def has_room(self, n_bytes):
+        """ Return True if a record of n_bytes fits without applying
+        the overload policy.
+        """
+        with self._cond:
+            return self._fits(n_bytes)
+
+    def get_batch(self, block=True, min_bytes=None, max_wait=None):
+        """ Take queued records to write, waiting for some if block is True.
+        With min_bytes and max_wait, also wait until at least min_bytes are
+        queued, or the oldest record was queued max_wait seconds ago.
+        Return None when the queue is closed and empty.
+        Their space is freed when ``done`` is called after writing them.
+        """
+        with self._cond:
+            while block and not self._queue and not self._closed:
+                self._cond.wait()
+            if block and self._queue and max_wait is not None:
+                deadline = self._queue[0][2] + max_wait
+                # Write early when the budget is full
+                while not self._closed and self._fits(1) and (
+                        min_bytes is None or self._queued_bytes < min_bytes):
+                    timeout = deadline - time.time()
+                    if timeout <= 0:
+                        break
+                    self._cond.wait(timeout)
+            if not self._queue:
+                return None if self._closed else []
+            self.batch_queued_at = self._queue[0][2]
+            max_bytes = None if self.max_bytes is None else self.max_bytes // 2
+            max_records = (None if self.max_records is None
+                           else self.max_records // 2)
+            batch = []
+            n_bytes = 0
+            while self._queue:
+                record = self._queue[0][0]
+                if batch and (
+                        (max_bytes is not None and
+                         n_bytes + len(record) > max_bytes) or
+                        (max_records is not None and
+                         len(batch) >= max_records)):
+                    break
+                self._queue.popleft()
+                batch.append(record)
+                n_bytes += len(record)
+            self._queued_bytes -= n_bytes
+            return batch
+
+    def done(self, batch):
+        with self._cond:
+            self._bytes -= sum(len(record) for record in batch)
+            self._records -= len(batch)
+            self._cond.notify_all()
+
+    def close(self):
+        """ Refuse new records and wake up all waiting threads.
+        Queued records can still be taken with ``get_batch``.
+        """
+        with self._cond:
+            self._closed = True
+            self._cond.notify_all()
+
+    def stats(self):
+        with self._cond:
+            return {
+                'queue_depth': self._records,
+                'queue_bytes': self._bytes,
+                'dropped': self.dropped,
+                'dropped_bytes': self.dropped_bytes,
+                'dropped_scalars': self.dropped_scalars,
+            }
+
+    def __len__(self):
+        return len(self._queue)
+
+    def _fits(self, n_bytes):
+        return ((self.max_bytes is None or
+                 self._bytes + n_bytes <= self.max_bytes or
+                 not self._records) and
+                (self.max_records is None or
+                 self._records < self.max_records))
+
+    def _wait_for_room(self, n_bytes):
+        deadline = None if self.timeout is None else time.time() + self.timeout
+        while not self._fits(n_bytes) and not self._closed:
+            if deadline is None:
+                self._cond.wait()
+            else:
+                timeout = deadline - time.time()
+                if timeout <= 0:
+                    break
+                self._cond.wait(timeout)
+
+    def _drop_queued(self, n_bytes, can_drop):
+        """ Drop oldest queued records for which can_drop(scalar) is true
+        until a record of n_bytes fits.
+        """
+        kept = deque()
+        while self._queue and not self._fits(n_bytes):
+            entry = self._queue.popleft()
+            record, scalar, _, keep = entry
+            if not keep and can_drop(scalar):
+                self._bytes -= len(record)
+                self._queued_bytes -= len(record)
+                self._records -= 1
+                self._count_dropped(record, scalar)
+            else:
+                kept.append(entry)
+        kept.extend(self._queue)
+        self._queue = kept
+
+    def _count_dropped(self, record, scalar):
+        self.dropped += 1
+        self.dropped_bytes += len(record)
+        if scalar:
+            self.dropped_scalars += 1
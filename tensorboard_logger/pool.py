@@ -0,0 +1,147 @@
+# -*- coding: utf-8 -*-
+from collections import OrderedDict
+import os
+import threading
+
+
+class WriterPool(object):
+    """ Shared pool multiplexing event files of many loggers over a bounded
+    number of open file handles, for processes running hundreds of
+    ``Logger`` instances (e.g. hyperparameter sweeps)::
+
+        pool = WriterPool(max_open=32)
+        loggers = [Logger('runs/trial-{}'.format(i), sink=pool.sink)
+                   for i in range(1000)]
+
+    Each event file gets its own in-memory buffer, written out when it
+    reaches ``buffer_size`` bytes and for all files every ``flush_secs``
+    by a background thread. Least recently used files are closed when more
+    than ``max_open`` are needed, and reopened in append mode on the next
+    write, so each file still gets all its records in order.
+
+    Args:
+        max_open (int): maximum number of open files.
+        buffer_size (int): per-file buffer size in bytes.
+        flush_secs (float): how often all buffers are written out.
+    """
+    def __init__(self, max_open=64, buffer_size=1 << 16, flush_secs=2):
+        if max_open < 1:
+            raise ValueError('max_open should be positive')
+        self.max_open = max_open
+        self.buffer_size = buffer_size
+        self.flush_secs = flush_secs
+        self._lock = threading.RLock()
+        self._open_files = OrderedDict()  # sink -> file, in LRU order
+        self._sinks = set()
+        self._n_opens = 0
+        self._n_evictions = 0
+        self._flusher = None
+        self._stopped = threading.Event()
+
+    def sink(self, path):
+        """ Sink factory, pass it as ``Logger(logdir, sink=pool.sink)``.
+        """
+        sink = PooledFileSink(self, path)
+        dirname = os.path.dirname(path)
+        if dirname and not os.path.exists(dirname):
+            os.makedirs(dirname)
+        with self._lock:
+            self._open(sink, 'wb')
+            self._sinks.add(sink)
+            if self._flusher is None:
+                self._flusher = threading.Thread(target=self._flush_loop)
+                self._flusher.daemon = True
+                self._flusher.start()
+        return sink
+
+    def flush(self):
+        """ Write out buffers of all files and flush them.
+        """
+        with self._lock:
+            for sink in list(self._sinks):
+                self._write_out(sink, flush=True)
+
+    def close(self):
+        """ Close all sinks and stop the background flush thread.
+        """
+        self._stopped.set()
+        with self._lock:
+            for sink in list(self._sinks):
+                sink.close()
+
+    def stats(self):
+        with self._lock:
+            return {
+                'files': len(self._sinks),
+                'open_files': len(self._open_files),
+                'opens': self._n_opens,
+                'evictions': self._n_evictions,
+                'buffered_bytes': sum(len(s.buffer) for s in self._sinks),
+            }
+
+    def _flush_loop(self):
+        while not self._stopped.wait(self.flush_secs):
+            self.flush()
+
+    def _open(self, sink, mode):
+        while len(self._open_files) >= self.max_open:
+            _, lru_file = self._open_files.popitem(last=False)
+            lru_file.close()
+            self._n_evictions += 1
+        f = self._open_files[sink] = open(sink.path, mode)
+        self._n_opens += 1
+        return f
+
+    def _file(self, sink):
+        try:
+            # Re-insert to mark as most recently used
+            f = self._open_files.pop(sink)
+            self._open_files[sink] = f
+            return f
+        except KeyError:
+            return self._open(sink, 'ab')
+
+    def _write_out(self, sink, flush=False):
+        if sink.buffer:
+            f = self._file(sink)
+            f.write(sink.buffer)
+            sink.buffer = bytearray()
+            if flush:
+                f.flush()
+        elif flush and sink in self._open_files:
+            self._open_files[sink].flush()
+
+    def _write(self, sink, data):
+        with self._lock:
+            sink.buffer.extend(data)
+            if len(sink.buffer) >= self.buffer_size:
+                self._write_out(sink)
+
+    def _close(self, sink):
+        with self._lock:
+            if sink not in self._sinks:
+                return
+            self._write_out(sink)
+            f = self._open_files.pop(sink, None)
+            if f is not None:
+                f.close()
+            self._sinks.discard(sink)
+
+
+class PooledFileSink(object):
+    """ Sink writing through a ``WriterPool``, see ``WriterPool.sink``.
+    ``flush()`` does nothing: buffers are written out by the pool.
+    """
+    def __init__(self, pool, path):
+        self.pool = pool
+        self.path = path
+        self.buffer = bytearray()
+
+    def write(self, data):
+        self.pool._write(self, data)
+
+    def flush(self):
+        pass
+
+    def close(self):
+        self.pool._close(self)
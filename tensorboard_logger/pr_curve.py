@@ -0,0 +1,94 @@
+# -*- coding: utf-8 -*-
+import numpy as np
+
+from .arrays import CHUNK_SIZE, as_array
+
+
+PLUGIN_NAME = 'pr_curves'
+
+
+def compute_pr_curve(labels, predictions, num_thresholds=201, weights=None,
+                     chunk_size=CHUNK_SIZE * 16):
+    """ Compute PR curve data in the layout expected by the TensorBoard
+    PR curves plugin: a float32 array of shape (6, num_thresholds) with
+    true positives, false positives, true negatives, false negatives,
+    precision and recall for thresholds evenly spaced from 0 to 1.
+
+    All thresholds are computed in one pass: each prediction is counted
+    in its threshold bucket with ``np.bincount``, and counts for all
+    thresholds are cumulative sums over buckets.
+    Inputs are processed in chunks, so temporary memory does not grow
+    with the number of predictions.
+
+    Args:
+        labels: boolean array-like of ground truth labels.
+        predictions: array-like of probabilities in [0, 1],
+            of the same size as labels.
+        num_thresholds (int): number of thresholds, at least 2.
+        weights: optional array-like of per-example weights.
+
+    Example:
+        >>> data = compute_pr_curve([True, False, True, False],
+        ...                         [0.9, 0.8, 0.3, 0.1], num_thresholds=3)
+        >>> data[:4].tolist()  # tp, fp, tn, fn
+        [[2.0, 1.0, 0.0], [2.0, 1.0, 0.0], [0.0, 1.0, 2.0], [0.0, 1.0, 2.0]]
+    """
+    if num_thresholds < 2:
+        raise ValueError('num_thresholds should be at least 2')
+    labels = as_array(labels).reshape(-1)
+    predictions = as_array(predictions).reshape(-1)
+    if labels.shape != predictions.shape:
+        raise ValueError('labels and predictions should have the same size, '
+                         'got {} and {}'.format(labels.size, predictions.size))
+    if weights is not None:
+        weights = as_array(weights).reshape(-1)
+        if weights.shape != labels.shape:
+            raise ValueError('weights should have the same size as labels')
+    tp_buckets = np.zeros(num_thresholds, dtype=np.float64)
+    fp_buckets = np.zeros(num_thresholds, dtype=np.float64)
+    for start in range(0, labels.size, chunk_size):
+        chunk = slice(start, start + chunk_size)
+        buckets = np.floor(
+            predictions[chunk].astype(np.float64) * (num_thresholds - 1))
+        buckets = np.clip(buckets, 0, num_thresholds - 1).astype(np.intp)
+        true = labels[chunk].astype(bool)
+        if weights is None:
+            positive = np.bincount(
+                buckets[true], minlength=num_thresholds)
+            total = np.bincount(buckets, minlength=num_thresholds)
+        else:
+            chunk_weights = weights[chunk].astype(np.float64)
+            positive = np.bincount(buckets[true], weights=chunk_weights[true],
+                                   minlength=num_thresholds)
+            total = np.bincount(buckets, weights=chunk_weights,
+                                minlength=num_thresholds)
+        tp_buckets += positive
+        fp_buckets += total - positive
+    # Predictions in bucket i are above all thresholds up to i
+    tp = np.cumsum(tp_buckets[::-1])[::-1]
+    fp = np.cumsum(fp_buckets[::-1])[::-1]
+    tn = fp[0] - fp
+    fn = tp[0] - tp
+    precision = tp / np.maximum(1e-7, tp + fp)
+    recall = tp / np.maximum(1e-7, tp + fn)
+    return np.stack([tp, fp, tn, fn, precision, recall]).astype(np.float32)
+
+
+def plugin_content(num_thresholds):
+    """ Serialized PrCurvePluginData proto (version 0) from
+    tensorboard/plugins/pr_curve/plugin_data.proto: it has only
+    two integer fields, so it is encoded here without bundling the proto.
+
+    Example:
+        >>> plugin_content(201)
+        b'\\x10\\xc9\\x01'
+    """
+    content = bytearray(b'\x10')  # field 2 (num_thresholds), varint
+    while True:
+        byte = num_thresholds & 0x7f
+        num_thresholds >>= 7
+        if num_thresholds:
+            content.append(byte | 0x80)
+        else:
+            content.append(byte)
+            return bytes(content)
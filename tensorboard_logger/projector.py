@@ -0,0 +1,162 @@
+# -*- coding: utf-8 -*-
+""" Export of embeddings for the TensorBoard embedding projector.
+
+Each embedding is written as ``<logdir>/<step>/<name>/tensors.tsv``
+(and ``metadata.tsv``), and an entry for it is appended
+to ``<logdir>/projector_config.pbtxt``.
+"""
+import os
+
+import numpy as np
+import six
+
+from .arrays import as_array
+
+
+CONFIG_NAME = 'projector_config.pbtxt'
+
+# The projector becomes slow above this many points
+PROJECTOR_MAX_ROWS = 100000
+
+CHUNK_ROWS = 4096
+
+
+def write_embedding(logdir, tf_name, matrix, metadata=None, step=None,
+                    max_rows=None, sample='random', metadata_header=None,
+                    seed=0, chunk_rows=CHUNK_ROWS):
+    """ Write an embedding matrix, its metadata and projector config.
+
+    The matrix is read and written ``chunk_rows`` rows at a time, so it can
+    be a ``np.memmap`` (or any array-like) much larger than memory.
+
+    Args:
+        logdir (str): log directory, where TensorBoard will find the config.
+        tf_name (str): valid tensorflow name of the embedding.
+        matrix: 2d array-like of shape (n_rows, n_dims).
+        metadata: optional labels for each row: a sequence of values,
+            or of tuples of values if there are several columns.
+        step (int): step of the embedding.
+        max_rows (int): if the matrix has more rows, write only a subsample
+            of this many rows (see ``PROJECTOR_MAX_ROWS``).
+        sample (str): "random" for a uniform random subsample, or
+            "stratified" to sample each metadata label (first column)
+            proportionally to its frequency, keeping at least one row
+            of each label.
+        metadata_header (list): column names, required if metadata
+            has several columns (the projector expects no header
+            for a single column).
+        seed (int): random seed for subsampling.
+    """
+    matrix = as_array(matrix)
+    if matrix.ndim != 2:
+        raise ValueError('"matrix" should be 2-dimensional, got shape {}'
+                         .format(matrix.shape))
+    n_rows = matrix.shape[0]
+    if metadata is not None and len(metadata) != n_rows:
+        raise ValueError('"metadata" should have {} rows, got {}'
+                         .format(n_rows, len(metadata)))
+    if metadata is not None and metadata_header is None and n_rows and \
+            isinstance(metadata[0], (tuple, list)):
+        raise ValueError('"metadata_header" is required for metadata '
+                         'with several columns')
+    rows = None
+    if max_rows is not None and n_rows > max_rows:
+        rows = subsample_rows(n_rows, max_rows, sample=sample, seed=seed,
+                              labels=_first_column(metadata))
+
+    step = step or 0
+    rel_dir = os.path.join('{:05d}'.format(step), tf_name)
+    out_dir = os.path.join(logdir, rel_dir)
+    if not os.path.exists(out_dir):
+        os.makedirs(out_dir)
+    with open(os.path.join(out_dir, 'tensors.tsv'), 'wb') as f:
+        for chunk in _iter_chunks(matrix, rows, chunk_rows):
+            np.savetxt(f, chunk, fmt='%.7g', delimiter='\t')
+    config = [
+        'embeddings {',
+        '  tensor_name: "{}:{:05d}"'.format(tf_name, step),
+        '  tensor_path: "{}"'.format(
+            _pbtxt_path(os.path.join(rel_dir, 'tensors.tsv'))),
+    ]
+    if metadata is not None:
+        with open(os.path.join(out_dir, 'metadata.tsv'), 'wb') as f:
+            _write_metadata(f, metadata, rows, metadata_header)
+        config.append('  metadata_path: "{}"'.format(
+            _pbtxt_path(os.path.join(rel_dir, 'metadata.tsv'))))
+    config.append('}\n')
+    # The config is only appended to, so it stays valid if several
+    # loggers or processes write embeddings into the same logdir.
+    with open(os.path.join(logdir, CONFIG_NAME), 'a') as f:
+        f.write('\n'.join(config))
+
+
+def subsample_rows(n_rows, max_rows, sample='random', seed=0, labels=None):
+    """ Return sorted indices of about max_rows rows
+    (with stratified sampling, rare labels can add a few more).
+
+    Example:
+        >>> labels = ['a'] * 90 + ['b'] * 10
+        >>> rows = subsample_rows(100, 10, 'stratified', labels=labels)
+        >>> len(rows), sum(labels[i] == 'b' for i in rows)
+        (10, 1)
+    """
+    rng = np.random.RandomState(seed)
+    if sample == 'random':
+        rows = rng.choice(n_rows, max_rows, replace=False)
+    elif sample == 'stratified':
+        if labels is None:
+            raise ValueError('stratified sampling requires metadata')
+        _, inverse, counts = np.unique(
+            np.asarray(labels), return_inverse=True, return_counts=True)
+        quotas = np.maximum(1, np.floor(counts * max_rows / n_rows))
+        quotas = quotas.astype(np.intp)
+        order = rng.permutation(n_rows)
+        # Rank of each row among rows with the same label, in random order
+        by_label = order[np.argsort(inverse[order], kind='mergesort')]
+        starts = np.concatenate([[0], np.cumsum(counts)[:-1]])
+        ranks = np.empty(n_rows, dtype=np.intp)
+        ranks[by_label] = np.arange(n_rows) - np.repeat(starts, counts)
+        rows = np.flatnonzero(ranks < quotas[inverse.reshape(-1)])
+    else:
+        raise ValueError('unknown sample "{}", expected "random" or '
+                         '"stratified"'.format(sample))
+    rows.sort()
+    return rows
+
+
+def _iter_chunks(matrix, rows, chunk_rows):
+    if rows is None:
+        for start in range(0, matrix.shape[0], chunk_rows):
+            yield matrix[start:start + chunk_rows]
+    else:
+        for start in range(0, len(rows), chunk_rows):
+            yield matrix[rows[start:start + chunk_rows]]
+
+
+def _first_column(metadata):
+    if metadata is None:
+        return None
+    return [row[0] if isinstance(row, (tuple, list)) else row
+            for row in metadata]
+
+
+def _write_metadata(f, metadata, rows, header):
+    if header is not None and len(header) > 1:
+        f.write(_tsv_line(header))
+    indices = range(len(metadata)) if rows is None else rows
+    for i in indices:
+        row = metadata[i]
+        if not isinstance(row, (tuple, list)):
+            row = [row]
+        f.write(_tsv_line(row))
+
+
+def _tsv_line(values):
+    line = u'\t'.join(
+        six.text_type(v).replace(u'\t', u' ').replace(u'\n', u' ')
+        for v in values)
+    return (line + u'\n').encode('utf8')
+
+
+def _pbtxt_path(path):
+    return path.replace(os.sep, '/').replace('\\', '\\\\').replace('"', '\\"')
@@ -0,0 +1,334 @@
+# -*- coding: utf-8 -*-
+""" Reading event files, including files that are still being written.
+
+``EventFileReader`` remembers its byte offset and returns only records
+added since the previous read, and ``LogdirFollower`` does the same for all
+event files in a directory, noticing new files as they appear::
+
+    follower = LogdirFollower('runs/run-1234')
+    for path, event in follower.follow(poll_secs=5):
+        ...
+
+A partial record at the end of a file (length, data or CRC not fully
+written yet) is not an error: it is returned once it is complete.
+"""
+import heapq
+import mmap
+import os
+import re
+import struct
+import time
+
+import six
+
+from .tensorboard_logger import event_pb2, masked_crc32c
+
+
+_HEADER = struct.Struct('<QI')  # length, masked CRC of length
+_FOOTER = struct.Struct('<I')  # masked CRC of data
+HEADER_SIZE = _HEADER.size
+FOOTER_SIZE = _FOOTER.size
+
+READ_SIZE = 1 << 20
+
+
+class CorruptRecordError(ValueError):
+    def __init__(self, path, offset, message):
+        super(CorruptRecordError, self).__init__(
+            '{} at offset {} in {}'.format(message, offset, path))
+        self.path = path
+        self.offset = offset
+
+
+def parse_records(buf, path=None, offset=0, check_crc=True):
+    """ Yield (offset, data) for each complete record in buf,
+    stopping at a partial record at its end.
+    Offsets are relative to the start of buf plus given offset.
+    Raise ``CorruptRecordError`` if a length or data CRC does not match.
+
+    Example:
+        >>> from tensorboard_logger.tensorboard_logger import make_record
+        >>> buf = make_record(b'first') + make_record(b'second')
+        >>> list(parse_records(buf[:-1]))
+        [(0, b'first')]
+    """
+    view = memoryview(buf)
+    pos = 0
+    end = len(buf)
+    while pos + HEADER_SIZE <= end:
+        length, length_crc = _HEADER.unpack_from(buf, pos)
+        if length_crc != masked_crc32c(view[pos:pos + 8].tobytes()):
+            raise CorruptRecordError(
+                path, offset + pos, 'length CRC mismatch')
+        data_end = pos + HEADER_SIZE + length
+        if data_end + FOOTER_SIZE > end:
+            break
+        data = view[pos + HEADER_SIZE:data_end].tobytes()
+        if check_crc:
+            data_crc, = _FOOTER.unpack_from(buf, data_end)
+            if data_crc != masked_crc32c(data):
+                raise CorruptRecordError(
+                    path, offset + pos, 'data CRC mismatch')
+        yield offset + pos, data
+        pos = data_end + FOOTER_SIZE
+
+
+class EventFileReader(object):
+    """ Incremental reader of one event file: each call to
+    ``read_records`` or ``read_events`` returns only complete records
+    written since the previous call. Only the byte offset is kept
+    between calls, the file is not kept open.
+
+    Args:
+        path (str): event file path.
+        offset (int): start reading at this byte offset.
+        check_crc (bool): check data CRCs (length CRCs are always checked).
+            The CRC is computed in pure Python unless ``google-crc32c``
+            is installed, so this is slow for large records.
+    """
+    def __init__(self, path, offset=0, check_crc=False):
+        self.path = path
+        self.offset = offset
+        self.check_crc = check_crc
+
+    def iter_records(self):
+        """ Yield data of new complete records, advancing the offset
+        after each record, so only a small buffer is kept in memory
+        however many bytes were added.
+        """
+        try:
+            size = os.path.getsize(self.path)
+        except OSError:
+            return
+        if size < self.offset:
+            # File was truncated or replaced: start over
+            self.offset = 0
+        if size == self.offset:
+            return
+        with open(self.path, 'rb') as f:
+            f.seek(self.offset)
+            buf = b''
+            read_size = READ_SIZE
+            while True:
+                chunk = f.read(read_size)
+                if not chunk:
+                    break
+                buf = buf + chunk if buf else chunk
+                start = self.offset
+                parsed = 0
+                for offset, data in parse_records(
+                        buf, self.path, start, self.check_crc):
+                    parsed = offset - start + \
+                        HEADER_SIZE + len(data) + FOOTER_SIZE
+                    self.offset = start + parsed
+                    yield data
+                # Keep only the partial record for the next chunk,
+                # and read the rest of a large one at once,
+                # not to copy it again for each chunk.
+                buf = buf[parsed:]
+                read_size = READ_SIZE
+                if len(buf) >= HEADER_SIZE:
+                    # Its length CRC was checked by parse_records
+                    length, _ = _HEADER.unpack_from(buf)
+                    read_size = max(read_size, HEADER_SIZE + length +
+                                    FOOTER_SIZE - len(buf))
+
+    def iter_events(self):
+        for data in self.iter_records():
+            yield event_pb2.Event.FromString(data)
+
+    def read_records(self):
+        return list(self.iter_records())
+
+    def read_events(self):
+        return list(self.iter_events())
+
+
+# Side files in log directories: parts of ChunkedUploadSink uploads
+# and caches of tensorboard_logger.runs
+_NOT_EVENT_FILE = re.compile(r'\.(part\d+|npz)$')
+
+
+def is_event_file(filename):
+    """ Return True if filename (without directory) is an event file name.
+
+    Example:
+        >>> [is_event_file(filename) for filename in [
+        ...     'events.out.tfevents.1500000000.host',
+        ...     'events.out.tfevents.1500000000.host.part00001',
+        ...     'events.out.scalars.1500000000.host.npz']]
+        [True, False, False]
+    """
+    return (filename.startswith('events.out.tfevents.') and
+            not _NOT_EVENT_FILE.search(filename))
+
+
+class LogdirFollower(object):
+    """ Follow all event files in a log directory (and its
+    subdirectories if recursive is True), including files created later.
+
+    Args:
+        logdir (str): log directory.
+        recursive (bool): also follow files in subdirectories.
+        check_crc (bool): check data CRCs, see ``EventFileReader``.
+    """
+    def __init__(self, logdir, recursive=True, check_crc=False):
+        self.logdir = logdir
+        self.recursive = recursive
+        self.check_crc = check_crc
+        self._readers = {}
+
+    def _discover(self):
+        if self.recursive:
+            walk = os.walk(self.logdir)
+        else:
+            try:
+                walk = [(self.logdir, None, os.listdir(self.logdir))]
+            except OSError:
+                walk = []
+        for dirpath, _, filenames in walk:
+            for filename in filenames:
+                path = os.path.join(dirpath, filename)
+                if is_event_file(filename) and path not in self._readers:
+                    self._readers[path] = EventFileReader(
+                        path, check_crc=self.check_crc)
+
+    def iter_events(self):
+        """ Yield (path, event) for all complete events written
+        since the previous call, in file name order.
+        """
+        self._discover()
+        for path in sorted(self._readers):
+            for event in self._readers[path].iter_events():
+                yield path, event
+
+    def poll(self):
+        return list(self.iter_events())
+
+    def offsets(self):
+        return {path: reader.offset for path, reader in self._readers.items()}
+
+    def follow(self, poll_secs=2):
+        """ Yield (path, event) forever, polling every poll_secs.
+        """
+        while True:
+            for item in self.iter_events():
+                yield item
+            time.sleep(poll_secs)
+
+
+def read_events(path, check_crc=True):
+    """ Read all complete events from an event file.
+    """
+    return EventFileReader(path, check_crc=check_crc).read_events()
+
+
+def iter_run_events(logdir, check_crc=False):
+    """ Yield events of all event files in a run directory as a single
+    stream ordered by step, then by wall time: files of forked processes
+    (with a ".<pid>" suffix) and shards are merged as they are read.
+    Events of each file are expected to be in step order.
+    """
+    paths = sorted(os.path.join(logdir, filename)
+                   for filename in os.listdir(logdir)
+                   if is_event_file(filename))
+    streams = [_ordered(EventFileReader(path, check_crc=check_crc), i)
+               for i, path in enumerate(paths)]
+    for _, _, _, _, event in heapq.merge(*streams):
+        yield event
+
+
+def _ordered(reader, index):
+    # File index and event number make keys unique, events are not compared
+    for n, event in enumerate(reader.iter_events()):
+        yield event.step, event.wall_time, index, n, event
+
+
+# Field numbers of Event.summary, Summary.value and Summary.Value.tag
+_EVENT_SUMMARY = 5
+_SUMMARY_VALUE = 1
+_VALUE_TAG = 1
+
+
+def scan_tags(path):
+    """ Return the set of tags of summary values in an event file.
+    Only record headers and tags are read: the file is memory mapped,
+    and payloads (images, histograms, tensors) are skipped without
+    being read or decoded. Data CRCs are not checked, and scanning stops
+    at a partial or corrupt record.
+    """
+    tags = set()
+    size = os.path.getsize(path)
+    if not size:
+        return tags
+    with open(path, 'rb') as f:
+        buf = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+    try:
+        pos = 0
+        while pos + HEADER_SIZE <= size:
+            length, length_crc = _HEADER.unpack_from(buf, pos)
+            if length_crc != masked_crc32c(buf[pos:pos + 8]):
+                break
+            start = pos + HEADER_SIZE
+            end = start + length
+            if end + FOOTER_SIZE > size:
+                break
+            try:
+                _scan_event_tags(buf, start, end, tags)
+            except (ValueError, IndexError):
+                break
+            pos = end + FOOTER_SIZE
+    finally:
+        buf.close()
+    return tags
+
+
+def _scan_event_tags(buf, pos, end, tags):
+    for field, start, field_end in _fields(buf, pos, end):
+        if field == _EVENT_SUMMARY:
+            for field, value_start, value_end in _fields(buf, start, field_end):
+                if field == _SUMMARY_VALUE:
+                    for field, tag_start, tag_end in _fields(
+                            buf, value_start, value_end):
+                        if field == _VALUE_TAG:
+                            tags.add(buf[tag_start:tag_end].decode('utf-8'))
+                            break
+
+
+def _fields(buf, pos, end):
+    """ Yield (field number, start, end) of protobuf fields in buf[pos:end],
+    without decoding their values.
+    """
+    while pos < end:
+        key, pos = _varint(buf, pos)
+        wire_type = key & 7
+        if wire_type == 0:
+            _, field_end = _varint(buf, pos)
+        elif wire_type == 1:
+            field_end = pos + 8
+        elif wire_type == 2:
+            length, pos = _varint(buf, pos)
+            field_end = pos + length
+        elif wire_type == 5:
+            field_end = pos + 4
+        else:
+            raise ValueError('unsupported wire type {}'.format(wire_type))
+        if field_end > end:
+            raise ValueError('truncated field')
+        yield key >> 3, pos, field_end
+        pos = field_end
+
+
+def _varint(buf, pos):
+    """ Return a varint at pos and the position after it.
+    """
+    result = shift = 0
+    while True:
+        if shift > 63:
+            raise ValueError('varint too long')
+        byte = six.indexbytes(buf, pos)
+        result |= (byte & 0x7f) << shift
+        pos += 1
+        if not byte & 0x80:
+            return result, pos
+        shift += 7
@@ -0,0 +1,170 @@
+# -*- coding: utf-8 -*-
+import socket
+import threading
+import time
+import warnings
+
+from .collector import batch_message, hello_message, recv_ack
+from .tensorboard_logger import Logger
+
+
+class RemoteLogger(Logger):
+    """ Logger sending encoded records to a ``Collector``
+    (see ``tensorboard_logger.collector``) instead of writing a local file.
+
+    Records are batched and sent over a persistent connection by a
+    background thread. When the connection is lost, the client reconnects
+    and resends the batch that was not acknowledged. When the collector
+    can not keep up and more than ``max_pending`` bytes are waiting
+    to be sent, logging calls block.
+
+    Args:
+        run (str): run name: a relative path under collector logdir.
+        address: (host, port) tuple or a Unix socket path of the collector.
+        flush_secs (float): send a batch at least this often.
+        batch_size (int): send a batch as soon as it has this many bytes.
+        max_pending (int): block logging when this many bytes are not sent.
+        retry_secs (float): delay between reconnection attempts.
+        close_timeout (float): on close, give up sending remaining records
+            if collector is not reachable for this long.
+    """
+    def __init__(self, run, address, flush_secs=2, batch_size=1 << 16,
+                 max_pending=1 << 24, retry_secs=0.5, close_timeout=10,
+                 **kwargs):
+        self.address = address
+        self.batch_size = batch_size
+        self.max_pending = max_pending
+        self.retry_secs = retry_secs
+        self.close_timeout = close_timeout
+        super(RemoteLogger, self).__init__(
+            run, flush_secs=flush_secs, **kwargs)
+
+    def _open_writer(self, filename):
+        return _RemoteWriter(
+            self.address, self.logdir, filename,
+            flush_secs=self.flush_secs, batch_size=self.batch_size,
+            max_pending=self.max_pending, retry_secs=self.retry_secs,
+            close_timeout=self.close_timeout)
+
+    def _write_batch(self, data):
+        # Batching is done by the writer, no flush after each batch
+        self._writer.write(data)
+
+
+class _RemoteWriter(object):
+    def __init__(self, address, run, filename, flush_secs, batch_size,
+                 max_pending, retry_secs, close_timeout):
+        self.address = address
+        self.hello = hello_message(run, filename)
+        self.flush_secs = flush_secs
+        self.batch_size = batch_size
+        self.max_pending = max_pending
+        self.retry_secs = retry_secs
+        self.close_timeout = close_timeout
+        self._pending = []
+        self._pending_bytes = 0
+        self._seq = 0
+        self._closed = False
+        self._closed_at = None
+        self._flush_requested = False
+        self._sending = False
+        self._cond = threading.Condition()
+        self._sock = None
+        self._thread = threading.Thread(target=self._send_loop)
+        self._thread.daemon = True
+        self._thread.start()
+
+    def write(self, record):
+        with self._cond:
+            if self._closed:
+                raise ValueError('write to closed RemoteLogger')
+            # Backpressure: wait until the sender catches up
+            while (self._pending_bytes >= self.max_pending and
+                   not self._closed):
+                self._cond.wait()
+            self._pending.append(record)
+            self._pending_bytes += len(record)
+            if self._pending_bytes >= self.batch_size:
+                self._cond.notify_all()
+
+    def flush(self):
+        """ Block until all written records are acknowledged by collector.
+        """
+        with self._cond:
+            self._flush_requested = True
+            self._cond.notify_all()
+            while self._pending or self._sending:
+                self._cond.wait()
+
+    def close(self):
+        with self._cond:
+            if self._closed:
+                return
+            self._closed = True
+            self._closed_at = time.time()
+            self._cond.notify_all()
+        self._thread.join()
+        if self._sock is not None:
+            self._sock.close()
+
+    def _send_loop(self):
+        while True:
+            with self._cond:
+                deadline = time.time() + self.flush_secs
+                while not (self._closed or self._flush_requested or
+                           self._pending_bytes >= self.batch_size):
+                    timeout = deadline - time.time()
+                    if timeout <= 0:
+                        break
+                    self._cond.wait(timeout)
+                self._flush_requested = False
+                if not self._pending:
+                    if self._closed:
+                        return
+                    continue
+                payload = b''.join(self._pending)
+                self._pending = []
+                self._pending_bytes = 0
+                self._sending = True
+                self._seq += 1
+                seq = self._seq
+                self._cond.notify_all()
+            self._send(seq, payload)
+            with self._cond:
+                self._sending = False
+                self._cond.notify_all()
+
+    def _send(self, seq, payload):
+        message = batch_message(seq, payload)
+        while True:
+            try:
+                if self._sock is None:
+                    self._sock = self._connect()
+                    # Collector may already have this batch if the ack
+                    # was lost with the previous connection.
+                    if recv_ack(self._sock) >= seq:
+                        return
+                self._sock.sendall(message)
+                if recv_ack(self._sock) == seq:
+                    return
+                raise EOFError('unexpected ack')
+            except (EOFError, socket.error):
+                if self._sock is not None:
+                    self._sock.close()
+                    self._sock = None
+                if (self._closed and
+                        time.time() - self._closed_at > self.close_timeout):
+                    warnings.warn('collector at {} is not reachable, {} bytes '
+                                  'of records are lost'
+                                  .format(self.address, len(payload)))
+                    return
+                time.sleep(self.retry_secs)
+
+    def _connect(self):
+        if isinstance(self.address, tuple):
+            sock = socket.create_connection(self.address)
+        else:
+            sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+            sock.connect(self.address)
+        sock.sendall(self.hello)
+        return sock
@@ -0,0 +1,121 @@
+# -*- coding: utf-8 -*-
+""" Sampling of process and system resource usage, for
+``Logger(resources_secs=...)``.
+
+On Linux, counters are read from ``/proc/self/stat``, ``/proc/self/status``,
+``/proc/self/io``, ``/proc/self/fd`` and ``/proc/loadavg``: a few small reads
+per sample. Elsewhere, ``resource.getrusage`` and ``os.getloadavg``
+are used, and some values are missing.
+"""
+import os
+import time
+
+try:
+    import resource
+except ImportError:  # Windows
+    resource = None
+
+
+_CLOCK_TICKS = (os.sysconf('SC_CLK_TCK')
+                if hasattr(os, 'sysconf') else 100)
+_PAGE_SIZE = (os.sysconf('SC_PAGE_SIZE')
+              if hasattr(os, 'sysconf') else 4096)
+
+# Counters reported as rates per second, under these names
+_RATES = (
+    ('cpu_seconds', 'cpu_percent', 100.),
+    ('read_bytes', 'read_bytes_per_sec', 1.),
+    ('write_bytes', 'write_bytes_per_sec', 1.),
+    ('ctx_switches', 'ctx_switches_per_sec', 1.),
+)
+
+# Counters reported as is
+_GAUGES = ('rss_bytes', 'open_fds', 'threads', 'load_avg_1m')
+
+
+def _read(path):
+    with open(path) as f:
+        return f.read()
+
+
+def read_counters():
+    """ Return current raw counters of this process as a dict:
+    cumulative "cpu_seconds", "read_bytes", "write_bytes", "ctx_switches",
+    and "rss_bytes", "open_fds", "threads", "load_avg_1m".
+    Counters that can not be read are missing.
+    """
+    counters = {}
+    try:
+        # Fields after the command name, which may contain spaces
+        fields = _read('/proc/self/stat').rsplit(')', 1)[1].split()
+        counters['cpu_seconds'] = \
+            (int(fields[11]) + int(fields[12])) / float(_CLOCK_TICKS)
+        counters['threads'] = int(fields[17])
+        counters['rss_bytes'] = int(fields[21]) * _PAGE_SIZE
+    except (IOError, OSError, IndexError, ValueError):
+        if resource is not None:
+            usage = resource.getrusage(resource.RUSAGE_SELF)
+            counters['cpu_seconds'] = usage.ru_utime + usage.ru_stime
+            counters['ctx_switches'] = usage.ru_nvcsw + usage.ru_nivcsw
+    try:
+        switches = 0
+        for line in _read('/proc/self/status').splitlines():
+            if 'ctxt_switches:' in line:  # voluntary and nonvoluntary
+                switches += int(line.split(':')[1])
+        counters['ctx_switches'] = switches
+    except (IOError, OSError, ValueError):
+        pass
+    try:
+        for line in _read('/proc/self/io').splitlines():
+            key, _, value = line.partition(':')
+            if key in ('read_bytes', 'write_bytes'):
+                counters[key] = int(value)
+    except (IOError, OSError, ValueError):
+        pass  # not readable in some containers
+    try:
+        counters['open_fds'] = len(os.listdir('/proc/self/fd'))
+    except OSError:
+        pass
+    try:
+        counters['load_avg_1m'] = os.getloadavg()[0]
+    except (AttributeError, OSError):
+        pass
+    return counters
+
+
+class ResourceSampler(object):
+    """ Turn successive counter readings into values to log:
+    rates per second of cumulative counters, and current gauges.
+
+    Example:
+        >>> sampler = ResourceSampler()
+        >>> sampler.sample({'cpu_seconds': 1.0, 'rss_bytes': 10}, now=0.)
+        []
+        >>> sampler.sample({'cpu_seconds': 1.5, 'rss_bytes': 20}, now=2.)
+        [('cpu_percent', 25.0), ('rss_bytes', 20)]
+    """
+    def __init__(self):
+        self._previous = None
+        self._previous_at = None
+
+    def sample(self, counters=None, now=None):
+        """ Return (name, value) pairs, empty for the first sample,
+        as rates need two readings.
+        """
+        if counters is None:
+            counters = read_counters()
+        if now is None:
+            now = time.time()
+        previous, previous_at = self._previous, self._previous_at
+        self._previous, self._previous_at = counters, now
+        if previous is None or now <= previous_at:
+            return []
+        elapsed = now - previous_at
+        values = []
+        for counter, name, scale in _RATES:
+            if counter in counters and counter in previous:
+                values.append((name, scale * (
+                    counters[counter] - previous[counter]) / elapsed))
+        values.extend((name, counters[name])
+                      for name in _GAUGES if name in counters)
+        return values
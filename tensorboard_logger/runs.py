@@ -0,0 +1,390 @@
+# -*- coding: utf-8 -*-
+""" Loading and querying scalars of many runs at once, e.g. of a sweep::
+
+    runs = RunCollection(['sweeps/lr-sweep'])
+    table = runs.query(tags='^loss', min_step=1000)
+    steps, mean = table.aggregate('loss', 'mean')
+    steps, p90 = table.aggregate('loss', 0.9)
+
+Every directory containing event files is a run. Event files are decoded
+in parallel by a pool of processes, and decoded scalars are cached in
+a ``.npz`` file next to each event file, together with the size and
+modification time of the event file and the offset decoded so far.
+When the event file did not change, the cache is used as is,
+and when it grew, only the new records are decoded.
+"""
+import multiprocessing
+import os
+import re
+import warnings
+
+import numpy as np
+import six
+
+from .downsample import downsample
+from .reader import CorruptRecordError, EventFileReader, is_event_file
+
+
+CACHE_VERSION = 1
+
+_COLUMNS = ('tag', 'step', 'wall_time', 'value')
+
+AGGREGATES = ('mean', 'median', 'min', 'max', 'std', 'count')
+
+
+def cache_path(path):
+    """ Path of the scalars cache of an event file. Its name does not
+    contain "tfevents", so that TensorBoard does not try to read it.
+
+    Example:
+        >>> cache_path('run/events.out.tfevents.1500000000.host')
+        'run/events.out.scalars.1500000000.host.npz'
+    """
+    dirname, filename = os.path.split(path)
+    return os.path.join(
+        dirname, filename.replace('tfevents', 'scalars') + '.npz')
+
+
+def load_scalars(path, cache=True):
+    """ Return scalars of one event file as a dict with "tags" (a list of
+    tag names) and "tag" (tag indices), "step", "wall_time" and "value"
+    arrays, using and updating the cache if cache is True.
+    If the file has a corrupt record, scalars before it are returned,
+    with the error message under "error" (None otherwise),
+    and the cache is not updated.
+    """
+    stat = os.stat(path)
+    cached = _read_cache(path) if cache else None
+    if cached is not None and (cached['size'], cached['mtime']) == \
+            (stat.st_size, stat.st_mtime):
+        return cached
+    if cached is not None and cached['offset'] <= stat.st_size:
+        scalars = _decode(path, cached['offset'], cached['tags'])
+        if scalars['error'] is not None and \
+                scalars['offset'] == cached['offset']:
+            # Not the file that was cached, but a new one
+            cached = None
+    else:
+        cached = None
+    if cached is None:
+        scalars = _decode(path, 0, [])
+    scalars['size'], scalars['mtime'] = stat.st_size, stat.st_mtime
+    if cached is not None:
+        for name in _COLUMNS:
+            scalars[name] = np.concatenate([cached[name], scalars[name]])
+    if cache and scalars['error'] is None:
+        _write_cache(path, scalars)
+    return scalars
+
+
+def _decode(path, offset, tags):
+    """ Decode scalars from offset, adding new tags to a copy of tags,
+    up to the first corrupt record, if any.
+    """
+    tags = list(tags)
+    reader = EventFileReader(path, offset=offset)
+    tag_ids = {tag: i for i, tag in enumerate(tags)}
+    columns = {name: [] for name in _COLUMNS}
+    error = None
+    try:
+        for event in reader.iter_events():
+            for value in event.summary.value:
+                if not value.HasField('simple_value'):
+                    continue
+                try:
+                    tag_id = tag_ids[value.tag]
+                except KeyError:
+                    tag_id = tag_ids[value.tag] = len(tags)
+                    tags.append(value.tag)
+                columns['tag'].append(tag_id)
+                columns['step'].append(event.step)
+                columns['wall_time'].append(event.wall_time)
+                columns['value'].append(value.simple_value)
+    except CorruptRecordError as e:
+        error = str(e)
+    return {
+        'tags': tags,
+        'tag': np.array(columns['tag'], dtype=np.int32),
+        'step': np.array(columns['step'], dtype=np.int64),
+        'wall_time': np.array(columns['wall_time'], dtype=np.float64),
+        'value': np.array(columns['value'], dtype=np.float32),
+        'offset': reader.offset,
+        'error': error,
+    }
+
+
+def _read_cache(path):
+    try:
+        with np.load(cache_path(path)) as f:
+            if int(f['version']) != CACHE_VERSION:
+                return None
+            scalars = {name: f[name] for name in _COLUMNS}
+            scalars['tags'] = [six.text_type(tag) for tag in f['tags']]
+            for name in ['offset', 'size']:
+                scalars[name] = int(f[name])
+            scalars['mtime'] = float(f['mtime'])
+            scalars['error'] = None  # only written without errors
+            return scalars
+    except (IOError, OSError, ValueError, KeyError):
+        return None
+
+
+def _write_cache(path, scalars):
+    """ Write the cache atomically, ignoring errors
+    (e.g. in a read-only directory).
+    """
+    target = cache_path(path)
+    tmp = '{}.{}.tmp'.format(target, os.getpid())
+    try:
+        with open(tmp, 'wb') as f:
+            np.savez(f, version=CACHE_VERSION,
+                     tags=np.array(scalars['tags'], dtype='U'),
+                     offset=scalars['offset'], size=scalars['size'],
+                     mtime=scalars['mtime'],
+                     **{name: scalars[name] for name in _COLUMNS})
+        os.rename(tmp, target)
+    except (IOError, OSError):
+        if os.path.exists(tmp):
+            os.remove(tmp)
+
+
+def _load_task(task):
+    path, cache = task
+    return load_scalars(path, cache=cache)
+
+
+def find_runs(logdirs):
+    """ Return a list of (run, event file paths) for all directories
+    with event files under logdirs, where run is the directory path.
+    """
+    runs = []
+    for logdir in logdirs:
+        for dirpath, dirnames, filenames in os.walk(logdir):
+            dirnames.sort()
+            paths = sorted(os.path.join(dirpath, filename)
+                           for filename in filenames
+                           if is_event_file(filename))
+            if paths:
+                runs.append((dirpath, paths))
+    return runs
+
+
+class RunCollection(object):
+    """ Scalars of all runs under some log directories.
+
+    Args:
+        logdirs (list): log directories, all their subdirectories
+            with event files are runs.
+        processes (int): number of processes decoding event files
+            (by default, one per CPU).
+        cache (bool): use and update decoded scalars caches.
+
+    Files with a corrupt record are loaded up to it, with a warning,
+    and their errors are kept in ``errors`` by path.
+    """
+    def __init__(self, logdirs, processes=None, cache=True):
+        if isinstance(logdirs, six.string_types):
+            logdirs = [logdirs]
+        self.logdirs = logdirs
+        self.processes = processes
+        self.cache = cache
+        self.table = None
+        self.errors = {}
+        self.reload()
+
+    def reload(self):
+        """ Load new scalars of all runs, including new runs and files.
+        """
+        runs = find_runs(self.logdirs)
+        tasks = [(path, self.cache) for _, paths in runs for path in paths]
+        if self.processes == 1 or len(tasks) <= 1:
+            loaded = [_load_task(task) for task in tasks]
+        else:
+            pool = multiprocessing.Pool(self.processes)
+            try:
+                loaded = pool.map(_load_task, tasks, chunksize=1)
+            finally:
+                pool.terminate()
+                pool.join()
+        run_names = []
+        files = []
+        self.errors = {}
+        loaded = iter(loaded)
+        for run_id, (run, paths) in enumerate(runs):
+            run_names.append(run)
+            for path in paths:
+                scalars = next(loaded)
+                if scalars['error'] is not None:
+                    self.errors[path] = scalars['error']
+                    warnings.warn('{}, values after it are skipped'.format(
+                        scalars['error']))
+                files.append((run_id, scalars))
+        self.table = ScalarTable.concatenate(run_names, files)
+        return self.table
+
+    @property
+    def runs(self):
+        return self.table.runs
+
+    @property
+    def tags(self):
+        return self.table.tags
+
+    def query(self, tags=None, runs=None, min_step=None, max_step=None):
+        """ See ``ScalarTable.query``.
+        """
+        return self.table.query(tags=tags, runs=runs, min_step=min_step,
+                                max_step=max_step)
+
+
+class ScalarTable(object):
+    """ Scalars of several runs as columns: "run" and "tag" indices
+    into ``runs`` and ``tags`` lists, "step", "wall_time" and "value".
+    """
+    def __init__(self, runs, tags, run, tag, step, wall_time, value):
+        self.runs = runs
+        self.tags = tags
+        self.run = run
+        self.tag = tag
+        self.step = step
+        self.wall_time = wall_time
+        self.value = value
+
+    @classmethod
+    def concatenate(cls, runs, files):
+        """ Make a table from (run index, ``load_scalars`` result) pairs.
+        """
+        tags = []
+        tag_ids = {}
+        columns = {name: [] for name in ('run',) + _COLUMNS}
+        for run_id, scalars in files:
+            # Map tag indices of each file to indices in the table
+            mapping = np.empty(len(scalars['tags']), dtype=np.int32)
+            for i, tag in enumerate(scalars['tags']):
+                if tag not in tag_ids:
+                    tag_ids[tag] = len(tags)
+                    tags.append(tag)
+                mapping[i] = tag_ids[tag]
+            columns['run'].append(
+                np.full(len(scalars['step']), run_id, dtype=np.int32))
+            columns['tag'].append(mapping[scalars['tag']])
+            for name in ['step', 'wall_time', 'value']:
+                columns[name].append(scalars[name])
+        dtypes = {'run': np.int32, 'tag': np.int32, 'step': np.int64,
+                  'wall_time': np.float64, 'value': np.float32}
+        return cls(runs, tags, **{
+            name: (np.concatenate(arrays) if arrays
+                   else np.empty(0, dtype=dtypes[name]))
+            for name, arrays in columns.items()})
+
+    def __len__(self):
+        return len(self.step)
+
+    def _select(self, mask):
+        return ScalarTable(self.runs, self.tags, self.run[mask],
+                           self.tag[mask], self.step[mask],
+                           self.wall_time[mask], self.value[mask])
+
+    def query(self, tags=None, runs=None, min_step=None, max_step=None):
+        """ Return a table with only matching scalars.
+
+        Args:
+            tags (str): regular expression searched in tag names.
+            runs (str): regular expression searched in run names.
+            min_step (int): minimum step (inclusive).
+            max_step (int): maximum step (inclusive).
+        """
+        mask = np.ones(len(self), dtype=bool)
+        if tags is not None:
+            mask &= np.isin(self.tag, _matching(self.tags, tags))
+        if runs is not None:
+            mask &= np.isin(self.run, _matching(self.runs, runs))
+        if min_step is not None:
+            mask &= self.step >= min_step
+        if max_step is not None:
+            mask &= self.step <= max_step
+        return self._select(mask)
+
+    def series(self, run, tag, max_points=None, method='lttb'):
+        """ Return (steps, values) of one run and tag, in logging order.
+        With max_points, return at most this many points selected by a
+        downsampling method (see ``tensorboard_logger.downsample``).
+        """
+        mask = ((self.run == self.runs.index(run)) &
+                (self.tag == self.tags.index(tag)))
+        steps, values = self.step[mask], self.value[mask]
+        if max_points is not None:
+            steps, values = downsample(steps, values, max_points, method)
+        return steps, values
+
+    def aggregate(self, tag, how='mean'):
+        """ Aggregate values of a tag across runs for each step.
+        If a run has several values for the same step (e.g. it was
+        restarted from a checkpoint), the last one is used.
+
+        Args:
+            tag (str): tag name.
+            how: "mean", "median", "min", "max", "std", "count",
+                or a float in [0, 1] for a quantile.
+
+        Returns:
+            (steps, values) arrays, with values as float64.
+        """
+        if how not in AGGREGATES and not isinstance(how, float):
+            raise ValueError('unknown aggregate "{}"'.format(how))
+        mask = self.tag == self.tags.index(tag)
+        run, step, value = self.run[mask], self.step[mask], self.value[mask]
+        # Keep the last value for each (run, step)
+        order = np.lexsort((np.arange(len(step)), run, step))
+        run, step, value = run[order], step[order], value[order]
+        last = np.ones(len(step), dtype=bool)
+        last[:-1] = (step[1:] != step[:-1]) | (run[1:] != run[:-1])
+        step, value = step[last], value[last].astype(np.float64)
+        steps, group, counts = np.unique(
+            step, return_inverse=True, return_counts=True)
+        group = group.reshape(-1)
+        if how == 'count':
+            return steps, counts.astype(np.float64)
+        if how in ('mean', 'std'):
+            sums = np.bincount(group, weights=value, minlength=len(steps))
+            mean = sums / counts
+            if how == 'mean':
+                return steps, mean
+            squares = np.bincount(group, weights=(value - mean[group]) ** 2,
+                                  minlength=len(steps))
+            return steps, np.sqrt(squares / counts)
+        if how in ('min', 'max'):
+            result = np.full(len(steps), np.inf if how == 'min' else -np.inf)
+            ufunc = np.minimum if how == 'min' else np.maximum
+            ufunc.at(result, group, value)
+            return steps, result
+        return steps, _group_quantile(
+            group, value, counts, 0.5 if how == 'median' else how)
+
+
+def _matching(names, pattern):
+    regex = re.compile(pattern)
+    return np.array([i for i, name in enumerate(names) if regex.search(name)],
+                    dtype=np.int32)
+
+
+def _group_quantile(group, value, counts, q):
+    """ Quantile of values in each group, with linear interpolation
+    like ``np.quantile``, computed with a single sort.
+
+    Example:
+        >>> group = np.array([0, 1, 0, 1, 0])
+        >>> value = np.array([1., 10., 3., 20., 2.])
+        >>> _group_quantile(group, value, np.array([3, 2]), 0.5).tolist()
+        [2.0, 15.0]
+    """
+    if not 0 <= q <= 1:
+        raise ValueError('quantile should be in [0, 1]')
+    value = value[np.lexsort((value, group))]
+    starts = np.concatenate([[0], np.cumsum(counts)[:-1]])
+    position = q * (counts - 1)
+    lower = np.floor(position).astype(np.intp)
+    upper = np.minimum(lower + 1, counts - 1)
+    fraction = position - lower
+    return (value[starts + lower] * (1 - fraction) +
+            value[starts + upper] * fraction)
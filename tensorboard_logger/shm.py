@@ -0,0 +1,166 @@
+# -*- coding: utf-8 -*-
+""" Logging from other processes through shared memory.
+
+Large arrays passed to ``log_histogram`` and ``log_images`` are copied
+once into a slot of a shared memory ring, and only a small descriptor
+is sent to the logging process through a queue, instead of pickling
+the whole array. The logging process computes summaries directly from
+the shared buffer and then releases the slot::
+
+    transport = SharedMemoryTransport(n_slots=8, slot_size=32 << 20)
+    worker = multiprocessing.Process(target=train, args=(transport,))
+    worker.start()
+    transport.serve(Logger('runs/run-1234'))  # until transport.close()
+    transport.unlink()
+
+    def train(transport):
+        for step in ...:
+            transport.log_value('loss', loss, step)
+            transport.log_images('samples', images, step)
+        transport.close()
+
+When all slots are in use, logging blocks until the logging process
+releases one (or for at most ``timeout`` seconds, then the value is
+dropped). Arrays smaller than ``min_size`` bytes, or larger than a slot,
+are sent through the queue as usual.
+Requires Python 3.8+ for ``multiprocessing.shared_memory``.
+"""
+import multiprocessing
+
+import numpy as np
+from six.moves import queue as queue_module
+
+try:
+    from multiprocessing import shared_memory
+except ImportError:  # Python < 3.8
+    shared_memory = None
+
+from .arrays import as_array, is_bfloat16
+
+
+class SharedMemoryTransport(object):
+    """ Transport of logging calls to a process running ``serve``.
+    Create it before starting other processes, and pass it to them.
+
+    Args:
+        n_slots (int): number of payloads that can be in flight.
+        slot_size (int): maximum payload size in bytes.
+        min_size (int): smaller payloads are sent through the queue.
+        timeout (float): how long to wait for a free slot (None to wait
+            forever) before dropping the value.
+        context: multiprocessing context used to create queues.
+    """
+    def __init__(self, n_slots=8, slot_size=8 << 20, min_size=1 << 16,
+                 timeout=None, context=None):
+        if shared_memory is None:
+            raise RuntimeError('SharedMemoryTransport requires Python 3.8+')
+        context = context or multiprocessing
+        self.n_slots = n_slots
+        self.slot_size = slot_size
+        self.min_size = min_size
+        self.timeout = timeout
+        self._shm = shared_memory.SharedMemory(
+            create=True, size=n_slots * slot_size)
+        self._calls = context.Queue()
+        self._free = context.Queue()
+        for slot in range(n_slots):
+            self._free.put(slot)
+        self.shared = self.inline = self.dropped = 0
+
+    def log_value(self, name, value, step=None):
+        self._calls.put(('value', name, step, None, None, float(value)))
+
+    def log_histogram(self, name, value, step=None):
+        if isinstance(value, tuple):  # bin edges and counts
+            self._calls.put(('histogram', name, step, None, None, value))
+        else:
+            self._send('histogram', name, step, as_array(value))
+
+    def log_images(self, name, images, step=None):
+        if isinstance(images, (list, tuple)):
+            images = [as_array(image) for image in images]
+            shapes = set((image.shape, image.dtype) for image in images)
+            if len(shapes) != 1:
+                self._calls.put(('images', name, step, None, None, images))
+                return
+            (shape, dtype), = shapes
+            self._send('images', name, step, images,
+                       shape=(len(images),) + shape, dtype=dtype)
+        else:
+            self._send('images', name, step, as_array(images))
+
+    def _send(self, kind, name, step, value, shape=None, dtype=None):
+        """ Copy value (an array, or a list of arrays of the given
+        shape and dtype) into a free slot and send its descriptor.
+        """
+        if shape is None:
+            shape, dtype = value.shape, value.dtype
+        n_bytes = int(np.prod(shape)) * np.dtype(dtype).itemsize
+        if not self.min_size <= n_bytes <= self.slot_size or (
+                not isinstance(value, list) and is_bfloat16(value)):
+            self.inline += 1
+            self._calls.put((kind, name, step, None, None, value))
+            return
+        try:
+            slot = self._free.get(timeout=self.timeout)
+        except queue_module.Empty:
+            self.dropped += 1
+            return
+        view = self._slot_array(slot, shape, dtype)
+        if isinstance(value, list):
+            for i, item in enumerate(value):
+                view[i] = item
+        else:
+            np.copyto(view, value, casting='no')
+        del view
+        self.shared += 1
+        self._calls.put((kind, name, step, slot, np.dtype(dtype).str, shape))
+
+    def _slot_array(self, slot, shape, dtype):
+        return np.ndarray(shape, dtype=dtype, buffer=self._shm.buf,
+                          offset=slot * self.slot_size)
+
+    def serve(self, logger):
+        """ Log calls received from other processes with logger,
+        until ``close`` is called.
+        """
+        log = {'value': logger.log_value, 'histogram': logger.log_histogram,
+               'images': logger.log_images}
+        while True:
+            call = self._calls.get()
+            if call is None:
+                return
+            kind, name, step, slot, dtype, value = call
+            if slot is None:
+                log[kind](name, value, step)
+                continue
+            view = self._slot_array(slot, value, dtype)
+            try:
+                log[kind](name, view, step)
+            finally:
+                del view
+                self._free.put(slot)
+
+    def close(self):
+        """ Stop ``serve`` after all calls sent before are logged.
+        """
+        self._calls.put(None)
+
+    def stats(self):
+        """ Counters of this process: values sent through "shared" memory,
+        "inline" through the queue, and "dropped" when no slot was free.
+        """
+        return {'shared': self.shared, 'inline': self.inline,
+                'dropped': self.dropped}
+
+    def unlink(self):
+        """ Free the shared memory, in the process which created
+        the transport, after ``serve`` returned.
+        """
+        self._shm.close()
+        self._shm.unlink()
+
+    def __getstate__(self):
+        state = self.__dict__.copy()
+        state['shared'] = state['inline'] = state['dropped'] = 0
+        return state
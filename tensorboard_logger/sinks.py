@@ -0,0 +1,376 @@
+# -*- coding: utf-8 -*-
+""" Sinks are file-like objects that Logger writes encoded records to.
+A sink has ``write(data)``, ``flush()`` and ``close()`` methods.
+``Logger`` accepts a ``sink`` factory: a callable taking a path
+(``<logdir>/events.out.tfevents.<time>.<host>``) and returning a sink.
+"""
+import csv
+import io
+import os
+import threading
+
+import six
+from six.moves import queue
+
+from .overload import RecordQueue
+
+
+class FileSink(object):
+    """ Sink writing into a local file, the default.
+    """
+    def __init__(self, path):
+        self.path = path
+        dirname = os.path.dirname(path)
+        if dirname and not os.path.exists(dirname):
+            os.makedirs(dirname)
+        self._file = open(path, 'wb')
+
+    def write(self, data):
+        self._file.write(data)
+
+    def flush(self):
+        self._file.flush()
+
+    def close(self):
+        self._file.close()
+
+
+class MemorySink(object):
+    """ Sink keeping all records in memory, use ``getvalue()`` to get them.
+    The contents is kept after close.
+
+    Example:
+        >>> sink = MemorySink('run/events')
+        >>> sink.write(b'abc')
+        >>> sink.close()
+        >>> sink.getvalue()
+        b'abc'
+    """
+    def __init__(self, path=None):
+        self.path = path
+        self._buffer = io.BytesIO()
+        self._value = None
+
+    def write(self, data):
+        self._buffer.write(data)
+
+    def flush(self):
+        pass
+
+    def getvalue(self):
+        if self._value is not None:
+            return self._value
+        return self._buffer.getvalue()
+
+    def close(self):
+        if self._value is None:
+            self._value = self._buffer.getvalue()
+            self._buffer.close()
+
+
+class ChunkedUploadSink(object):
+    """ Sink accumulating records into large parts and passing each part to
+    ``upload_part(path, part_number, data)`` (part numbers start from 1),
+    e.g. for multipart uploads to object storage.
+    The last (possibly smaller) part is uploaded on close, after which
+    ``complete(path, n_parts)`` is called, if given.
+
+    Up to ``concurrency`` parts are uploaded in parallel by background
+    threads; writing blocks while that many parts are already waiting.
+    An exception raised by ``upload_part`` is re-raised on the next write
+    or on close.
+
+    As parts are uploaded only when full, ``flush()`` does nothing,
+    so records become visible with a delay depending on ``part_size``.
+
+    Args:
+        path (str): event file path, passed to upload_part and complete.
+        upload_part (callable): uploads one part.
+        complete (callable): finishes the upload after all parts.
+        part_size (int): size of each part except the last one, in bytes.
+        concurrency (int): number of parts uploaded in parallel.
+    """
+    def __init__(self, path, upload_part, complete=None,
+                 part_size=8 << 20, concurrency=4):
+        if part_size < 1 or concurrency < 1:
+            raise ValueError('part_size and concurrency should be positive')
+        self.path = path
+        self.upload_part = upload_part
+        self.complete = complete
+        self.part_size = part_size
+        self.concurrency = concurrency
+        self._buffer = bytearray()
+        self._n_parts = 0
+        self._queue = queue.Queue(maxsize=concurrency)
+        self._error = None
+        self._closed = False
+        self._workers = []
+
+    def write(self, data):
+        self._check_error()
+        self._buffer.extend(data)
+        if len(self._buffer) >= self.part_size:
+            part_size = self.part_size
+            parts = [bytes(self._buffer[start:start + part_size]) for start in
+                     range(0, len(self._buffer) - part_size + 1, part_size)]
+            del self._buffer[:len(parts) * part_size]
+            for part in parts:
+                self._submit(part)
+
+    def flush(self):
+        pass
+
+    def close(self):
+        if self._closed:
+            return
+        self._closed = True
+        if self._buffer or not self._n_parts:
+            self._submit(bytes(self._buffer))
+            self._buffer = bytearray()
+        for _ in self._workers:
+            self._queue.put(None)
+        for worker in self._workers:
+            worker.join()
+        self._check_error()
+        if self.complete is not None:
+            self.complete(self.path, self._n_parts)
+
+    def _submit(self, part):
+        if len(self._workers) < self.concurrency:
+            worker = threading.Thread(target=self._upload_loop)
+            worker.daemon = True
+            worker.start()
+            self._workers.append(worker)
+        self._n_parts += 1
+        self._queue.put((self._n_parts, part))
+
+    def _upload_loop(self):
+        while True:
+            item = self._queue.get()
+            if item is None:
+                return
+            if self._error is None:
+                part_number, part = item
+                try:
+                    self.upload_part(self.path, part_number, part)
+                except Exception as e:
+                    self._error = e
+
+    def _check_error(self):
+        if self._error is not None:
+            raise self._error
+
+
+class FanOutSink(object):
+    """ Sink writing the same records to several sinks, so that events
+    are built and encoded only once. Each sink is written from its own
+    thread and queue, so a slow sink does not block logging or other sinks:
+    when more than ``max_pending_bytes`` are waiting to be written to it,
+    the ``overload`` policy applies (see ``overload.RecordQueue``),
+    by default its oldest records are dropped (the first write, with
+    the file version, is always kept). With the "block" policy, logging
+    waits for room, after records were queued for the other sinks.
+    Each sink is flushed after each batch written to it.
+    An exception raised by a sink stops writing to it only,
+    and is re-raised on close.
+
+    Use ``fan_out`` to make a sink factory for ``Logger(sink=...)``.
+
+    Args:
+        sinks (list): sinks to write to.
+        max_pending_bytes (int): bytes waiting for each sink (None for
+            no limit).
+        overload (str): policy when the limit is reached: "block",
+            "drop_newest" or "drop_oldest".
+        overload_timeout (float): how long "block" waits.
+    """
+    def __init__(self, sinks, max_pending_bytes=1 << 26,
+                 overload='drop_oldest', overload_timeout=None):
+        self.sinks = list(sinks)
+        self._queues = [
+            RecordQueue(max_pending_bytes, policy=overload,
+                        timeout=overload_timeout) for _ in self.sinks]
+        self._errors = [None] * len(self.sinks)
+        self._closed = False
+        self._first_write = True
+        self._threads = []
+        for i in range(len(self.sinks)):
+            thread = threading.Thread(target=self._write_loop, args=(i,))
+            thread.daemon = True
+            thread.start()
+            self._threads.append(thread)
+
+    def write(self, data):
+        data = bytes(data)  # shared by all queues, not copied
+        keep, self._first_write = self._first_write, False
+        # Queues with room first, so that waiting for a full queue
+        # does not hold records back from other sinks
+        full = []
+        for queue_ in self._queues:
+            if keep or queue_.has_room(len(data)):
+                queue_.put(data, keep=keep)
+            else:
+                full.append(queue_)
+        for queue_ in full:
+            queue_.put(data)
+
+    def flush(self):
+        pass
+
+    def close(self):
+        if self._closed:
+            return
+        self._closed = True
+        for queue_ in self._queues:
+            queue_.close()
+        for thread in self._threads:
+            thread.join()
+        for sink in self.sinks:
+            sink.close()
+        for error in self._errors:
+            if error is not None:
+                raise error
+
+    def stats(self):
+        """ Queue stats of each sink by its index ("0", "1", ...),
+        see ``overload.RecordQueue.stats``. They are reported by
+        ``Logger.stats()`` under "sinks".
+        """
+        return {str(i): queue_.stats()
+                for i, queue_ in enumerate(self._queues)}
+
+    def _write_loop(self, i):
+        sink, queue_ = self.sinks[i], self._queues[i]
+        while True:
+            batch = queue_.get_batch()
+            if batch is None:
+                return
+            try:
+                if self._errors[i] is None:
+                    sink.write(b''.join(batch))
+                    sink.flush()
+            except Exception as e:
+                self._errors[i] = e
+            finally:
+                queue_.done(batch)
+
+
+def fan_out(*sinks, **kwargs):
+    """ Return a sink factory for ``Logger(sink=...)`` writing to sinks
+    made by each of given sink factories, see ``FanOutSink``
+    for keyword arguments.
+
+    Example:
+        >>> import shutil, tempfile
+        >>> from tensorboard_logger import Logger
+        >>> logdir = tempfile.mkdtemp()
+        >>> logger = Logger(logdir, sink=fan_out(FileSink, CsvSink))
+        >>> logger.log_value('loss', 0.5, step=1)
+        >>> logger.close()
+        >>> sorted(name.split('.')[2] for name in os.listdir(logdir))
+        ['scalars', 'tfevents']
+        >>> shutil.rmtree(logdir)
+    """
+    def factory(path):
+        return FanOutSink([sink(path) for sink in sinks], **kwargs)
+    return factory
+
+
+class CsvSink(object):
+    """ Sink writing scalar values as "wall_time,step,tag,value" rows
+    of a CSV file, named after the event file with "tfevents" replaced
+    by "scalars" and a ".csv" suffix. Other values are skipped.
+    Records are decoded in the thread writing to this sink,
+    so use it with ``fan_out``.
+    """
+    def __init__(self, path):
+        # reader imports tensorboard_logger, which imports this module
+        from .reader import parse_records
+        from .tensorboard_logger import event_pb2
+        self._parse_records = parse_records
+        self._event_pb2 = event_pb2
+        self.path = csv_path(path)
+        dirname = os.path.dirname(self.path)
+        if dirname and not os.path.exists(dirname):
+            os.makedirs(dirname)
+        if six.PY2:
+            self._file = open(self.path, 'wb')
+        else:
+            self._file = open(self.path, 'w', newline='')
+        self._writer = csv.writer(self._file)
+        self._writer.writerow(['wall_time', 'step', 'tag', 'value'])
+
+    def write(self, data):
+        rows = []
+        for _, record in self._parse_records(
+                data, self.path, check_crc=False):
+            event = self._event_pb2.Event.FromString(record)
+            for value in event.summary.value:
+                if value.HasField('simple_value'):
+                    rows.append((repr(event.wall_time), event.step,
+                                 value.tag, repr(value.simple_value)))
+        self._writer.writerows(rows)
+
+    def flush(self):
+        self._file.flush()
+
+    def close(self):
+        self._file.close()
+
+
+def csv_path(path):
+    """ Path of the CSV file written by ``CsvSink`` for an event file path.
+    Its name does not contain "tfevents", so that it is not read as
+    an event file.
+
+    Example:
+        >>> csv_path('run/events.out.tfevents.1500000000.host')
+        'run/events.out.scalars.1500000000.host.csv'
+    """
+    dirname, filename = os.path.split(path)
+    return os.path.join(
+        dirname, filename.replace('tfevents', 'scalars') + '.csv')
+
+
+class LocalDirectoryUploader(object):
+    """ Reference implementation of ``upload_part`` and ``complete``
+    for ``ChunkedUploadSink``, standing in for object storage:
+    parts are written as separate files under ``root``
+    (mirroring event file path) and joined into one file on complete.
+
+    Example:
+        >>> from functools import partial
+        >>> uploader = LocalDirectoryUploader('/tmp/bucket')
+        >>> sink = partial(ChunkedUploadSink,
+        ...                upload_part=uploader.upload_part,
+        ...                complete=uploader.complete)
+        >>> # logger = Logger('runs/run-1', sink=sink)
+    """
+    def __init__(self, root):
+        self.root = root
+
+    def _target(self, path):
+        return os.path.join(self.root, os.path.relpath(path, '/')
+                            if os.path.isabs(path) else path)
+
+    def _part_path(self, path, part_number):
+        return '{}.part{:05d}'.format(self._target(path), part_number)
+
+    def upload_part(self, path, part_number, data):
+        part_path = self._part_path(path, part_number)
+        dirname = os.path.dirname(part_path)
+        try:
+            os.makedirs(dirname)
+        except OSError:
+            if not os.path.isdir(dirname):
+                raise
+        with open(part_path, 'wb') as f:
+            f.write(data)
+
+    def complete(self, path, n_parts):
+        with open(self._target(path), 'wb') as f:
+            for part_number in range(1, n_parts + 1):
+                part_path = self._part_path(path, part_number)
+                with open(part_path, 'rb') as part:
+                    f.write(part.read())
+                os.unlink(part_path)
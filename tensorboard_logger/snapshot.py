@@ -0,0 +1,128 @@
+# -*- coding: utf-8 -*-
+""" Snapshot file with the latest value of every scalar tag,
+for monitoring that only needs current values::
+
+    logger = Logger('runs/run-1234', snapshot_secs=10)
+    ...
+    read_snapshot('runs/run-1234')  # {'loss': (step, wall_time, value), ...}
+
+The file is small and is rewritten atomically, so reading it
+is a single small read, instead of decoding event files.
+
+Layout (little-endian): a header with magic ``b'TBLS'``, format version
+(uint16) and number of tags (uint32), followed for each tag by step (int64),
+wall time (float64), value (float64), tag length (uint16)
+and UTF-8 encoded tag.
+"""
+import os
+import struct
+import threading
+import time
+
+
+SNAPSHOT_NAME = 'latest_values.tbls'
+
+MAGIC = b'TBLS'
+VERSION = 1
+
+_HEADER = struct.Struct('<4sHI')
+_ENTRY = struct.Struct('<qddH')
+
+_replace = getattr(os, 'replace', os.rename)
+
+
+class SnapshotWriter(object):
+    """ Keep the latest value of each scalar tag, and write them
+    to path at most every ``every_secs`` seconds.
+    """
+    def __init__(self, path, every_secs=10):
+        self.path = path
+        self.every_secs = every_secs
+        self._values = {}
+        self._written_at = None
+        self._lock = threading.Lock()
+
+    def update(self, event):
+        """ Update values from scalars of an event,
+        and write the snapshot if it is due.
+        """
+        with self._lock:
+            for value in event.summary.value:
+                if value.HasField('simple_value'):
+                    self._values[value.tag] = (
+                        event.step, event.wall_time, value.simple_value)
+            self._maybe_write()
+
+    def update_value(self, tag, step, wall_time, value):
+        """ Update the value of one tag, e.g. before it is downsampled,
+        and write the snapshot if it is due.
+        """
+        with self._lock:
+            self._values[tag] = (step, wall_time, value)
+            self._maybe_write()
+
+    def _maybe_write(self):
+        now = time.time()
+        if self._written_at is None or \
+                now - self._written_at >= self.every_secs:
+            self._write(now)
+
+    def write(self):
+        with self._lock:
+            self._write(time.time())
+
+    def _write(self, now):
+        self._written_at = now
+        dirname = os.path.dirname(self.path)
+        if dirname and not os.path.exists(dirname):
+            os.makedirs(dirname)
+        tmp = '{}.{}.tmp'.format(self.path, os.getpid())
+        with open(tmp, 'wb') as f:
+            f.write(encode_snapshot(self._values))
+        _replace(tmp, self.path)
+
+
+def encode_snapshot(values):
+    """ Encode a dict of tag -> (step, wall_time, value).
+
+    Example:
+        >>> data = encode_snapshot({'loss': (10, 1500000000.0, 0.5)})
+        >>> len(data), decode_snapshot(data)
+        (40, {'loss': (10, 1500000000.0, 0.5)})
+    """
+    parts = [_HEADER.pack(MAGIC, VERSION, len(values))]
+    for tag, (step, wall_time, value) in sorted(values.items()):
+        tag = tag.encode('utf8')
+        parts.append(_ENTRY.pack(step, wall_time, value, len(tag)))
+        parts.append(tag)
+    return b''.join(parts)
+
+
+def decode_snapshot(data):
+    magic, version, n_tags = _HEADER.unpack_from(data, 0)
+    if magic != MAGIC:
+        raise ValueError('not a snapshot file')
+    if version != VERSION:
+        raise ValueError('unsupported snapshot version {}'.format(version))
+    values = {}
+    offset = _HEADER.size
+    for _ in range(n_tags):
+        step, wall_time, value, tag_length = _ENTRY.unpack_from(data, offset)
+        offset += _ENTRY.size
+        tag = data[offset:offset + tag_length].decode('utf8')
+        offset += tag_length
+        values[tag] = (step, wall_time, value)
+    return values
+
+
+def read_snapshot(path):
+    """ Read latest values written with ``Logger(snapshot_secs=...)``,
+    return a dict of tag -> (step, wall_time, value).
+
+    Args:
+        path (str): snapshot file path, or log directory.
+    """
+    if os.path.isdir(path):
+        path = os.path.join(path, SNAPSHOT_NAME)
+    with open(path, 'rb') as f:
+        return decode_snapshot(f.read())
@@ -0,0 +1,73 @@
+# -*- coding: utf-8 -*-
+from collections import defaultdict
+import time
+
+
+# Tags under this prefix are written by the logger itself and can not be
+# used for user values.
+RESERVED_PREFIX = 'tensorboard_logger/'
+
+perf_counter = getattr(time, 'perf_counter', time.time)
+
+TIMERS = ('summary', 'encode', 'crc', 'io')
+
+
+class LoggerStats(object):
+    """ Cheap counters describing what logging costs.
+    Only updated when instrumentation is enabled on the Logger.
+    """
+    def __init__(self):
+        self.events = 0
+        self.bytes = 0
+        # Values logged, more than events written when downsampling
+        self.values = 0
+        self.tag_events = defaultdict(int)
+        self.tag_bytes = defaultdict(int)
+        self.tag_values = defaultdict(int)
+        self.time = dict.fromkeys(TIMERS, 0.0)
+
+    def add_event(self, tf_name, n_bytes):
+        self.events += 1
+        self.bytes += n_bytes
+        self.tag_events[tf_name] += 1
+        self.tag_bytes[tf_name] += n_bytes
+
+    def add_value(self, tf_name):
+        self.values += 1
+        self.tag_values[tf_name] += 1
+
+    def snapshot(self):
+        return {
+            'events': self.events,
+            'bytes': self.bytes,
+            'values': self.values,
+            'tags': {tf_name: {'events': self.tag_events[tf_name],
+                               'bytes': self.tag_bytes[tf_name],
+                               'values': n_values}
+                     for tf_name, n_values in self.tag_values.items()},
+            'time': dict(self.time),
+        }
+
+
+def stats_values(snapshot, prefix=RESERVED_PREFIX):
+    """ Flatten a ``Logger.stats()`` snapshot into (tag, value) pairs
+    under the reserved prefix, for writing back into the events file.
+    Per-tag counters are skipped, as they would add a tag for each user tag.
+
+    Example:
+        >>> snapshot = {'events': 2, 'bytes': 10, 'queue_depth': 0,
+        ...             'time': {'io': 0.5}, 'tags': {'a': {'events': 2}}}
+        >>> stats_values(snapshot)  # doctest: +NORMALIZE_WHITESPACE
+        [('tensorboard_logger/bytes', 10), ('tensorboard_logger/events', 2),
+         ('tensorboard_logger/queue_depth', 0),
+         ('tensorboard_logger/time/io', 0.5)]
+    """
+    values = []
+    for key, value in sorted(snapshot.items()):
+        if key == 'tags':
+            continue
+        if isinstance(value, dict):
+            values.extend(stats_values(value, '{}{}/'.format(prefix, key)))
+        elif isinstance(value, (int, float)):
+            values.append((prefix + key, value))
+    return values
@@ -1,10 +1,14 @@
 # -*- coding: utf-8 -*-
-from collections import defaultdict
+from collections import defaultdict, deque
+import functools
 import os
 import re
 import socket
 import struct
+import threading
 import time
+import warnings
+import weakref
 import numpy as np
 
 import six
@@ -17,52 +21,352 @@ except ImportError:
 
 try:
     from tensorflow.core.util import event_pb2
-    from tensorflow.core.framework import summary_pb2
+    from tensorflow.core.framework import summary_pb2, tensor_pb2, types_pb2
 except ImportError:
-    from .tf_protobuf import summary_pb2, event_pb2
+    from .tf_protobuf import summary_pb2, event_pb2, tensor_pb2, types_pb2
+from .arrays import (
+    TENSOR_STATS, array_stats, as_array, as_scalar, histogram, tensor_stats)
 from .crc32c import crc32c
+from .flush import AdaptiveFlush
+from . import pr_curve, projector
+from .overload import RecordQueue
+from .resources import ResourceSampler
+from .sinks import FileSink
+from .snapshot import SNAPSHOT_NAME, SnapshotWriter
+from .stats import LoggerStats, RESERVED_PREFIX, perf_counter, stats_values
+from .timer import Timer
 
 
-__all__ = ['Logger', 'configure', 'unconfigure', 'log_value', 'log_histogram', 'log_images']
+__all__ = ['Logger', 'configure', 'unconfigure', 'log_value', 'log_histogram', 'log_images',
+           'log_tensor', 'log_pr_curve', 'log_embedding', 'log_stats']
 
 
 _VALID_OP_NAME_START = re.compile('^[A-Za-z0-9.]')
 _VALID_OP_NAME_PART = re.compile('[A-Za-z0-9_.\\-/]+')
 
+# What to do with values of new names over Logger(max_tags=...)
+TAG_OVERFLOW_POLICIES = ('reject', 'warn', 'fold')
+# Tag of values folded with the "fold" policy
+OVERFLOW_TAG = 'other'
+
+# Kinds of events which can be written to separate files,
+# and the matching Summary.Value field
+SHARD_KINDS = {
+    'histograms': 'histo',
+    'images': 'image',
+    'tensors': 'tensor',
+}
+
+_TENSOR_DTYPES = {
+    np.dtype(np.float16): types_pb2.DT_HALF,
+    np.dtype(np.float32): types_pb2.DT_FLOAT,
+    np.dtype(np.float64): types_pb2.DT_DOUBLE,
+    np.dtype(np.int8): types_pb2.DT_INT8,
+    np.dtype(np.int16): types_pb2.DT_INT16,
+    np.dtype(np.int32): types_pb2.DT_INT32,
+    np.dtype(np.int64): types_pb2.DT_INT64,
+    np.dtype(np.uint8): types_pb2.DT_UINT8,
+    np.dtype(np.uint16): types_pb2.DT_UINT16,
+    np.dtype(np.uint32): types_pb2.DT_UINT32,
+    np.dtype(np.uint64): types_pb2.DT_UINT64,
+    np.dtype(np.bool_): types_pb2.DT_BOOL,
+}
+
 
 class Logger(object):
-    def __init__(self, logdir, flush_secs=2, is_dummy=False, dummy_time=None):
+    # Open the file on the first write instead of on creation, see _reopen
+    _open_lazily = False
+
+    def __init__(self, logdir, flush_secs=2, is_dummy=False, dummy_time=None,
+                 stats=False, stats_secs=None, timer_secs=None, sink=None,
+                 max_pending_bytes=None, max_pending_records=None,
+                 overload='block', overload_timeout=None, downsample=None,
+                 adaptive_flush=None, snapshot_secs=None, resources_secs=None,
+                 resume_step=None, shards=None, max_tags=None,
+                 tag_overflow='warn'):
         self._name_to_tf_name = {}
         self._tf_names = set()
+        # Next suffix to try for each base tf name, see _make_tf_name
+        self._tf_name_suffixes = {}
+        # At most max_tags names are kept, see _overflow_tf_name
+        self.max_tags = max_tags
+        self.tag_overflow = tag_overflow
+        self._overflow = 0
+        self._overflow_warned = False
+        self._fold_tf_names = {}  # by kind of values
+        # Tags found in existing files when resuming, not yet logged again
+        self._resumed_tf_names = set()
+        # Set in a forked child process, see _after_fork
+        self._fork_pid = None
+        # The file is opened on the first write if set, see _reopen
+        self._needs_reopen = False
+        self._names_lock = threading.Lock()
+        # Each thread appends encoded records to its own buffer,
+        # and buffers are written in batches by one thread at a time.
+        self._local = threading.local()
+        self._buffers = []  # (thread, buffer) pairs, replaced on update
+        self._buffers_lock = threading.Lock()
+        self._writer_lock = threading.Lock()
         self.is_dummy = is_dummy
         self.logdir = logdir
         self.flush_secs = flush_secs  # TODO
         self._writer = None
+        self._sink = sink or FileSink
         self._dummy_time = dummy_time
+        self._file_time = int(self._time())  # in event file names
+        # Instrumentation is off unless requested: the only cost
+        # then is a single "is None" check per logged value.
+        self._stats = LoggerStats() if (stats or stats_secs is not None) else None
+        self.stats_secs = stats_secs
+        # Tags under RESERVED_PREFIX are written only with these options
+        self._reserve_prefix = (
+            stats_secs is not None or resources_secs is not None)
+        self._stats_written_at = self._time()
+        self._last_step = None
+        self._timers = {}
+        self.timer_secs = timer_secs
+        self._timers_written_at = self._time()
+        self._downsample = downsample
+        if adaptive_flush is True:
+            adaptive_flush = AdaptiveFlush(max_staleness=flush_secs)
+        self._flush = adaptive_flush
+        # With a memory budget or adaptive flush, records are written by
+        # a background thread, so that a stalled disk does not block logging.
+        self._queue = None
+        self._write_thread = None
+        # Process resource usage is sampled by another background thread
+        self._resources_stop = None
+        self._resources_thread = None
+        self._shards = None
+        self._snapshot = None
+        # Checked once close() can be called by __del__
+        if tag_overflow not in TAG_OVERFLOW_POLICIES:
+            raise ValueError(
+                'unknown tag overflow policy "{}", expected one of {}'.format(
+                    tag_overflow, ', '.join(TAG_OVERFLOW_POLICIES)))
+        if snapshot_secs is not None and not is_dummy:
+            self._snapshot = SnapshotWriter(
+                os.path.join(logdir, SNAPSHOT_NAME), snapshot_secs)
         if is_dummy:
             self.dummy_log = defaultdict(list)
         else:
-            if not os.path.exists(self.logdir):
-                os.makedirs(self.logdir)
-            hostname = socket.gethostname()
-            filename = os.path.join(
-                self.logdir, 'events.out.tfevents.{}.{}'.format(
-                    int(self._time()), hostname))
-            self._writer = open(filename, 'wb')
-            self._write_event(event_pb2.Event(
-                wall_time=self._time(), step=0, file_version='brain.Event:2'))
-
-    def _ensure_tf_name(self, name):
+            if resume_step is not None:
+                self._resumed_tf_names = self._existing_tags()
+                self._tf_names.update(self._resumed_tf_names)
+            if max_pending_bytes is not None or \
+                    max_pending_records is not None or \
+                    adaptive_flush is not None:
+                self._queue = RecordQueue(
+                    max_pending_bytes, max_pending_records,
+                    policy=overload, timeout=overload_timeout)
+            if self._open_lazily:
+                self._needs_reopen = True
+            else:
+                self._writer = self._open_writer(self._event_filename())
+                if self._queue is not None:
+                    self._start_write_thread()
+                self._write_file_version()
+            if shards is not None:
+                self._shards = self._open_shards(shards)
+            if resume_step is not None:
+                # TensorBoard discards events logged before at this step
+                # and later, which were not followed by a checkpoint.
+                start = event_pb2.Event(
+                    wall_time=self._time(), step=int(resume_step),
+                    session_log=event_pb2.SessionLog(
+                        status=event_pb2.SessionLog.START))
+                self._write_event(start, keep=True)
+                for shard in (self._shards or {}).values():
+                    shard._write_event(start, keep=True)
+        self.resources_secs = resources_secs
+        if resources_secs is not None:
+            self._start_resources_thread()
+        if not is_dummy:
+            _loggers.add(self)
+
+    def _start_write_thread(self):
+        self._write_thread = threading.Thread(
+            target=_write_loop,
+            args=(self._queue, weakref.ref(self), self._flush))
+        self._write_thread.daemon = True
+        self._write_thread.start()
+
+    def _start_resources_thread(self):
+        self._resources_stop = threading.Event()
+        self._resources_thread = threading.Thread(
+            target=_resources_loop,
+            args=(self._resources_stop, weakref.ref(self),
+                  ResourceSampler(), self.resources_secs))
+        self._resources_thread.daemon = True
+        self._resources_thread.start()
+
+    def _write_file_version(self):
+        self._write_event(event_pb2.Event(
+            wall_time=self._time(), step=0, file_version='brain.Event:2'),
+            keep=True)
+
+    def _after_fork(self):
+        """ Prepare to continue logging in a forked child process into
+        a new file with the child pid in its name, with new buffers.
+        The file is opened and threads are started only on the first write,
+        see _reopen, so that children which never log create no files.
+        Records pending in the parent process, incomplete downsampling
+        windows and the latest values snapshot are left to the parent.
+        """
+        self._fork_pid = os.getpid()
+        # Locks may have been held by threads which do not exist in the child
+        self._names_lock = threading.Lock()
+        self._local = threading.local()
+        self._buffers = []
+        self._buffers_lock = threading.Lock()
+        self._writer_lock = threading.Lock()
+        if self._stats is not None:
+            self._stats = LoggerStats()
+        if self._downsample is not None:
+            self._downsample.clear()
+        self._snapshot = None
+        # The inherited writer is not closed, and is kept referenced so that
+        # it is not flushed when garbage collected: the parent still uses it
+        if self._writer is not None:
+            _inherited_writers.append(self._writer)
+        self._writer = None
+        if self._queue is not None:
+            queue = self._queue
+            self._queue = RecordQueue(
+                queue.max_bytes, queue.max_records,
+                policy=queue.policy, timeout=queue.timeout)
+        # Threads of the parent do not exist in the child
+        self._write_thread = None
+        self._resources_thread = None
+        self._needs_reopen = True
+
+    def _reopen(self):
+        """ Open the file and start threads before the first record is
+        written: in a forked child process, or for loggers opened lazily.
+        """
+        with self._writer_lock:
+            if not self._needs_reopen:
+                return
+            self._writer = self._open_writer(self._event_filename())
+            # Written directly, so that it is the first record
+            version = event_pb2.Event(
+                wall_time=self._time(), step=0, file_version='brain.Event:2')
+            self._writer.write(make_record(version.SerializeToString()))
+            self._needs_reopen = False
+            if self._queue is not None:
+                self._start_write_thread()
+            if self.resources_secs is not None:
+                self._start_resources_thread()
+
+    def _event_filename(self):
+        filename = 'events.out.tfevents.{}.{}'.format(
+            self._file_time, socket.gethostname())
+        if self._fork_pid is not None:
+            filename = '{}.{}'.format(filename, self._fork_pid)
+        return filename
+
+    def _open_shards(self, shards):
+        """ Return loggers writing histograms, images and tensors
+        to separate files, by Summary.Value field. ``shards`` is True
+        for all kinds, or a dict mapping kinds to Logger buffering options
+        (``max_pending_bytes``, ``overload``, ``adaptive_flush``, etc.)
+        Shard files are opened on the first event of their kind,
+        with ``_open_writer`` of this logger.
+        """
+        if shards is True:
+            shards = {kind: {} for kind in SHARD_KINDS}
+        opened = {}
+        for kind, options in sorted(shards.items()):
+            if kind not in SHARD_KINDS:
+                raise ValueError(
+                    'unknown shard kind "{}", expected one of {}'.format(
+                        kind, ', '.join(sorted(SHARD_KINDS))))
+            options = dict(options)
+            options.setdefault('flush_secs', self.flush_secs)
+            opened[SHARD_KINDS[kind]] = _ShardLogger(
+                kind, self, dummy_time=self._dummy_time, **options)
+        return opened
+
+    def _route(self, event):
+        """ Return the logger writing this event: self, or a shard.
+        """
+        if event.summary.value:
+            return self._shards.get(
+                event.summary.value[0].WhichOneof('value'), self)
+        return self
+
+    def _existing_tags(self):
+        """ Return tags logged in existing event files of logdir,
+        except reserved ones.
+        """
+        from .reader import is_event_file, scan_tags  # reader imports us
+        tags = set()
+        if os.path.isdir(self.logdir):
+            for filename in os.listdir(self.logdir):
+                if is_event_file(filename):
+                    tags.update(scan_tags(os.path.join(self.logdir, filename)))
+        return set(tag for tag in tags if not tag.startswith(RESERVED_PREFIX))
+
+    def _open_writer(self, filename):
+        """ Return a sink (see ``tensorboard_logger.sinks``)
+        that event records will be written to.
+        """
+        return self._sink(os.path.join(self.logdir, filename))
+
+    def _ensure_tf_name(self, name, kind='scalars'):
         if not isinstance(name, six.string_types):
             raise TypeError('"name" should be a string, got {}'
                             .format(type(name)))
         try:
-            tf_name = self._name_to_tf_name[name]
+            return self._name_to_tf_name[name]
         except KeyError:
-            tf_name = self._make_tf_name(name)
-            self._name_to_tf_name[name] = tf_name
+            pass
+        if self._reserve_prefix and name.startswith(RESERVED_PREFIX):
+            raise ValueError('"{}" prefix is reserved for logger stats'
+                             .format(RESERVED_PREFIX))
+        with self._names_lock:
+            try:
+                tf_name = self._name_to_tf_name[name]
+            except KeyError:
+                if (self.max_tags is not None and
+                        len(self._name_to_tf_name) >= self.max_tags):
+                    return self._overflow_tf_name(name, kind)
+                tf_name = self._make_tf_name(name)
+                self._name_to_tf_name[name] = tf_name
         return tf_name
 
+    def _overflow_tf_name(self, name, kind):
+        """ Return the tf name for a new name of given kind ("scalars",
+        "histograms", etc.) when there are already max_tags names:
+        None if the value is dropped ("warn" policy), or with the "fold"
+        policy the tf name of the "other" tag for scalars,
+        and of "other/<kind>" for other kinds.
+        Embeddings are dropped even when folding, as they would
+        overwrite each other's files.
+        Overflowing names are not kept, so memory stays bounded.
+        """
+        self._overflow += 1
+        if self.tag_overflow == 'reject':
+            raise ValueError(
+                'can not log "{}": {} names were already logged (max_tags)'
+                .format(name, self.max_tags))
+        if self.tag_overflow == 'fold' and kind != 'embeddings':
+            try:
+                return self._fold_tf_names[kind]
+            except KeyError:
+                tag = (OVERFLOW_TAG if kind == 'scalars' else
+                       '{}/{}'.format(OVERFLOW_TAG, kind))
+                tf_name = self._fold_tf_names[kind] = self._make_tf_name(tag)
+                return tf_name
+        if not self._overflow_warned:
+            self._overflow_warned = True
+            warnings.warn(
+                'more than {} names logged (max_tags): {} of new '
+                'names are dropped, starting with "{}"'.format(
+                    self.max_tags,
+                    'values' if self.tag_overflow == 'warn' else kind, name))
+        return None
+
     def _check_step(self, step):
         if step is not None and not isinstance(step, six.integer_types):
             raise TypeError('"step" should be an integer, got {}'
@@ -74,7 +378,9 @@ class Logger(object):
         Args:
             name (str): name of the variable (it will be converted to a valid
                 tensorflow summary name).
-            value (float): this is a real number to be logged as a scalar.
+            value (float): this is a real number to be logged as a scalar
+                (a NumPy scalar or a one-element array or tensor
+                is also accepted).
             step (int): non-negative integer used for visualization: you can
                 log several different variables on one step, but should not log
                 different values of the same variable on the same step (this is
@@ -83,13 +389,23 @@ class Logger(object):
         if isinstance(value, six.string_types):
             raise TypeError('"value" should be a number, got {}'
                             .format(type(value)))
-        value = float(value)
+        value = as_scalar(value)
 
         self._check_step(step)
         tf_name = self._ensure_tf_name(name)
 
-        summary = self._scalar_summary(tf_name, value, step)
-        self._log_summary(tf_name, summary, value, step=step)
+        if (self._downsample is not None and step is not None and
+                tf_name is not None and self._downsample.matches(tf_name)):
+            # Counted and kept as the latest value even if not written
+            now = self._time()
+            if self._stats is not None:
+                self._stats.add_value(tf_name)
+            if self._snapshot is not None:
+                self._snapshot.update_value(tf_name, step, now, value)
+            self._log_points(tf_name, self._downsample.add(
+                tf_name, step, value, now))
+        else:
+            self._log(tf_name, self._scalar_summary, value, step)
 
     def log_histogram(self, name, value, step=None):
         """Log a histogram for given name on given step.
@@ -97,7 +413,8 @@ class Logger(object):
         Args:
             name (str): name of the variable (it will be converted to a valid
                 tensorflow summary name).
-            value (tuple or list): either list of numbers
+            value (tuple or list): either list of numbers (or an array-like:
+                NumPy array, tensor, memoryview; it is not copied)
                 to be summarized as a histogram, or a tuple of bin_edges and
                 bincounts that directly define a histogram.
             step (int): non-negative integer used for visualization
@@ -107,10 +424,29 @@ class Logger(object):
                             .format(type(value)))
 
         self._check_step(step)
-        tf_name = self._ensure_tf_name(name)
+        tf_name = self._ensure_tf_name(name, 'histograms')
+
+        self._log(tf_name, self._histogram_summary, value, step)
+
+    def log_stats(self, name, value, step=None, stats=TENSOR_STATS):
+        """Log statistics of an array as scalars under "<name>/<stat>" tags,
+        all in one summary. They are computed in one chunked pass over the
+        array, which is not copied, so memory used does not grow with
+        its size.
 
-        summary = self._histogram_summary(tf_name, value, step=step)
-        self._log_summary(tf_name, summary, value, step=step)
+        Args:
+            name (str): name of the variable (it will be converted to a valid
+                tensorflow summary name).
+            value: array-like (NumPy array, tensor, memoryview).
+            step (int): non-negative integer used for visualization.
+            stats (tuple): statistics to log, some of "mean", "std", "min",
+                "max", "l2_norm" (computed over finite values),
+                "zero_fraction" and "nonfinite_fraction".
+        """
+        self._check_step(step)
+        tf_name = self._ensure_tf_name(name, 'stats')
+        values = tensor_stats(as_array(value), stats)
+        self._log(tf_name, self._scalars_summary, values, step)
 
     def log_images(self, name, images, step=None):
         """Log new images for given name on given step.
@@ -118,7 +454,7 @@ class Logger(object):
         Args:
             name (str): name of the variable (it will be converted to a valid
                 tensorflow summary name).
-            images (list): list of images to visualize
+            images (list): list of images (array-likes) to visualize
             step (int): non-negative integer used for visualization
         """
         if isinstance(images, six.string_types):
@@ -126,10 +462,157 @@ class Logger(object):
                             .format(type(images)))
 
         self._check_step(step)
-        tf_name = self._ensure_tf_name(name)
+        tf_name = self._ensure_tf_name(name, 'images')
+
+        self._log(tf_name, self._image_summary, images, step)
+
+    def log_tensor(self, name, value, step=None, plugin_name=None,
+                   plugin_content=b''):
+        """Log a tensor-valued summary for given name on given step,
+        e.g. for a custom TensorBoard plugin.
+
+        Args:
+            name (str): name of the variable (it will be converted to a valid
+                tensorflow summary name).
+            value: numeric array-like (not a string).
+            step (int): non-negative integer used for visualization
+            plugin_name (str): name of TensorBoard plugin for this summary.
+            plugin_content (bytes): plugin-specific metadata.
+        """
+        if isinstance(value, six.string_types):
+            raise TypeError('"value" should be an array, got {}'
+                            .format(type(value)))
+
+        self._check_step(step)
+        tf_name = self._ensure_tf_name(name, 'tensors')
+
+        make_summary = functools.partial(
+            self._tensor_summary, plugin_name=plugin_name,
+            plugin_content=plugin_content)
+        self._log(tf_name, make_summary, value, step)
+
+    def log_pr_curve(self, name, labels, predictions, num_thresholds=201,
+                     step=None, weights=None):
+        """Log a precision-recall curve for given name on given step,
+        shown by the TensorBoard PR curves plugin.
+        Counts for all thresholds are computed in one vectorized pass,
+        see ``tensorboard_logger.pr_curve.compute_pr_curve``.
+
+        Args:
+            name (str): name of the variable (it will be converted to a valid
+                tensorflow summary name).
+            labels: boolean array-like of ground truth labels.
+            predictions: array-like of probabilities in [0, 1],
+                of the same size as labels.
+            num_thresholds (int): number of thresholds, evenly spaced
+                from 0 to 1.
+            step (int): non-negative integer used for visualization
+            weights: optional array-like of per-example weights.
+        """
+        self._check_step(step)
+        tf_name = self._ensure_tf_name(name, 'pr_curves')
+
+        data = pr_curve.compute_pr_curve(
+            labels, predictions, num_thresholds=num_thresholds,
+            weights=weights)
+        make_summary = functools.partial(
+            self._tensor_summary, plugin_name=pr_curve.PLUGIN_NAME,
+            plugin_content=pr_curve.plugin_content(num_thresholds))
+        self._log(tf_name, make_summary, data, step)
+
+    def log_embedding(self, name, matrix, metadata=None, step=None,
+                      max_rows=None, sample='random', metadata_header=None):
+        """Export an embedding matrix for the TensorBoard projector:
+        tensor and metadata files are written under logdir, and the
+        embedding is added to "projector_config.pbtxt".
+        The matrix is streamed in chunks, so it can be a ``np.memmap``
+        larger than memory.
+
+        Args:
+            name (str): name of the embedding (it will be converted to a
+                valid tensorflow summary name).
+            matrix: 2d array-like of shape (n_rows, n_dims).
+            metadata: optional labels for each row: a sequence of values,
+                or of tuples of values if there are several columns.
+            step (int): non-negative integer used for visualization
+            max_rows (int): write only a subsample of this many rows,
+                if there are more (the projector gets slow above
+                ``projector.PROJECTOR_MAX_ROWS`` rows).
+            sample (str): subsampling method: "random" or "stratified"
+                (keeps proportions of labels from the first metadata column).
+            metadata_header (list): column names, required if metadata
+                has several columns.
+        """
+        self._check_step(step)
+        tf_name = self._ensure_tf_name(name, 'embeddings')
+        if tf_name is None:
+            return
+
+        if self.is_dummy:
+            self.dummy_log[tf_name].append((step, matrix))
+            return
+        projector.write_embedding(
+            self.logdir, tf_name, matrix, metadata=metadata, step=step,
+            max_rows=max_rows, sample=sample, metadata_header=metadata_header)
+
+    def timer(self, name, every=1):
+        """Return a timer for given name, usable as a context manager
+        or as a decorator::
+
+            with logger.timer('data'):
+                batch = next(loader)
+
+            @logger.timer('forward', every=10)
+            def forward(batch):
+                ...
+
+        Timings are accumulated in memory, and written only by
+        ``log_timers`` (or every ``timer_secs`` if set on the logger)
+        as mean and max time in seconds and call count,
+        under "<name>/mean", "<name>/max" and "<name>/count".
+
+        Args:
+            name (str): name of the timer (it will be converted to a valid
+                tensorflow summary name).
+            every (int): measure only one of every ``every`` calls,
+                to time hot loops with negligible overhead. It can not
+                change for an existing timer: ``ValueError`` is raised.
+        """
+        # Timers are kept by tf name, so that names over max_tags
+        # share a timer (or None for dropped ones) instead of adding one
+        tf_name = self._ensure_tf_name(name, 'timers')
+        try:
+            timer = self._timers[tf_name]
+        except KeyError:
+            on_exit = (self._maybe_log_timers
+                       if self.timer_secs is not None else None)
+            timer = Timer(tf_name, every=every, on_exit=on_exit)
+            timer = self._timers.setdefault(tf_name, timer)
+        # Shared timers of names over max_tags are not checked
+        if timer.every != every and name in self._name_to_tf_name:
+            raise ValueError(
+                'timer "{}" already exists with every={}, got every={}'
+                .format(name, timer.every, every))
+        return timer
 
-        summary = self._image_summary(tf_name, images, step=step)
-        self._log_summary(tf_name, summary, images, step=step)
+    def log_timers(self, step=None):
+        """Log aggregated timings of all timers called since the previous
+        call, and reset them.
+
+        Args:
+            step (int): non-negative integer used for visualization
+        """
+        self._check_step(step)
+        self._timers_written_at = self._time()
+        for timer in list(self._timers.values()):
+            aggregates = timer.pop_aggregates()
+            if aggregates is not None:
+                self._log(timer.tf_name, self._scalars_summary,
+                          aggregates, step)
+
+    def _maybe_log_timers(self):
+        if self._time() - self._timers_written_at >= self.timer_secs:
+            self.log_timers(self._last_step)
 
     def _image_summary(self, tf_name, images, step=None):
         """
@@ -149,6 +632,7 @@ class Logger(object):
         """
         img_summaries = []
         for i, img in enumerate(images):
+            img = as_array(img)
             # Write the image to a string
             try:
                 s = StringIO()
@@ -204,16 +688,20 @@ class Logger(object):
             hist.min = float(min(bin_edges))
             hist.max = float(max(bin_edges))
         else:
-            values = np.array(value)
-
-            bincounts, bin_edges = np.histogram(values)
+            values = as_array(value)
+            # Values are not copied: stats and histogram are computed in
+            # chunks, converting dtypes like float16 one chunk at a time.
+            min_, max_, num, sum_, sum_squares = array_stats(values)
+            if not num:
+                raise ValueError('can not log a histogram of empty array')
+            bincounts, bin_edges = histogram(values, value_range=(min_, max_))
 
             hist = summary_pb2.HistogramProto()
-            hist.min = float(np.min(values))
-            hist.max = float(np.max(values))
-            hist.num = int(np.prod(values.shape))
-            hist.sum = float(np.sum(values))
-            hist.sum_squares = float(np.sum(values**2))
+            hist.min = min_
+            hist.max = max_
+            hist.num = num
+            hist.sum = sum_
+            hist.sum_squares = sum_squares
 
         # Add bin edges and counts
         for edge in bin_edges[1:]:
@@ -230,41 +718,447 @@ class Logger(object):
         summary.value.add(tag=tf_name, simple_value=value)
         return summary
 
+    def _tensor_summary(self, tf_name, value, step=None, plugin_name=None,
+                        plugin_content=b''):
+        """
+        Example:
+            >>> self = Logger(None, is_dummy=True)
+            >>> summary = self._tensor_summary('foo', [[1, 2], [3, 4]])
+            >>> [d.size for d in summary.value[0].tensor.tensor_shape.dim]
+            [2, 2]
+        """
+        summary = summary_pb2.Summary()
+        summary_value = summary.value.add(
+            tag=tf_name, tensor=make_tensor_proto(value))
+        if plugin_name is not None:
+            plugin_data = summary_value.metadata.plugin_data
+            plugin_data.plugin_name = plugin_name
+            plugin_data.content = plugin_content
+        return summary
+
+    def _scalars_summary(self, tf_name, values, step=None):
+        """ Several scalars in one summary: values is a list of
+        (suffix, value) pairs, logged under "<tf_name>/<suffix>" tags.
+        """
+        summary = summary_pb2.Summary()
+        for suffix, value in values:
+            summary.value.add(tag='{}/{}'.format(tf_name, suffix),
+                              simple_value=value)
+        return summary
+
     def _make_tf_name(self, name):
         tf_base_name = tf_name = make_valid_tf_name(name)
-        i = 1
+        # Suffixes taken before are not tried again, so that many names
+        # with the same base name do not take quadratic time.
+        i = self._tf_name_suffixes.get(tf_base_name, 1)
         while tf_name in self._tf_names:
+            if tf_name in self._resumed_tf_names:
+                # Names get the same tags as before resuming if they are
+                # first logged in the same order.
+                self._resumed_tf_names.remove(tf_name)
+                break
             tf_name = '{}/{}'.format(tf_base_name, i)
             i += 1
-        self._tf_names.add(tf_name)
+        else:
+            self._tf_names.add(tf_name)
+        self._tf_name_suffixes[tf_base_name] = i
         return tf_name
 
+    def _log(self, tf_name, make_summary, value, step):
+        # A single branch on the fast path. tf_name is None
+        # for values dropped over max_tags, see _overflow_tf_name.
+        if self._stats is None and tf_name is not None:
+            summary = make_summary(tf_name, value, step=step)
+            self._log_summary(tf_name, summary, value, step=step)
+        elif tf_name is not None:
+            self._log_instrumented(tf_name, make_summary, value, step)
+
     def _log_summary(self, tf_name, summary, value, step=None):
         event = event_pb2.Event(wall_time=self._time(), summary=summary)
         if step is not None:
-            event.step = int(step)
+            event.step = self._last_step = int(step)
         if self.is_dummy:
             self.dummy_log[tf_name].append((step, value))
         else:
             self._write_event(event)
 
-    def _write_event(self, event):
-        data = event.SerializeToString()
-        # See RecordWriter::WriteRecord from record_writer.cc
-        w = self._writer.write
-        header = struct.pack('Q', len(data))
-        w(header)
-        w(struct.pack('I', masked_crc32c(header)))
-        w(data)
-        w(struct.pack('I', masked_crc32c(data)))
+    def _log_points(self, tf_name, points):
+        """ Log (step, value, wall_time) scalar points kept by downsampling.
+        """
+        for step, value, wall_time in points:
+            self._last_step = step
+            n_bytes = 0
+            if self.is_dummy:
+                self.dummy_log[tf_name].append((step, value))
+            else:
+                # Points may be older than the latest value in the snapshot
+                n_bytes = self._write_event(event_pb2.Event(
+                    wall_time=wall_time, step=step,
+                    summary=self._scalar_summary(tf_name, value, step=step)),
+                    snapshot=False)
+            if self._stats is not None:
+                self._stats.add_event(tf_name, n_bytes)
+
+    def _write_event(self, event, keep=False, snapshot=True):
+        """ Write an event and return the size of its record. keep is True
+        for the first events of a file, which are never dropped by the
+        overload policy, snapshot is False not to update latest values.
+        """
+        if snapshot and self._snapshot is not None:
+            self._snapshot.update(event)
+        logger = self if self._shards is None else self._route(event)
+        record = make_record(event.SerializeToString())
+        logger._write_record(record,
+                             scalar=logger._queue is None or _is_scalar(event),
+                             keep=keep)
+        return len(record)
+
+    def _write_record(self, record, scalar=True, keep=False):
+        if self._needs_reopen:
+            self._reopen()
+        if self._queue is None:
+            self._thread_buffer().append(record)
+            self._write_buffers()
+        else:
+            self._queue.put(record, scalar, keep)
+
+    def _thread_buffer(self):
+        try:
+            return self._local.buffer
+        except AttributeError:
+            buffer = self._local.buffer = deque()
+            current = threading.current_thread()
+            with self._buffers_lock:
+                # Drop drained buffers of finished threads
+                self._buffers = [
+                    (thread, b) for thread, b in self._buffers
+                    if b or thread.is_alive()] + [(current, buffer)]
+            return buffer
+
+    def _has_pending(self):
+        return any(buffer for _, buffer in self._buffers)
+
+    def _write_buffers(self, block=False):
+        """ Write records from all thread buffers in one batch.
+        If another thread is writing, leave records to it, unless block
+        is True: the writing thread checks for new records after it is
+        done, so every record is written without waiting for the lock.
+        """
+        while self._writer_lock.acquire(block):
+            try:
+                records = []
+                for _, buffer in self._buffers:
+                    try:
+                        while True:
+                            records.append(buffer.popleft())
+                    except IndexError:
+                        pass
+                if records:
+                    self._write_batch(b''.join(records))
+            finally:
+                self._writer_lock.release()
+            if not self._has_pending():
+                break
+
+    def _write_batch(self, data):
+        self._writer.write(data)
         self._writer.flush()
 
+    def _log_instrumented(self, tf_name, make_summary, value, step):
+        stats = self._stats
+        timers = stats.time
+        t0 = perf_counter()
+        summary = make_summary(tf_name, value, step=step)
+        event = event_pb2.Event(wall_time=self._time(), summary=summary)
+        if step is not None:
+            event.step = self._last_step = int(step)
+        t1 = perf_counter()
+        timers['summary'] += t1 - t0
+        if self.is_dummy:
+            self.dummy_log[tf_name].append((step, value))
+            stats.add_event(tf_name, 0)
+            stats.add_value(tf_name)
+        else:
+            if self._snapshot is not None:
+                self._snapshot.update(event)
+            data = event.SerializeToString()
+            t2 = perf_counter()
+            timers['encode'] += t2 - t1
+            record = make_record(data)
+            t3 = perf_counter()
+            timers['crc'] += t3 - t2
+            logger = self if self._shards is None else self._route(event)
+            logger._write_record(
+                record, scalar=logger._queue is None or _is_scalar(event))
+            timers['io'] += perf_counter() - t3
+            stats.add_event(tf_name, len(record))
+            stats.add_value(tf_name)
+        if (self.stats_secs is not None and
+                self._time() - self._stats_written_at >= self.stats_secs):
+            self._write_stats()
+
+    def stats(self):
+        """ Return a snapshot of logger counters as a dict.
+
+        "queue_depth" is always present. With a memory budget, there are
+        also "queue_bytes", "dropped", "dropped_bytes" and "dropped_scalars".
+        When the logger was created with ``stats=True`` (or ``stats_secs``),
+        there are also total and per-tag "events" and "bytes" written,
+        "values" logged (more than events when downsampling), and seconds
+        spent in "time" building summaries, encoding events, computing CRCs
+        and doing I/O. With ``max_tags``, "cardinality" has the number
+        of "tags" (names) logged and of values of new names "overflow".
+        With a sink which has its own queues (see ``sinks.fan_out``),
+        "sinks" has their stats.
+        """
+        snapshot = {
+            'queue_depth': sum(len(buffer) for _, buffer in self._buffers),
+        }
+        if self._queue is not None:
+            snapshot.update(self._queue.stats())
+        if self._flush is not None:
+            snapshot['flush'] = self._flush.stats()
+        if self.max_tags is not None:
+            snapshot['cardinality'] = {
+                'tags': len(self._name_to_tf_name),
+                'max_tags': self.max_tags,
+                'overflow': self._overflow,
+            }
+        sink_stats = getattr(self._writer, 'stats', None)
+        if sink_stats is not None:
+            snapshot['sinks'] = sink_stats()
+        if self._shards is not None:
+            snapshot['shards'] = {
+                shard._kind: shard.stats() for shard in self._shards.values()}
+        if self._stats is not None:
+            snapshot.update(self._stats.snapshot())
+        return snapshot
+
+    def _write_stats(self):
+        """ Write current stats as a single summary under the reserved
+        "tensorboard_logger/" prefix. These events are not counted in stats.
+        """
+        self._stats_written_at = self._time()
+        self._write_reserved(stats_values(self.stats()))
+
+    def _write_reserved(self, values):
+        """ Write (tag, value) pairs with reserved tags as a single summary
+        at the last step.
+        """
+        if self.is_dummy:
+            for tag, value in values:
+                self.dummy_log[tag].append((self._last_step, value))
+            return
+        summary = summary_pb2.Summary()
+        for tag, value in values:
+            summary.value.add(tag=tag, simple_value=value)
+        event = event_pb2.Event(wall_time=self._time(), summary=summary)
+        if self._last_step is not None:
+            event.step = self._last_step
+        self._write_event(event)
+
     def _time(self):
         return self._dummy_time or time.time()
 
-    def __del__(self):
+    def close(self):
+        """ Flush and close the events file. The logger can not be used
+        after it is closed.
+        """
+        if self._resources_thread is not None:
+            self._resources_stop.set()
+            if self._resources_thread is not threading.current_thread():
+                self._resources_thread.join()
+            self._resources_thread = None
+        if self._downsample is not None:
+            for tf_name, points in self._downsample.pop_all():
+                self._log_points(tf_name, points)
         if self._writer is not None:
+            if self._queue is not None:
+                self._queue.close()
+                if self._write_thread is not threading.current_thread():
+                    self._write_thread.join()
+                # Left only if closed from the writing thread itself
+                _write_queued(self._queue, self)
+            self._write_buffers(block=True)
             self._writer.close()
+            if self._snapshot is not None:
+                self._snapshot.write()
+            self._writer = None
+        # Shards are closed even if a forked child only wrote to them
+        for shard in (self._shards or {}).values():
+            shard.close()
+        # A forked child which did not log leaves no file
+        self._needs_reopen = False
+
+    def __del__(self):
+        self.close()
+
+
+class _ShardLogger(Logger):
+    """ Logger writing one kind of events of a sharded logger,
+    with its own file, buffers and flush policy. The file is opened
+    on the first event, and written like the owner's file
+    (e.g. sent to a collector by RemoteLogger), unless a sink is given.
+    """
+    _open_lazily = True
+
+    def __init__(self, kind, owner, **kwargs):
+        self._kind = kind
+        # Not to keep the owner alive, as it is closed when collected
+        self._owner = weakref.ref(owner)
+        self._own_sink = kwargs.get('sink') is not None
+        # Batches are written as by the owner, e.g. without a flush
+        self._owner_write_batch = type(owner)._write_batch
+        super(_ShardLogger, self).__init__(owner.logdir, **kwargs)
+        self._file_time = owner._file_time
+
+    def _event_filename(self):
+        return '{}.{}'.format(
+            super(_ShardLogger, self)._event_filename(), self._kind)
+
+    def _open_writer(self, filename):
+        if self._own_sink:
+            return super(_ShardLogger, self)._open_writer(filename)
+        return self._owner()._open_writer(filename)
+
+    def _write_batch(self, data):
+        self._owner_write_batch(self, data)
+
+
+# Loggers with an open file, to reopen in forked child processes
+# on their first write
+_loggers = weakref.WeakSet()
+# Loggers not writing while the process forks
+_fork_locked = []
+# Writers of the parent process, never flushed or closed in the child
+_inherited_writers = []
+
+
+def _before_fork():
+    # Records still buffered by a writer would be written again
+    # by the child, so they are flushed and writing waits for the fork.
+    for logger in list(_loggers):
+        if logger._writer is not None:
+            logger._writer_lock.acquire()
+            _fork_locked.append(logger)
+            try:
+                logger._writer.flush()
+            except (IOError, OSError):
+                pass  # raised again on the next write
+
+
+def _after_fork_in_parent():
+    for logger in _fork_locked:
+        logger._writer_lock.release()
+    del _fork_locked[:]
+
+
+def _after_fork():
+    del _fork_locked[:]  # locks are replaced in the child
+    for logger in list(_loggers):
+        if logger._writer is not None or logger._needs_reopen:
+            logger._after_fork()
+
+
+if hasattr(os, 'register_at_fork'):  # Python 3.7+
+    os.register_at_fork(before=_before_fork,
+                        after_in_parent=_after_fork_in_parent,
+                        after_in_child=_after_fork)
+
+
+def _is_scalar(event):
+    return all(value.HasField('simple_value')
+               for value in event.summary.value)
+
+
+def _write_loop(queue, logger_ref, flush=None):
+    """ Write records from the queue of a logger with a memory budget or
+    adaptive flush, until it is closed. Only a weak reference to the logger
+    is kept while waiting, so that it is closed when it is garbage collected.
+    """
+    while True:
+        if flush is None:
+            batch = queue.get_batch()
+        else:
+            batch = queue.get_batch(
+                min_bytes=flush.batch_bytes, max_wait=flush.interval)
+        if batch is None:
+            return
+        logger = logger_ref()
+        if logger is None:
+            return
+        data = b''.join(batch)
+        t0 = perf_counter()
+        try:
+            with logger._writer_lock:  # not to fork while writing
+                logger._write_batch(data)
+        finally:
+            queue.done(batch)
+        if flush is not None:
+            now = time.time()
+            flush.update(len(data), perf_counter() - t0,
+                         staleness=now - queue.batch_queued_at, now=now)
+        del logger
+
+
+def _resources_loop(stop, logger_ref, sampler, interval):
+    """ Log resource usage of the process every interval seconds
+    under "tensorboard_logger/resources/", until stop is set.
+    """
+    sampler.sample()
+    while not stop.wait(interval):
+        logger = logger_ref()
+        if logger is None:
+            return
+        values = sampler.sample()
+        if values:
+            logger._write_reserved([
+                ('{}resources/{}'.format(RESERVED_PREFIX, name), value)
+                for name, value in values])
+        del logger
+
+
+def _write_queued(queue, logger):
+    while True:
+        batch = queue.get_batch(block=False)
+        if not batch:
+            return
+        try:
+            logger._write_batch(b''.join(batch))
+        finally:
+            queue.done(batch)
+
+
+def make_tensor_proto(value):
+    """ Make a TensorProto from a numeric array-like,
+    with little-endian raw tensor content.
+    """
+    array = as_array(value)
+    try:
+        dtype = _TENSOR_DTYPES[array.dtype.newbyteorder('=')]
+    except KeyError:
+        raise TypeError('unsupported tensor dtype {}'.format(array.dtype))
+    tensor = tensor_pb2.TensorProto(
+        dtype=dtype,
+        tensor_content=np.ascontiguousarray(
+            array, dtype=array.dtype.newbyteorder('<')).tobytes())
+    for size in array.shape:
+        tensor.tensor_shape.dim.add(size=size)
+    return tensor
+
+
+def make_record(data):
+    """ Frame serialized event data as a TFRecord:
+    length, masked CRC of length, data, masked CRC of data.
+    See RecordWriter::WriteRecord from record_writer.cc
+    """
+    header = struct.pack('Q', len(data))
+    return b''.join([
+        header,
+        struct.pack('I', masked_crc32c(header)),
+        data,
+        struct.pack('I', masked_crc32c(data)),
+    ])
 
 
 def masked_crc32c(data):
@@ -323,4 +1217,29 @@ def log_images(name, images, step=None):
     _check_default_logger()
     _default_logger.log_images(name, images, step=step)
 
+
+def log_stats(name, value, step=None, stats=TENSOR_STATS):
+    _check_default_logger()
+    _default_logger.log_stats(name, value, step=step, stats=stats)
+
+def log_tensor(name, value, step=None, plugin_name=None, plugin_content=b''):
+    _check_default_logger()
+    _default_logger.log_tensor(name, value, step=step, plugin_name=plugin_name,
+                               plugin_content=plugin_content)
+
+
+def log_pr_curve(name, labels, predictions, num_thresholds=201, step=None,
+                 weights=None):
+    _check_default_logger()
+    _default_logger.log_pr_curve(name, labels, predictions,
+                                 num_thresholds=num_thresholds, step=step,
+                                 weights=weights)
+
+def log_embedding(name, matrix, metadata=None, step=None, max_rows=None,
+                  sample='random', metadata_header=None):
+    _check_default_logger()
+    _default_logger.log_embedding(name, matrix, metadata=metadata, step=step,
+                                  max_rows=max_rows, sample=sample,
+                                  metadata_header=metadata_header)
+
 log_value.__doc__ = Logger.log_value.__doc__
@@ -1,386 +1,43 @@
+# -*- coding: utf-8 -*-
 # Generated by the protocol buffer compiler.  DO NOT EDIT!
 # source: tensorboard_logger/tf_protobuf/summary.proto
-
-import sys
-_b=sys.version_info[0]<3 and (lambda x:x) or (lambda x:x.encode('latin1'))
+"""Generated protocol buffer code."""
+from google.protobuf.internal import builder as _builder
 from google.protobuf import descriptor as _descriptor
-from google.protobuf import message as _message
-from google.protobuf import reflection as _reflection
+from google.protobuf import descriptor_pool as _descriptor_pool
 from google.protobuf import symbol_database as _symbol_database
-from google.protobuf import descriptor_pb2
 # @@protoc_insertion_point(imports)
 
 _sym_db = _symbol_database.Default()
 
 
-
-
-DESCRIPTOR = _descriptor.FileDescriptor(
-  name='tensorboard_logger/tf_protobuf/summary.proto',
-  package='tensorflow',
-  syntax='proto3',
-  serialized_pb=_b('\n,tensorboard_logger/tf_protobuf/summary.proto\x12\ntensorflow\"\x87\x01\n\x0eHistogramProto\x12\x0b\n\x03min\x18\x01 \x01(\x01\x12\x0b\n\x03max\x18\x02 \x01(\x01\x12\x0b\n\x03num\x18\x03 \x01(\x01\x12\x0b\n\x03sum\x18\x04 \x01(\x01\x12\x13\n\x0bsum_squares\x18\x05 \x01(\x01\x12\x18\n\x0c\x62ucket_limit\x18\x06 \x03(\x01\x42\x02\x10\x01\x12\x12\n\x06\x62ucket\x18\x07 \x03(\x01\x42\x02\x10\x01\"\x84\x04\n\x07Summary\x12(\n\x05value\x18\x01 \x03(\x0b\x32\x19.tensorflow.Summary.Value\x1aX\n\x05Image\x12\x0e\n\x06height\x18\x01 \x01(\x05\x12\r\n\x05width\x18\x02 \x01(\x05\x12\x12\n\ncolorspace\x18\x03 \x01(\x05\x12\x1c\n\x14\x65ncoded_image_string\x18\x04 \x01(\x0c\x1a}\n\x05\x41udio\x12\x13\n\x0bsample_rate\x18\x01 \x01(\x02\x12\x14\n\x0cnum_channels\x18\x02 \x01(\x03\x12\x15\n\rlength_frames\x18\x03 \x01(\x03\x12\x1c\n\x14\x65ncoded_audio_string\x18\x04 \x01(\x0c\x12\x14\n\x0c\x63ontent_type\x18\x05 \x01(\t\x1a\xf5\x01\n\x05Value\x12\x11\n\tnode_name\x18\x07 \x01(\t\x12\x0b\n\x03tag\x18\x01 \x01(\t\x12\x16\n\x0csimple_value\x18\x02 \x01(\x02H\x00\x12&\n\x1cobsolete_old_style_histogram\x18\x03 \x01(\x0cH\x00\x12*\n\x05image\x18\x04 \x01(\x0b\x32\x19.tensorflow.Summary.ImageH\x00\x12+\n\x05histo\x18\x05 \x01(\x0b\x32\x1a.tensorflow.HistogramProtoH\x00\x12*\n\x05\x61udio\x18\x06 \x01(\x0b\x32\x19.tensorflow.Summary.AudioH\x00\x42\x07\n\x05valueB\x03\xf8\x01\x01\x62\x06proto3')
-)
-_sym_db.RegisterFileDescriptor(DESCRIPTOR)
-
-
-
-
-_HISTOGRAMPROTO = _descriptor.Descriptor(
-  name='HistogramProto',
-  full_name='tensorflow.HistogramProto',
-  filename=None,
-  file=DESCRIPTOR,
-  containing_type=None,
-  fields=[
-    _descriptor.FieldDescriptor(
-      name='min', full_name='tensorflow.HistogramProto.min', index=0,
-      number=1, type=1, cpp_type=5, label=1,
-      has_default_value=False, default_value=float(0),
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      options=None),
-    _descriptor.FieldDescriptor(
-      name='max', full_name='tensorflow.HistogramProto.max', index=1,
-      number=2, type=1, cpp_type=5, label=1,
-      has_default_value=False, default_value=float(0),
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      options=None),
-    _descriptor.FieldDescriptor(
-      name='num', full_name='tensorflow.HistogramProto.num', index=2,
-      number=3, type=1, cpp_type=5, label=1,
-      has_default_value=False, default_value=float(0),
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      options=None),
-    _descriptor.FieldDescriptor(
-      name='sum', full_name='tensorflow.HistogramProto.sum', index=3,
-      number=4, type=1, cpp_type=5, label=1,
-      has_default_value=False, default_value=float(0),
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      options=None),
-    _descriptor.FieldDescriptor(
-      name='sum_squares', full_name='tensorflow.HistogramProto.sum_squares', index=4,
-      number=5, type=1, cpp_type=5, label=1,
-      has_default_value=False, default_value=float(0),
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      options=None),
-    _descriptor.FieldDescriptor(
-      name='bucket_limit', full_name='tensorflow.HistogramProto.bucket_limit', index=5,
-      number=6, type=1, cpp_type=5, label=3,
-      has_default_value=False, default_value=[],
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      options=_descriptor._ParseOptions(descriptor_pb2.FieldOptions(), _b('\020\001'))),
-    _descriptor.FieldDescriptor(
-      name='bucket', full_name='tensorflow.HistogramProto.bucket', index=6,
-      number=7, type=1, cpp_type=5, label=3,
-      has_default_value=False, default_value=[],
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      options=_descriptor._ParseOptions(descriptor_pb2.FieldOptions(), _b('\020\001'))),
-  ],
-  extensions=[
-  ],
-  nested_types=[],
-  enum_types=[
-  ],
-  options=None,
-  is_extendable=False,
-  syntax='proto3',
-  extension_ranges=[],
-  oneofs=[
-  ],
-  serialized_start=61,
-  serialized_end=196,
-)
-
-
-_SUMMARY_IMAGE = _descriptor.Descriptor(
-  name='Image',
-  full_name='tensorflow.Summary.Image',
-  filename=None,
-  file=DESCRIPTOR,
-  containing_type=None,
-  fields=[
-    _descriptor.FieldDescriptor(
-      name='height', full_name='tensorflow.Summary.Image.height', index=0,
-      number=1, type=5, cpp_type=1, label=1,
-      has_default_value=False, default_value=0,
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      options=None),
-    _descriptor.FieldDescriptor(
-      name='width', full_name='tensorflow.Summary.Image.width', index=1,
-      number=2, type=5, cpp_type=1, label=1,
-      has_default_value=False, default_value=0,
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      options=None),
-    _descriptor.FieldDescriptor(
-      name='colorspace', full_name='tensorflow.Summary.Image.colorspace', index=2,
-      number=3, type=5, cpp_type=1, label=1,
-      has_default_value=False, default_value=0,
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      options=None),
-    _descriptor.FieldDescriptor(
-      name='encoded_image_string', full_name='tensorflow.Summary.Image.encoded_image_string', index=3,
-      number=4, type=12, cpp_type=9, label=1,
-      has_default_value=False, default_value=_b(""),
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      options=None),
-  ],
-  extensions=[
-  ],
-  nested_types=[],
-  enum_types=[
-  ],
-  options=None,
-  is_extendable=False,
-  syntax='proto3',
-  extension_ranges=[],
-  oneofs=[
-  ],
-  serialized_start=252,
-  serialized_end=340,
-)
-
-_SUMMARY_AUDIO = _descriptor.Descriptor(
-  name='Audio',
-  full_name='tensorflow.Summary.Audio',
-  filename=None,
-  file=DESCRIPTOR,
-  containing_type=None,
-  fields=[
-    _descriptor.FieldDescriptor(
-      name='sample_rate', full_name='tensorflow.Summary.Audio.sample_rate', index=0,
-      number=1, type=2, cpp_type=6, label=1,
-      has_default_value=False, default_value=float(0),
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      options=None),
-    _descriptor.FieldDescriptor(
-      name='num_channels', full_name='tensorflow.Summary.Audio.num_channels', index=1,
-      number=2, type=3, cpp_type=2, label=1,
-      has_default_value=False, default_value=0,
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      options=None),
-    _descriptor.FieldDescriptor(
-      name='length_frames', full_name='tensorflow.Summary.Audio.length_frames', index=2,
-      number=3, type=3, cpp_type=2, label=1,
-      has_default_value=False, default_value=0,
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      options=None),
-    _descriptor.FieldDescriptor(
-      name='encoded_audio_string', full_name='tensorflow.Summary.Audio.encoded_audio_string', index=3,
-      number=4, type=12, cpp_type=9, label=1,
-      has_default_value=False, default_value=_b(""),
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      options=None),
-    _descriptor.FieldDescriptor(
-      name='content_type', full_name='tensorflow.Summary.Audio.content_type', index=4,
-      number=5, type=9, cpp_type=9, label=1,
-      has_default_value=False, default_value=_b("").decode('utf-8'),
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      options=None),
-  ],
-  extensions=[
-  ],
-  nested_types=[],
-  enum_types=[
-  ],
-  options=None,
-  is_extendable=False,
-  syntax='proto3',
-  extension_ranges=[],
-  oneofs=[
-  ],
-  serialized_start=342,
-  serialized_end=467,
-)
-
-_SUMMARY_VALUE = _descriptor.Descriptor(
-  name='Value',
-  full_name='tensorflow.Summary.Value',
-  filename=None,
-  file=DESCRIPTOR,
-  containing_type=None,
-  fields=[
-    _descriptor.FieldDescriptor(
-      name='node_name', full_name='tensorflow.Summary.Value.node_name', index=0,
-      number=7, type=9, cpp_type=9, label=1,
-      has_default_value=False, default_value=_b("").decode('utf-8'),
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      options=None),
-    _descriptor.FieldDescriptor(
-      name='tag', full_name='tensorflow.Summary.Value.tag', index=1,
-      number=1, type=9, cpp_type=9, label=1,
-      has_default_value=False, default_value=_b("").decode('utf-8'),
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      options=None),
-    _descriptor.FieldDescriptor(
-      name='simple_value', full_name='tensorflow.Summary.Value.simple_value', index=2,
-      number=2, type=2, cpp_type=6, label=1,
-      has_default_value=False, default_value=float(0),
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      options=None),
-    _descriptor.FieldDescriptor(
-      name='obsolete_old_style_histogram', full_name='tensorflow.Summary.Value.obsolete_old_style_histogram', index=3,
-      number=3, type=12, cpp_type=9, label=1,
-      has_default_value=False, default_value=_b(""),
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      options=None),
-    _descriptor.FieldDescriptor(
-      name='image', full_name='tensorflow.Summary.Value.image', index=4,
-      number=4, type=11, cpp_type=10, label=1,
-      has_default_value=False, default_value=None,
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      options=None),
-    _descriptor.FieldDescriptor(
-      name='histo', full_name='tensorflow.Summary.Value.histo', index=5,
-      number=5, type=11, cpp_type=10, label=1,
-      has_default_value=False, default_value=None,
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      options=None),
-    _descriptor.FieldDescriptor(
-      name='audio', full_name='tensorflow.Summary.Value.audio', index=6,
-      number=6, type=11, cpp_type=10, label=1,
-      has_default_value=False, default_value=None,
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      options=None),
-  ],
-  extensions=[
-  ],
-  nested_types=[],
-  enum_types=[
-  ],
-  options=None,
-  is_extendable=False,
-  syntax='proto3',
-  extension_ranges=[],
-  oneofs=[
-    _descriptor.OneofDescriptor(
-      name='value', full_name='tensorflow.Summary.Value.value',
-      index=0, containing_type=None, fields=[]),
-  ],
-  serialized_start=470,
-  serialized_end=715,
-)
-
-_SUMMARY = _descriptor.Descriptor(
-  name='Summary',
-  full_name='tensorflow.Summary',
-  filename=None,
-  file=DESCRIPTOR,
-  containing_type=None,
-  fields=[
-    _descriptor.FieldDescriptor(
-      name='value', full_name='tensorflow.Summary.value', index=0,
-      number=1, type=11, cpp_type=10, label=3,
-      has_default_value=False, default_value=[],
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      options=None),
-  ],
-  extensions=[
-  ],
-  nested_types=[_SUMMARY_IMAGE, _SUMMARY_AUDIO, _SUMMARY_VALUE, ],
-  enum_types=[
-  ],
-  options=None,
-  is_extendable=False,
-  syntax='proto3',
-  extension_ranges=[],
-  oneofs=[
-  ],
-  serialized_start=199,
-  serialized_end=715,
-)
-
-_SUMMARY_IMAGE.containing_type = _SUMMARY
-_SUMMARY_AUDIO.containing_type = _SUMMARY
-_SUMMARY_VALUE.fields_by_name['image'].message_type = _SUMMARY_IMAGE
-_SUMMARY_VALUE.fields_by_name['histo'].message_type = _HISTOGRAMPROTO
-_SUMMARY_VALUE.fields_by_name['audio'].message_type = _SUMMARY_AUDIO
-_SUMMARY_VALUE.containing_type = _SUMMARY
-_SUMMARY_VALUE.oneofs_by_name['value'].fields.append(
-  _SUMMARY_VALUE.fields_by_name['simple_value'])
-_SUMMARY_VALUE.fields_by_name['simple_value'].containing_oneof = _SUMMARY_VALUE.oneofs_by_name['value']
-_SUMMARY_VALUE.oneofs_by_name['value'].fields.append(
-  _SUMMARY_VALUE.fields_by_name['obsolete_old_style_histogram'])
-_SUMMARY_VALUE.fields_by_name['obsolete_old_style_histogram'].containing_oneof = _SUMMARY_VALUE.oneofs_by_name['value']
-_SUMMARY_VALUE.oneofs_by_name['value'].fields.append(
-  _SUMMARY_VALUE.fields_by_name['image'])
-_SUMMARY_VALUE.fields_by_name['image'].containing_oneof = _SUMMARY_VALUE.oneofs_by_name['value']
-_SUMMARY_VALUE.oneofs_by_name['value'].fields.append(
-  _SUMMARY_VALUE.fields_by_name['histo'])
-_SUMMARY_VALUE.fields_by_name['histo'].containing_oneof = _SUMMARY_VALUE.oneofs_by_name['value']
-_SUMMARY_VALUE.oneofs_by_name['value'].fields.append(
-  _SUMMARY_VALUE.fields_by_name['audio'])
-_SUMMARY_VALUE.fields_by_name['audio'].containing_oneof = _SUMMARY_VALUE.oneofs_by_name['value']
-_SUMMARY.fields_by_name['value'].message_type = _SUMMARY_VALUE
-DESCRIPTOR.message_types_by_name['HistogramProto'] = _HISTOGRAMPROTO
-DESCRIPTOR.message_types_by_name['Summary'] = _SUMMARY
-
-HistogramProto = _reflection.GeneratedProtocolMessageType('HistogramProto', (_message.Message,), dict(
-  DESCRIPTOR = _HISTOGRAMPROTO,
-  __module__ = 'tensorboard_logger.tf_protobuf.summary_pb2'
-  # @@protoc_insertion_point(class_scope:tensorflow.HistogramProto)
-  ))
-_sym_db.RegisterMessage(HistogramProto)
-
-Summary = _reflection.GeneratedProtocolMessageType('Summary', (_message.Message,), dict(
-
-  Image = _reflection.GeneratedProtocolMessageType('Image', (_message.Message,), dict(
-    DESCRIPTOR = _SUMMARY_IMAGE,
-    __module__ = 'tensorboard_logger.tf_protobuf.summary_pb2'
-    # @@protoc_insertion_point(class_scope:tensorflow.Summary.Image)
-    ))
-  ,
-
-  Audio = _reflection.GeneratedProtocolMessageType('Audio', (_message.Message,), dict(
-    DESCRIPTOR = _SUMMARY_AUDIO,
-    __module__ = 'tensorboard_logger.tf_protobuf.summary_pb2'
-    # @@protoc_insertion_point(class_scope:tensorflow.Summary.Audio)
-    ))
-  ,
-
-  Value = _reflection.GeneratedProtocolMessageType('Value', (_message.Message,), dict(
-    DESCRIPTOR = _SUMMARY_VALUE,
-    __module__ = 'tensorboard_logger.tf_protobuf.summary_pb2'
-    # @@protoc_insertion_point(class_scope:tensorflow.Summary.Value)
-    ))
-  ,
-  DESCRIPTOR = _SUMMARY,
-  __module__ = 'tensorboard_logger.tf_protobuf.summary_pb2'
-  # @@protoc_insertion_point(class_scope:tensorflow.Summary)
-  ))
-_sym_db.RegisterMessage(Summary)
-_sym_db.RegisterMessage(Summary.Image)
-_sym_db.RegisterMessage(Summary.Audio)
-_sym_db.RegisterMessage(Summary.Value)
-
-
-DESCRIPTOR.has_options = True
-DESCRIPTOR._options = _descriptor._ParseOptions(descriptor_pb2.FileOptions(), _b('\370\001\001'))
-_HISTOGRAMPROTO.fields_by_name['bucket_limit'].has_options = True
-_HISTOGRAMPROTO.fields_by_name['bucket_limit']._options = _descriptor._ParseOptions(descriptor_pb2.FieldOptions(), _b('\020\001'))
-_HISTOGRAMPROTO.fields_by_name['bucket'].has_options = True
-_HISTOGRAMPROTO.fields_by_name['bucket']._options = _descriptor._ParseOptions(descriptor_pb2.FieldOptions(), _b('\020\001'))
+from tensorboard_logger.tf_protobuf import tensor_pb2 as tensorboard__logger_dot_tf__protobuf_dot_tensor__pb2
+
+
+DESCRIPTOR = _descriptor_pool.Default().AddSerializedFile(b'\n,tensorboard_logger/tf_protobuf/summary.proto\x12\ntensorflow\x1a+tensorboard_logger/tf_protobuf/tensor.proto\"\x87\x01\n\x0eHistogramProto\x12\x0b\n\x03min\x18\x01 \x01(\x01\x12\x0b\n\x03max\x18\x02 \x01(\x01\x12\x0b\n\x03num\x18\x03 \x01(\x01\x12\x0b\n\x03sum\x18\x04 \x01(\x01\x12\x13\n\x0bsum_squares\x18\x05 \x01(\x01\x12\x18\n\x0c\x62ucket_limit\x18\x06 \x03(\x01\x42\x02\x10\x01\x12\x12\n\x06\x62ucket\x18\x07 \x03(\x01\x42\x02\x10\x01\"\xb5\x01\n\x0fSummaryMetadata\x12;\n\x0bplugin_data\x18\x01 \x01(\x0b\x32&.tensorflow.SummaryMetadata.PluginData\x12\x14\n\x0c\x64isplay_name\x18\x02 \x01(\t\x12\x1b\n\x13summary_description\x18\x03 \x01(\t\x1a\x32\n\nPluginData\x12\x13\n\x0bplugin_name\x18\x01 \x01(\t\x12\x0f\n\x07\x63ontent\x18\x02 \x01(\x0c\"\xde\x04\n\x07Summary\x12(\n\x05value\x18\x01 \x03(\x0b\x32\x19.tensorflow.Summary.Value\x1aX\n\x05Image\x12\x0e\n\x06height\x18\x01 \x01(\x05\x12\r\n\x05width\x18\x02 \x01(\x05\x12\x12\n\ncolorspace\x18\x03 \x01(\x05\x12\x1c\n\x14\x65ncoded_image_string\x18\x04 \x01(\x0c\x1a}\n\x05\x41udio\x12\x13\n\x0bsample_rate\x18\x01 \x01(\x02\x12\x14\n\x0cnum_channels\x18\x02 \x01(\x03\x12\x15\n\rlength_frames\x18\x03 \x01(\x03\x12\x1c\n\x14\x65ncoded_audio_string\x18\x04 \x01(\x0c\x12\x14\n\x0c\x63ontent_type\x18\x05 \x01(\t\x1a\xcf\x02\n\x05Value\x12\x11\n\tnode_name\x18\x07 \x01(\t\x12\x0b\n\x03tag\x18\x01 \x01(\t\x12-\n\x08metadata\x18\t \x01(\x0b\x32\x1b.tensorflow.SummaryMetadata\x12\x16\n\x0csimple_value\x18\x02 \x01(\x02H\x00\x12&\n\x1cobsolete_old_style_histogram\x18\x03 \x01(\x0cH\x00\x12*\n\x05image\x18\x04 \x01(\x0b\x32\x19.tensorflow.Summary.ImageH\x00\x12+\n\x05histo\x18\x05 \x01(\x0b\x32\x1a.tensorflow.HistogramProtoH\x00\x12*\n\x05\x61udio\x18\x06 \x01(\x0b\x32\x19.tensorflow.Summary.AudioH\x00\x12)\n\x06tensor\x18\x08 \x01(\x0b\x32\x17.tensorflow.TensorProtoH\x00\x42\x07\n\x05valueB\x03\xf8\x01\x01\x62\x06proto3')
+
+_builder.BuildMessageAndEnumDescriptors(DESCRIPTOR, globals())
+_builder.BuildTopDescriptorsAndMessages(DESCRIPTOR, 'tensorboard_logger.tf_protobuf.summary_pb2', globals())
+if _descriptor._USE_C_DESCRIPTORS == False:
+
+  DESCRIPTOR._options = None
+  DESCRIPTOR._serialized_options = b'\370\001\001'
+  _HISTOGRAMPROTO.fields_by_name['bucket_limit']._options = None
+  _HISTOGRAMPROTO.fields_by_name['bucket_limit']._serialized_options = b'\020\001'
+  _HISTOGRAMPROTO.fields_by_name['bucket']._options = None
+  _HISTOGRAMPROTO.fields_by_name['bucket']._serialized_options = b'\020\001'
+  _HISTOGRAMPROTO._serialized_start=106
+  _HISTOGRAMPROTO._serialized_end=241
+  _SUMMARYMETADATA._serialized_start=244
+  _SUMMARYMETADATA._serialized_end=425
+  _SUMMARYMETADATA_PLUGINDATA._serialized_start=375
+  _SUMMARYMETADATA_PLUGINDATA._serialized_end=425
+  _SUMMARY._serialized_start=428
+  _SUMMARY._serialized_end=1034
+  _SUMMARY_IMAGE._serialized_start=481
+  _SUMMARY_IMAGE._serialized_end=569
+  _SUMMARY_AUDIO._serialized_start=571
+  _SUMMARY_AUDIO._serialized_end=696
+  _SUMMARY_VALUE._serialized_start=699
+  _SUMMARY_VALUE._serialized_end=1034
 # @@protoc_insertion_point(module_scope)
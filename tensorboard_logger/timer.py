@@ -0,0 +1,104 @@
+# -*- coding: utf-8 -*-
+import functools
+import threading
+import time
+
+from .stats import perf_counter
+
+
+perf_counter_ns = getattr(
+    time, 'perf_counter_ns', lambda: int(perf_counter() * 1e9))
+
+
+class Timer(object):
+    """ Context manager and decorator accumulating elapsed time of a block
+    in memory. Timings are not written on each call: use
+    ``Logger.log_timers`` (or ``timer_secs`` on the Logger) to write
+    mean, max and count of the timings collected so far.
+
+    Only one of every ``every`` calls is measured, the rest only increment
+    the call count, so hot inner loops can be timed with negligible overhead.
+    A timer can be used from several threads at once.
+
+    Example:
+        >>> timer = Timer('t')
+        >>> for _ in range(3):
+        ...     with timer:
+        ...         pass
+        >>> timer.count, timer.n_sampled
+        (3, 3)
+    """
+    def __init__(self, tf_name, every=1, on_exit=None):
+        if every < 1:
+            raise ValueError('"every" should be a positive integer')
+        self.tf_name = tf_name
+        self.every = every
+        self._on_exit = on_exit
+        self._local = threading.local()
+        self._lock = threading.Lock()
+        self.reset()
+
+    def reset(self):
+        self.count = 0  # finished calls
+        self.n_sampled = 0
+        self.total_ns = 0
+        self.max_ns = 0
+
+    def __enter__(self):
+        local = self._local
+        try:
+            starts = local.starts
+        except AttributeError:
+            starts = local.starts = []  # a stack, as timers can be nested
+            local.calls = 0
+        local.calls += 1
+        if local.calls % self.every == 0:
+            starts.append(perf_counter_ns())
+        else:
+            starts.append(None)
+        return self
+
+    def __exit__(self, *exc_info):
+        start = self._local.starts.pop()
+        if start is None:
+            with self._lock:
+                self.count += 1
+        else:
+            elapsed = perf_counter_ns() - start
+            with self._lock:
+                self.count += 1
+                self.n_sampled += 1
+                self.total_ns += elapsed
+                if elapsed > self.max_ns:
+                    self.max_ns = elapsed
+            if self._on_exit is not None:
+                self._on_exit()
+
+    def __call__(self, fn):
+        @functools.wraps(fn)
+        def wrapper(*args, **kwargs):
+            with self:
+                return fn(*args, **kwargs)
+        return wrapper
+
+    def aggregates(self):
+        """ Return a list of (suffix, value) pairs with mean and max
+        of sampled timings in seconds and the total call count.
+        """
+        mean_ns = self.total_ns / self.n_sampled if self.n_sampled else 0.
+        return [
+            ('mean', mean_ns / 1e9),
+            ('max', self.max_ns / 1e9),
+            ('count', self.count),
+        ]
+
+    def pop_aggregates(self):
+        """ Return ``aggregates()`` and reset the timer,
+        or None if it was not called since the previous reset.
+        """
+        with self._lock:
+            if not self.count:
+                return None
+            aggregates = self.aggregates()
+            self.reset()
+        return aggregates
@@ -0,0 +1,107 @@
+# -*- coding: utf-8 -*-
+import array
+
+import numpy as np
+import pytest
+
+from tensorboard_logger import Logger
+from tensorboard_logger.arrays import (
+    _BFloat16Bits, array_stats, as_array, as_scalar, float_chunks, histogram,
+    tensor_stats)
+
+
+def test_as_array_no_copy():
+    x = np.arange(10, dtype=np.float32)
+    assert as_array(x) is x
+    buf = array.array('d', [1, 2, 3])
+    assert np.shares_memory(as_array(buf), as_array(memoryview(buf)))
+
+    class ArrayInterface(object):
+        def __init__(self, a):
+            self.__array_interface__ = a.__array_interface__
+    assert np.shares_memory(as_array(ArrayInterface(x)), x)
+
+
+@pytest.mark.parametrize('values', [
+    np.random.RandomState(0).randn(1000).astype(np.float16),
+    np.random.RandomState(0).randn(1000).astype('>f8'),
+    np.random.RandomState(0).randint(0, 100, size=(50, 20)),
+    np.random.RandomState(0).randn(40, 60)[::3, ::2],  # not contiguous
+])
+def test_histogram_chunked(values):
+    expected = values.astype(np.float64)
+    counts, edges = histogram(values, chunk_size=64)
+    expected_counts, expected_edges = np.histogram(expected)
+    assert counts.tolist() == expected_counts.tolist()
+    assert np.allclose(edges, expected_edges)
+    min_, max_, num, sum_, sum_squares = array_stats(values, chunk_size=64)
+    assert (min_, max_, num) == (expected.min(), expected.max(), values.size)
+    assert np.isclose(sum_, expected.sum())
+    assert np.isclose(sum_squares, (expected ** 2).sum())
+
+
+def test_float_chunks_wide_rows():
+    values = np.arange(2 * 10000, dtype=np.float32).reshape(2, -1)[:, ::2]
+    chunks = list(float_chunks(values, chunk_size=100))
+    assert max(len(chunk) for chunk in chunks) <= 100
+    assert np.concatenate(chunks).tolist() == values.ravel().tolist()
+
+
+def test_bfloat16_bits():
+    values = np.array([1.0, -2.5, 0.15625], dtype=np.float32)
+    bits = _BFloat16Bits((values.view(np.uint32) >> 16).astype(np.uint16))
+    chunk, = list(float_chunks(bits))
+    assert chunk.tolist() == values.tolist()
+    assert as_scalar(bits[1:2]) == -2.5
+
+
+def test_as_scalar():
+    assert as_scalar(np.float32(1.5)) == 1.5
+    assert as_scalar(np.array([[2]])) == 2.0
+    assert as_scalar(3) == 3.0
+    with pytest.raises(TypeError):
+        as_scalar(np.arange(3))
+
+
+def test_log_array_likes():
+    logger = Logger(None, is_dummy=True)
+    logger.log_value('v', np.array(1.5, dtype=np.float16), step=1)
+    logger.log_value('v', np.int64(2), step=2)
+    values = np.arange(12, dtype=np.float16).reshape(3, 4)
+    summary = logger._histogram_summary('h', memoryview(values))
+    histo = summary.value[0].histo
+    assert (histo.min, histo.max, histo.num) == (0, 11, 12)
+    assert dict(logger.dummy_log) == {'v': [(1, 1.5), (2, 2.0)]}
+
+
+def test_tensor_stats_chunked():
+    rng = np.random.RandomState(0)
+    values = (1e6 + rng.randn(100, 37)).astype(np.float64)
+    values[3, :5] = 0
+    values[7, 1] = np.nan
+    values[9, 2] = -np.inf
+    stats = dict(tensor_stats(values[:, ::2], chunk_size=64))
+    finite = values[:, ::2][np.isfinite(values[:, ::2])]
+    assert np.isclose(stats['mean'], finite.mean())
+    assert np.isclose(stats['std'], finite.std(), rtol=1e-6)
+    assert (stats['min'], stats['max']) == (finite.min(), finite.max())
+    assert np.isclose(stats['l2_norm'], np.linalg.norm(finite))
+    assert stats['zero_fraction'] == 3 / (100 * 19.)
+    assert stats['nonfinite_fraction'] == 1 / (100 * 19.)
+    assert tensor_stats(values, stats=('max', 'min')) == [
+        ('max', finite.max()), ('min', 0.0)]
+    with pytest.raises(ValueError):
+        tensor_stats(values, stats=('median',))
+    with pytest.raises(ValueError):
+        tensor_stats(np.array([]))
+
+
+def test_log_stats():
+    logger = Logger(None, is_dummy=True)
+    logger.log_stats('layer 1', np.arange(4, dtype=np.float16), step=3,
+                     stats=('mean', 'max'))
+    assert dict(logger.dummy_log) == {
+        'layer_1': [(3, [('mean', 1.5), ('max', 3.0)])]}
+    summary = logger._scalars_summary(
+        'layer_1', logger.dummy_log['layer_1'][0][1])
+    assert [v.tag for v in summary.value] == ['layer_1/mean', 'layer_1/max']
@@ -0,0 +1,92 @@
+# -*- coding: utf-8 -*-
+import glob
+import os
+import socket
+
+from tensorboard_logger import Logger, RemoteLogger
+from tensorboard_logger.collector import Collector, hello_message
+
+
+def _log_values(logger, steps):
+    for step in steps:
+        logger.log_value('v1', step * 1.5, step)
+        logger.log_value('v2', step ** 1.5 - 2, step)
+
+
+def _expected(tmpdir, steps):
+    logger = Logger(str(tmpdir.join('local')), dummy_time=256.5)
+    _log_values(logger, steps)
+    logger.close()
+    local_log, = tmpdir.join('local').listdir()
+    return local_log.read_binary()
+
+
+def _collected(logdir, run):
+    path, = glob.glob(os.path.join(logdir, run, 'events.out.tfevents.*'))
+    with open(path, 'rb') as f:
+        return f.read()
+
+
+def test_remote_logger_tcp(tmpdir):
+    logdir = str(tmpdir.join('collected'))
+    collector = Collector(logdir, ('127.0.0.1', 0))
+    collector.start()
+    try:
+        logger = RemoteLogger('exp/rank0', collector.address,
+                              dummy_time=256.5, batch_size=100)
+        _log_values(logger, range(50))
+        logger.close()
+    finally:
+        collector.shutdown()
+    assert _collected(logdir, 'exp/rank0') == _expected(tmpdir, range(50))
+
+
+def test_remote_logger_reconnect(tmpdir):
+    logdir = str(tmpdir.join('collected'))
+    address = str(tmpdir.join('collector.sock'))
+    collector = Collector(logdir, address)
+    collector.start()
+    logger = RemoteLogger('run', address, dummy_time=256.5, retry_secs=0.05)
+    _log_values(logger, range(10))
+    logger._writer.flush()
+    collector.shutdown()
+    # collector is down: records are buffered and sent after restart
+    _log_values(logger, range(10, 20))
+    collector = Collector(logdir, address)
+    collector.start()
+    try:
+        logger.close()
+    finally:
+        collector.shutdown()
+    assert _collected(logdir, 'run') == _expected(tmpdir, range(20))
+
+
+def test_remote_logger_shards(tmpdir, monkeypatch):
+    monkeypatch.chdir(tmpdir)
+    logdir = str(tmpdir.join('collected'))
+    collector = Collector(logdir, ('127.0.0.1', 0))
+    collector.start()
+    try:
+        logger = RemoteLogger('run', collector.address, shards=True)
+        logger.log_value('loss', 1.0, 1)
+        logger.log_histogram('weights', [1, 2, 3], 1)
+        logger.close()
+    finally:
+        collector.shutdown()
+    assert sorted(p.basename for p in tmpdir.listdir()) == ['collected']
+    suffixes = sorted(path.rsplit('.', 1)[1] for path in glob.glob(
+        os.path.join(logdir, 'run', 'events.out.tfevents.*')))
+    assert len(suffixes) == 2 and suffixes[0] == 'histograms'
+
+
+def test_collector_rejects_bad_run(tmpdir):
+    collector = Collector(str(tmpdir), ('127.0.0.1', 0))
+    collector.start()
+    try:
+        sock = socket.create_connection(collector.address)
+        sock.sendall(hello_message('../escape', 'events.out.tfevents.1.h'))
+        assert sock.recv(8) == b''
+        sock.close()
+    finally:
+        collector.shutdown()
+    assert tmpdir.listdir() == []
@@ -0,0 +1,97 @@
+# -*- coding: utf-8 -*-
+import numpy as np
+import pytest
+
+from tensorboard_logger import Logger
+from tensorboard_logger.downsample import (
+    StreamDownsampler, downsample, downsample_indices)
+from tensorboard_logger.reader import read_events
+from tensorboard_logger.runs import RunCollection
+
+
+@pytest.mark.parametrize('method', ['lttb', 'min_max', 'stride'])
+def test_downsample(method):
+    rng = np.random.RandomState(0)
+    x = np.arange(100000)
+    y = np.cumsum(rng.normal(size=len(x)))
+    indices = downsample_indices(x, y, 500, method)
+    assert len(indices) <= 500
+    assert indices[0] == 0 and indices[-1] == len(x) - 1
+    assert (np.diff(indices) > 0).all()
+    if method == 'min_max':
+        assert y.argmin() in indices and y.argmax() in indices
+    # The shape is kept: interpolated series stays close to the original
+    error = np.abs(np.interp(x, x[indices], y[indices]) - y).max()
+    assert error < 0.1 * (y.max() - y.min())
+
+
+def test_downsample_short():
+    x, y = downsample([0, 1, 2], [3, 4, 5], 10)
+    assert x.tolist() == [0, 1, 2] and y.tolist() == [3, 4, 5]
+    assert downsample_indices(range(10), range(10), 2).tolist() == [0, 9]
+    with pytest.raises(ValueError):
+        downsample_indices(range(10), range(10), 5, 'unknown')
+
+
+def test_lttb_keeps_spikes():
+    y = np.zeros(1000)
+    y[123] = 10
+    y[777] = -10
+    indices = downsample_indices(np.arange(1000), y, 20, 'lttb')
+    assert 123 in indices and 777 in indices
+
+
+def test_logger_downsample(tmpdir):
+    logger = Logger(str(tmpdir), downsample=StreamDownsampler(
+        'min_max', window=100, points=10, tags='^loss'))
+    for step in range(250):
+        logger.log_value('loss', np.sin(step / 10.), step)
+        logger.log_value('lr', 0.1, step)
+    logger.close()
+    tf_log, = tmpdir.listdir()
+    steps = {'loss': [], 'lr': []}
+    for event in read_events(str(tf_log)):
+        for value in event.summary.value:
+            steps[value.tag].append(event.step)
+    assert steps['lr'] == list(range(250))
+    # 10 points for each full window and for the remaining 50 values
+    assert len(steps['loss']) == 30
+    assert steps['loss'][:1] == [0] and steps['loss'][-1] == 249
+    assert steps['loss'] == sorted(steps['loss'])
+
+
+def test_dummy_logger_downsample():
+    logger = Logger(None, is_dummy=True,
+                    downsample=StreamDownsampler('stride', window=10, points=2))
+    for step in range(15):
+        logger.log_value('v', step, step)
+    assert logger.dummy_log['v'] == [(0, 0), (9, 9)]
+    logger.close()
+    assert logger.dummy_log['v'][2:] == [(10, 10), (14, 14)]
+
+
+def test_downsample_stats_and_snapshot(tmpdir):
+    from tensorboard_logger.snapshot import read_snapshot
+    logger = Logger(str(tmpdir), stats=True, snapshot_secs=0, downsample=
+                    StreamDownsampler('stride', window=10, points=2))
+    for step in range(15):
+        logger.log_value('v', step, step)
+    stats = logger.stats()
+    assert stats['values'] == stats['tags']['v']['values'] == 15
+    assert stats['events'] == stats['tags']['v']['events'] == 2
+    assert stats['bytes'] > 0
+    assert read_snapshot(str(tmpdir))['v'][::2] == (14, 14.)
+    logger.close()
+    assert logger.stats()['events'] == 4
+    assert read_snapshot(str(tmpdir))['v'][::2] == (14, 14.)
+
+
+def test_read_time_downsample(tmpdir):
+    logger = Logger(str(tmpdir.join('run')))
+    for step in range(1000):
+        logger.log_value('v', step % 100, step)
+    logger.close()
+    runs = RunCollection(str(tmpdir), processes=1)
+    steps, values = runs.query().series(runs.runs[0], 'v', max_points=50)
+    assert len(steps) == 50
+    assert values.max() == 99 and values.min() == 0
@@ -0,0 +1,60 @@
+# -*- coding: utf-8 -*-
+import time
+
+from tensorboard_logger import Logger
+from tensorboard_logger.flush import AdaptiveFlush
+from tensorboard_logger.reader import read_events
+from tensorboard_logger.sinks import FileSink
+from tensorboard_logger.stats import stats_values
+
+
+class SlowSink(FileSink):
+    flush_secs = 0.02
+
+    def flush(self):
+        time.sleep(self.flush_secs)
+        super(SlowSink, self).flush()
+
+
+def _n_values(tmpdir):
+    tf_log, = tmpdir.listdir()
+    return sum(len(e.summary.value) for e in read_events(str(tf_log)))
+
+
+def test_fast_sink(tmpdir):
+    logger = Logger(str(tmpdir), adaptive_flush=True)
+    for step in range(100):
+        logger.log_value('v', step, step)
+        time.sleep(0.001)
+    stats = logger.stats()['flush']
+    assert stats['flushes'] > 10
+    assert stats['interval'] < 0.05
+    logger.close()
+    assert _n_values(tmpdir) == 100
+
+
+def test_slow_sink(tmpdir):
+    flush = AdaptiveFlush(max_staleness=0.5, duty_cycle=0.1)
+    logger = Logger(str(tmpdir), sink=SlowSink, adaptive_flush=flush)
+    for step in range(300):
+        logger.log_value('v', step, step)
+        time.sleep(0.002)
+    stats = logger.stats()
+    logger.close()
+    assert _n_values(tmpdir) == 300
+    # Flushing takes ~20 ms, so the interval grows towards 200 ms
+    assert 0.1 < stats['flush']['interval'] <= 0.5
+    assert stats['flush']['flushes'] < 30
+    assert stats['flush']['max_staleness'] < 0.5 + 0.1
+    assert 'tensorboard_logger/flush/interval' in dict(stats_values(stats))
+
+
+def test_staleness_budget():
+    flush = AdaptiveFlush(max_staleness=1., max_interval=5.)
+    flush.update(n_bytes=1000, latency=2., staleness=2., now=1.)
+    assert flush.interval == 0
+    flush = AdaptiveFlush(max_staleness=10., max_interval=5.)
+    flush.update(n_bytes=1000, latency=1., staleness=1., now=1.)
+    assert flush.interval == 5.
+    flush.update(n_bytes=10 ** 5, latency=1., staleness=1., now=2.)
+    assert flush.batch_bytes == 5 * 10 ** 5
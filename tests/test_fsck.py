@@ -0,0 +1,85 @@
+# -*- coding: utf-8 -*-
+import pytest
+
+from tensorboard_logger import Logger
+from tensorboard_logger.fsck import check_file, fsck, main
+from tensorboard_logger.reader import read_events
+
+
+def _write_run(path, n_steps=10):
+    logger = Logger(str(path))
+    for step in range(n_steps):
+        logger.log_value('v', step, step)
+    logger.close()
+    tf_log, = path.listdir()
+    return tf_log
+
+
+def _steps(path):
+    return [e.step for e in read_events(str(path)) if e.summary.value]
+
+
+def test_valid_file(tmpdir):
+    tf_log = _write_run(tmpdir.join('run'))
+    report = check_file(str(tf_log))
+    assert report['errors'] == []
+    assert report['records'] == 11
+    assert report['size'] == tf_log.size()
+
+
+def test_repair_corrupt_record(tmpdir):
+    tf_log = _write_run(tmpdir.join('run'))
+    data = bytearray(tf_log.read_binary())
+    offset = len(data) // 2
+    data[offset:offset + 3] = b'xxx'
+    tf_log.write_binary(bytes(data))
+    repaired = tmpdir.join('repaired')
+    report = check_file(str(tf_log), str(repaired))
+    assert len(report['errors']) == 1
+    error_offset, error = report['errors'][0]
+    assert error_offset <= offset
+    assert report['records'] == 10
+    steps = _steps(repaired)
+    assert len(steps) == 9
+    assert steps[:3] == [0, 1, 2] and steps[-3:] == [7, 8, 9]
+    assert sorted(p.basename for p in tmpdir.listdir()) == ['repaired', 'run']
+    # The checked file is never overwritten
+    with pytest.raises(ValueError):
+        check_file(str(tf_log), str(tf_log))
+    report, = fsck([str(tf_log)], repair_dir=str(tf_log.dirpath()))
+    assert 'repair_path' not in report
+    assert tf_log.read_binary() == bytes(data)
+
+
+def test_truncated_tail(tmpdir):
+    tf_log = _write_run(tmpdir.join('run'))
+    tf_log.write_binary(tf_log.read_binary()[:-5])
+    report = check_file(str(tf_log))
+    assert report['records'] == 10
+    assert [error for _, error in report['errors']] == ['truncated record']
+
+
+def test_zero_filled_tail(tmpdir):
+    tf_log = _write_run(tmpdir.join('run'))
+    size = tf_log.size()
+    tf_log.write_binary(tf_log.read_binary() + b'\0' * 100)
+    report = check_file(str(tf_log))
+    assert report['records'] == 11
+    assert report['errors'] == [(size, 'length CRC mismatch')]
+
+
+def test_fsck_parallel(tmpdir, capsys):
+    for i in range(4):
+        _write_run(tmpdir.join('runs', 'run-{}'.format(i)))
+    tf_log = tmpdir.join('runs', 'run-2').listdir()[0]
+    tf_log.write_binary(tf_log.read_binary()[:-5])
+    reports = list(fsck([str(tmpdir.join('runs'))], jobs=2,
+                        repair_dir=str(tmpdir.join('repaired'))))
+    assert len(reports) == 4
+    damaged = [r for r in reports if r['errors']]
+    assert [r['path'] for r in damaged] == [str(tf_log)]
+    repaired = tmpdir.join('repaired', 'run-2', tf_log.basename)
+    assert len(_steps(repaired)) == 9
+    assert main([str(tmpdir.join('runs'))]) == 1
+    assert '4 files, 43 records' in capsys.readouterr()[0]
+    assert main([str(tmpdir.join('repaired'))]) == 0
@@ -0,0 +1,51 @@
+# -*- coding: utf-8 -*-
+import numpy as np
+
+from tensorboard_logger import Logger
+from tensorboard_logger.loadgen import compare_events, main, replay, run_load
+
+
+def test_run_load(tmpdir):
+    report = run_load(str(tmpdir), n_tags=10, n_steps=5, n_threads=2,
+                      mix='scalar=0.8,histogram=0.2', rss_secs=0.01)
+    assert report['calls'] == 50
+    assert report['latency']['scalar']['count'] == 40
+    assert report['latency']['histogram']['count'] == 10
+    assert 'image' not in report['latency']
+    assert report['bytes'] == tmpdir.join('proc-0').listdir()[0].size()
+    assert report['rss'] and all(rss > 0 for _, rss in report['rss'])
+
+
+def test_run_load_processes(tmpdir):
+    report = run_load(str(tmpdir), n_tags=4, n_steps=5, n_processes=2,
+                      api='module')
+    assert report['calls'] == 40
+    assert sorted(p.basename for p in tmpdir.listdir()) == \
+        ['proc-0', 'proc-1']
+
+
+def test_replay(tmpdir):
+    logger = Logger(str(tmpdir.join('src')))
+    for step in range(5):
+        logger.log_value('loss', 1. / (step + 1), step)
+        logger.log_histogram('weights', np.arange(10) * step, step)
+    logger.close()
+    src, = tmpdir.join('src').listdir()
+    report, output = replay(str(src), str(tmpdir.join('replay')))
+    assert report['calls'] == 10
+    assert compare_events(str(src), output) == 0
+
+
+def test_replay_reserved_and_multi_value(tmpdir):
+    logger = Logger(str(tmpdir.join('src')), stats_secs=0)
+    for step in range(3):
+        logger.log_value('loss', 1. / (step + 1), step)
+        logger.log_stats('act', np.arange(10) * step, step,
+                         stats=('min', 'max'))
+    logger.close()
+    src, = tmpdir.join('src').listdir()
+    report, output = replay(str(src), str(tmpdir.join('replay')))
+    assert report['latency']['event']['count'] > 3
+    assert compare_events(str(src), output) == 0
+    assert main(['--logdir', str(tmpdir.join('replay2')),
+                 '--replay', str(src)]) == 0
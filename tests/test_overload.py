@@ -0,0 +1,134 @@
+# -*- coding: utf-8 -*-
+import threading
+import time
+
+import numpy as np
+import pytest
+
+from tensorboard_logger import Logger
+from tensorboard_logger.overload import RecordQueue
+from tensorboard_logger.reader import read_events
+from tensorboard_logger.sinks import FileSink
+
+
+class StalledSink(FileSink):
+    """ File sink blocking on write until it is released.
+    """
+    def __init__(self, path):
+        super(StalledSink, self).__init__(path)
+        self.released = threading.Event()
+        self.writing = threading.Event()
+
+    def write(self, data):
+        self.writing.set()
+        self.released.wait()
+        super(StalledSink, self).write(data)
+
+
+def _stalled_logger(tmpdir, **kwargs):
+    sinks = []
+
+    def sink(path):
+        sinks.append(StalledSink(path))
+        return sinks[0]
+
+    logger = Logger(str(tmpdir), sink=sink, **kwargs)
+    sink, = sinks
+    assert sink.writing.wait(5)  # first event is being written
+    return logger, sink
+
+
+def _scalar_steps(tmpdir):
+    tf_log, = tmpdir.listdir()
+    return [e.step for e in read_events(str(tf_log))
+            if e.summary.value and e.summary.value[0].HasField('simple_value')]
+
+
+@pytest.mark.parametrize('policy', ['drop_newest', 'drop_oldest'])
+def test_drop_policies(tmpdir, policy):
+    logger, sink = _stalled_logger(
+        tmpdir, max_pending_records=6, overload=policy)
+    for step in range(10):
+        logger.log_value('v', step, step)
+    stats = logger.stats()
+    # The first event being written takes one record of the budget
+    assert stats['dropped'] == stats['dropped_scalars'] == 5
+    assert stats['queue_depth'] == 6
+    sink.released.set()
+    logger.close()
+    expected = [0, 1, 2, 3, 4] if policy == 'drop_newest' else [5, 6, 7, 8, 9]
+    assert _scalar_steps(tmpdir) == expected
+
+
+def test_drop_large_keeps_scalars(tmpdir):
+    tensor = np.zeros((64, 64), dtype=np.float32)
+    logger, sink = _stalled_logger(
+        tmpdir, max_pending_bytes=1 << 15, overload='drop_large')
+    for step in range(20):
+        logger.log_tensor('t', tensor, step)
+        logger.log_value('v', step, step)
+    stats = logger.stats()
+    assert stats['dropped'] > 0
+    assert stats['dropped_scalars'] == 0
+    assert stats['queue_bytes'] <= 1 << 15
+    sink.released.set()
+    logger.close()
+    assert _scalar_steps(tmpdir) == list(range(20))
+
+
+def test_block_timeout(tmpdir):
+    logger, sink = _stalled_logger(
+        tmpdir, max_pending_records=2, overload='block',
+        overload_timeout=0.05)
+    logger.log_value('v', 0, 0)
+    t0 = time.time()
+    logger.log_value('v', 1, 1)
+    assert time.time() - t0 >= 0.05
+    assert logger.stats()['dropped'] == 1
+    sink.released.set()
+    logger.close()
+    assert _scalar_steps(tmpdir) == [0]
+
+
+def test_block_until_written(tmpdir):
+    logger, sink = _stalled_logger(
+        tmpdir, max_pending_records=2, overload='block')
+    logger.log_value('v', 0, 0)
+    threading.Timer(0.05, sink.released.set).start()
+    for step in range(1, 10):
+        logger.log_value('v', step, step)
+    logger.close()
+    assert logger.stats()['dropped'] == 0
+    assert _scalar_steps(tmpdir) == list(range(10))
+
+
+def test_queue_oversized_record():
+    queue = RecordQueue(max_bytes=4, policy='drop_newest')
+    assert queue.put(b'too large')
+    assert not queue.put(b'a')
+    assert queue.get_batch(block=False) == [b'too large']
+    with pytest.raises(ValueError):
+        RecordQueue(policy='unknown')
+
+
+def test_first_records_kept(tmpdir):
+    queue = RecordQueue(max_records=2, policy='drop_oldest')
+    assert queue.put(b'header', keep=True)
+    for record in [b'a', b'b', b'c']:
+        assert queue.put(record)
+    # Batches are at most half of the budget
+    assert queue.get_batch(block=False) == [b'header']
+    assert queue.get_batch(block=False) == [b'c']
+
+    logger, sink = _stalled_logger(
+        tmpdir, max_pending_records=3, overload='drop_oldest', resume_step=5)
+    for step in range(5, 10):
+        logger.log_value('v', step, step)
+    sink.released.set()
+    logger.close()
+    tf_log, = tmpdir.listdir()
+    events = read_events(str(tf_log))
+    assert events[0].file_version
+    assert events[1].session_log.status == events[1].session_log.START
+    # The first event being written and the start event take the budget
+    assert _scalar_steps(tmpdir) == [9]
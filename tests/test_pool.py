@@ -0,0 +1,40 @@
+# -*- coding: utf-8 -*-
+from tensorboard_logger import Logger
+from tensorboard_logger.pool import WriterPool
+
+
+def test_writer_pool(tmpdir):
+    pool = WriterPool(max_open=5, buffer_size=200, flush_secs=0.05)
+    loggers = [Logger(str(tmpdir.join('pooled', str(i))), dummy_time=256.5,
+                      sink=pool.sink) for i in range(30)]
+    for step in range(20):
+        for i, logger in enumerate(loggers):
+            logger.log_value('v', i * step, step)
+            assert pool.stats()['open_files'] <= 5
+    stats = pool.stats()
+    assert stats['files'] == 30
+    assert stats['evictions'] > 0
+    pool.close()
+    assert pool.stats()['open_files'] == 0
+
+    for i in range(30):
+        logger = Logger(str(tmpdir.join('plain', str(i))), dummy_time=256.5)
+        for step in range(20):
+            logger.log_value('v', i * step, step)
+        logger.close()
+        pooled_log, = tmpdir.join('pooled', str(i)).listdir()
+        plain_log, = tmpdir.join('plain', str(i)).listdir()
+        assert pooled_log.basename == plain_log.basename
+        assert pooled_log.read_binary() == plain_log.read_binary()
+
+
+def test_writer_pool_flush(tmpdir):
+    pool = WriterPool(max_open=1)
+    logger = Logger(str(tmpdir), sink=pool.sink)
+    tf_log, = tmpdir.listdir()
+    size = tf_log.size()
+    logger.log_value('v', 1.0, 1)
+    pool.flush()
+    assert tf_log.size() > size
+    logger.close()
+    pool.close()
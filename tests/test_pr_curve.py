@@ -0,0 +1,57 @@
+# -*- coding: utf-8 -*-
+import numpy as np
+
+from tensorboard_logger import Logger
+from tensorboard_logger.pr_curve import compute_pr_curve, plugin_content
+from tensorboard_logger.tensorboard_logger import make_tensor_proto
+
+
+def _pr_curve_loop(labels, predictions, num_thresholds):
+    rows = []
+    for threshold in np.linspace(0, 1, num_thresholds):
+        # same bucketing as in compute_pr_curve
+        above = (np.floor(predictions * (num_thresholds - 1)) >=
+                 np.round(threshold * (num_thresholds - 1)))
+        tp = np.sum(above & labels)
+        fp = np.sum(above & ~labels)
+        tn = np.sum(~above & ~labels)
+        fn = np.sum(~above & labels)
+        rows.append([tp, fp, tn, fn,
+                     tp / max(1e-7, tp + fp), tp / max(1e-7, tp + fn)])
+    return np.array(rows, dtype=np.float32).T
+
+
+def test_compute_pr_curve():
+    rng = np.random.RandomState(42)
+    labels = rng.rand(10000) > 0.7
+    predictions = np.clip(labels * 0.3 + rng.rand(10000) * 0.7, 0, 1)
+    data = compute_pr_curve(labels, predictions, num_thresholds=51,
+                            chunk_size=999)
+    assert data.shape == (6, 51)
+    assert np.allclose(data, _pr_curve_loop(labels, predictions, 51))
+    weighted = compute_pr_curve(labels, predictions, num_thresholds=51,
+                                weights=np.full(10000, 2.0))
+    assert np.allclose(weighted[:4], 2 * data[:4])
+
+
+def test_log_pr_curve(tmpdir):
+    logger = Logger(str(tmpdir))
+    logger.log_pr_curve('pr', [True, False, True], [0.9, 0.6, 0.1],
+                        num_thresholds=11, step=3)
+    summary = logger._tensor_summary(
+        'pr', compute_pr_curve([True], [0.5], 11),
+        plugin_name='pr_curves', plugin_content=plugin_content(11))
+    value, = summary.value
+    assert value.metadata.plugin_data.plugin_name == 'pr_curves'
+    assert [d.size for d in value.tensor.tensor_shape.dim] == [6, 11]
+    logger.close()
+    tf_log, = tmpdir.listdir()
+    assert value.metadata.SerializeToString() in tf_log.read_binary()
+
+
+def test_make_tensor_proto():
+    array = np.arange(6, dtype='>i4').reshape(2, 3)
+    tensor = make_tensor_proto(array)
+    assert np.frombuffer(tensor.tensor_content, dtype='<i4').tolist() == \
+        list(range(6))
+    assert tensor.dtype == 3  # DT_INT32
@@ -0,0 +1,45 @@
+# -*- coding: utf-8 -*-
+import numpy as np
+import pytest
+
+from tensorboard_logger import Logger
+from tensorboard_logger.projector import subsample_rows
+
+
+def test_log_embedding(tmpdir):
+    logger = Logger(str(tmpdir))
+    path = str(tmpdir.join('matrix.npy'))
+    matrix = np.lib.format.open_memmap(
+        path, mode='w+', dtype=np.float32, shape=(1000, 4))
+    matrix[:] = np.arange(4000, dtype=np.float32).reshape(1000, 4)
+    labels = ['odd' if i % 2 else 'even' for i in range(1000)]
+    logger.log_embedding('emb 1', matrix, metadata=labels, step=2)
+    logger.log_embedding(
+        'emb 2', matrix, step=3, max_rows=100, sample='stratified',
+        metadata=list(zip(labels, range(1000))),
+        metadata_header=['parity', 'index'])
+    config = tmpdir.join('projector_config.pbtxt').read()
+    assert config.count('embeddings {') == 2
+    assert 'tensor_name: "emb_1:00002"' in config
+    assert 'tensor_path: "00003/emb_2/tensors.tsv"' in config
+    emb_dir = tmpdir.join('00002', 'emb_1')
+    assert np.array_equal(
+        np.loadtxt(str(emb_dir.join('tensors.tsv')), delimiter='\t'), matrix)
+    assert emb_dir.join('metadata.tsv').read().split('\n')[:2] == \
+        ['even', 'odd']
+    sampled = np.loadtxt(str(tmpdir.join('00003', 'emb_2', 'tensors.tsv')))
+    metadata = tmpdir.join('00003', 'emb_2', 'metadata.tsv').read()
+    header, rows = metadata.split('\n', 1)
+    assert header == 'parity\tindex'
+    indices = [int(line.split('\t')[1]) for line in rows.strip().split('\n')]
+    assert len(indices) == sampled.shape[0] == 100
+    assert np.array_equal(sampled, matrix[indices])
+    assert sum(i % 2 for i in indices) == 50
+
+
+def test_subsample_rows():
+    rows = subsample_rows(1000, 10)
+    assert len(set(rows)) == 10
+    assert list(rows) == sorted(rows)
+    with pytest.raises(ValueError):
+        subsample_rows(1000, 10, sample='stratified')
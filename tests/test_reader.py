@@ -0,0 +1,139 @@
+# -*- coding: utf-8 -*-
+import numpy as np
+import pytest
+
+from tensorboard_logger import Logger
+from tensorboard_logger.reader import (
+    CorruptRecordError, EventFileReader, LogdirFollower, read_events,
+    scan_tags)
+
+
+def _values(events):
+    return [(e.step, v.tag, v.simple_value)
+            for e in events for v in e.summary.value]
+
+
+def test_event_file_reader(tmpdir):
+    logger = Logger(str(tmpdir))
+    tf_log, = tmpdir.listdir()
+    reader = EventFileReader(str(tf_log))
+    first, = reader.read_events()
+    assert first.file_version == 'brain.Event:2'
+    assert reader.read_events() == []
+    logger.log_value('v', 1.0, 1)
+    logger.log_value('v', 2.0, 2)
+    assert _values(reader.read_events()) == [(1, 'v', 1.0), (2, 'v', 2.0)]
+    logger.log_value('v', 3.0, 3)
+    assert _values(reader.read_events()) == [(3, 'v', 3.0)]
+    assert reader.offset == tf_log.size()
+
+
+def test_partial_record(tmpdir):
+    logger = Logger(str(tmpdir.join('src')))
+    for step in range(3):
+        logger.log_value('v', step, step)
+    logger.close()
+    data = tmpdir.join('src').listdir()[0].read_binary()
+    partial = tmpdir.join('events.out.tfevents.1.host')
+    reader = EventFileReader(str(partial), check_crc=True)
+    events = []
+    # Simulate a writer appending a few bytes at a time
+    for end in range(0, len(data) + 1, 7):
+        partial.write_binary(data[:end])
+        events.extend(reader.read_events())
+    partial.write_binary(data)
+    events.extend(reader.read_events())
+    assert _values(events) == [(0, 'v', 0.0), (1, 'v', 1.0), (2, 'v', 2.0)]
+    assert _values(events) == _values(read_events(str(partial)))
+
+
+def test_large_records(tmpdir, monkeypatch):
+    from tensorboard_logger import reader as reader_module
+    monkeypatch.setattr(reader_module, 'READ_SIZE', 64)
+    logger = Logger(str(tmpdir))
+    for step in range(3):
+        logger.log_histogram('h', np.arange(100 * (step + 1)), step)
+    logger.close()
+    tf_log, = tmpdir.listdir()
+    reads = []
+
+    class CountingFile(object):
+        def __init__(self, f):
+            self._f = f
+
+        def __enter__(self):
+            return self
+
+        def __exit__(self, *args):
+            self._f.close()
+
+        def seek(self, offset):
+            self._f.seek(offset)
+
+        def read(self, size):
+            reads.append(size)
+            return self._f.read(size)
+
+    monkeypatch.setattr(reader_module, 'open',
+                        lambda *args: CountingFile(open(*args)),
+                        raising=False)
+    events = EventFileReader(str(tf_log), check_crc=True).read_events()
+    assert [e.step for e in events] == [0, 0, 1, 2]
+    # Each large record is read in at most two calls, plus one at the end
+    assert len(reads) <= 2 * len(events) + 1
+
+
+def test_corrupt_record(tmpdir):
+    logger = Logger(str(tmpdir))
+    logger.log_value('v', 1.0, 1)
+    logger.close()
+    tf_log, = tmpdir.listdir()
+    data = bytearray(tf_log.read_binary())
+    data[-6] ^= 0xff
+    tf_log.write_binary(bytes(data))
+    with pytest.raises(CorruptRecordError) as excinfo:
+        read_events(str(tf_log))
+    assert excinfo.value.offset > 0
+
+
+def test_logdir_follower(tmpdir):
+    follower = LogdirFollower(str(tmpdir))
+    assert follower.poll() == []
+    logger1 = Logger(str(tmpdir.join('run1')))
+    logger1.log_value('a', 1.0, 1)
+    assert len(follower.poll()) == 2
+    logger2 = Logger(str(tmpdir.join('run2')))
+    logger2.log_value('b', 2.0, 1)
+    logger1.log_value('a', 3.0, 2)
+    new = follower.poll()
+    assert sorted((path.split('/')[-2], v) for path, e in new
+                  for v in _values([e])) == [
+        ('run1', (2, 'a', 3.0)), ('run2', (1, 'b', 2.0))]
+    assert follower.poll() == []
+
+
+def test_scan_tags(tmpdir):
+    logger = Logger(str(tmpdir))
+    logger.log_value('loss', 1.0, 1)
+    logger.log_histogram('weights', np.random.normal(size=10000), 1)
+    logger.log_stats('act', [1, 2, 3], 1, stats=('min', 'max'))
+    logger.log_tensor('emb', np.zeros((100, 100)), 2)
+    logger.close()
+    tf_log, = tmpdir.listdir()
+    expected = {'loss', 'weights', 'act/min', 'act/max', 'emb'}
+    assert scan_tags(str(tf_log)) == expected
+    # Stops at a partial record
+    data = tf_log.read_binary()
+    tf_log.write_binary(data[:-10])
+    assert scan_tags(str(tf_log)) == expected - {'emb'}
+
+
+def test_side_files_ignored(tmpdir):
+    logger = Logger(str(tmpdir))
+    logger.log_value('v', 1.0, 1)
+    logger.close()
+    tf_log, = tmpdir.listdir()
+    # Half-written upload part next to the event file
+    tmpdir.join(tf_log.basename + '.part00001').write_binary(
+        tf_log.read_binary()[:-3])
+    assert len(LogdirFollower(str(tmpdir)).poll()) == 2
@@ -0,0 +1,62 @@
+# -*- coding: utf-8 -*-
+import sys
+import time
+
+import pytest
+
+from tensorboard_logger import Logger
+from tensorboard_logger.reader import read_events
+from tensorboard_logger.resources import ResourceSampler, read_counters
+
+
+linux_only = pytest.mark.skipif(
+    not sys.platform.startswith('linux'), reason='reads /proc')
+
+
+@linux_only
+def test_read_counters():
+    counters = read_counters()
+    assert set(counters) >= {
+        'cpu_seconds', 'rss_bytes', 'open_fds', 'threads', 'ctx_switches',
+        'load_avg_1m'}
+    assert counters['rss_bytes'] > 0
+    assert counters['threads'] >= 1
+
+
+def test_sampler_rates():
+    sampler = ResourceSampler()
+    assert sampler.sample({'cpu_seconds': 1., 'read_bytes': 0,
+                           'open_fds': 5}, now=10.) == []
+    assert dict(sampler.sample({'cpu_seconds': 1.2, 'read_bytes': 1000,
+                                'open_fds': 6}, now=12.)) == {
+        'cpu_percent': pytest.approx(10.),
+        'read_bytes_per_sec': 500.,
+        'open_fds': 6,
+    }
+    # Same time: no rates
+    assert sampler.sample({'cpu_seconds': 1.2}, now=12.) == []
+
+
+@linux_only
+def test_logger_resources(tmpdir):
+    logger = Logger(str(tmpdir), resources_secs=0.01)
+    logger.log_value('loss', 1.0, 7)
+    time.sleep(0.1)
+    logger.close()
+    assert not logger._resources_thread
+    path, = tmpdir.listdir()
+    events = [event for event in read_events(str(path))
+              if any(value.tag.startswith('tensorboard_logger/resources/')
+                     for value in event.summary.value)]
+    assert events
+    tags = [value.tag for value in events[-1].summary.value]
+    assert 'tensorboard_logger/resources/cpu_percent' in tags
+    assert 'tensorboard_logger/resources/rss_bytes' in tags
+    assert events[-1].step == 7
+
+
+def test_dummy_logger_resources():
+    logger = Logger(None, is_dummy=True, resources_secs=0.01)
+    time.sleep(0.1)
+    logger.close()
+    assert 'tensorboard_logger/resources/cpu_percent' in logger.dummy_log
@@ -0,0 +1,100 @@
+# -*- coding: utf-8 -*-
+import os
+
+import numpy as np
+import pytest
+
+from tensorboard_logger import Logger
+from tensorboard_logger.reader import parse_records
+from tensorboard_logger.runs import RunCollection, cache_path, load_scalars
+
+
+def _log_runs(tmpdir, n_runs=3, n_steps=5):
+    for seed in range(n_runs):
+        logger = Logger(str(tmpdir.join('seed-{}'.format(seed))))
+        for step in range(n_steps):
+            logger.log_value('loss', seed * 10 + step, step)
+            logger.log_value('acc', step, step)
+        logger.close()
+
+
+def test_load_scalars_cache(tmpdir):
+    logger = Logger(str(tmpdir))
+    logger.log_value('loss', 1, 0)
+    logger.log_histogram('hist', [1, 2], 0)
+    tf_log, = tmpdir.listdir()
+    scalars = load_scalars(str(tf_log))
+    assert scalars['tags'] == ['loss']
+    assert scalars['step'].tolist() == [0]
+    assert os.path.exists(cache_path(str(tf_log)))
+    logger.log_value('loss', 2, 1)
+    logger.log_value('acc', 3, 1)
+    offset = scalars['offset']
+    scalars = load_scalars(str(tf_log))
+    assert scalars['offset'] > offset
+    assert scalars['tags'] == ['loss', 'acc']
+    assert scalars['tag'].tolist() == [0, 0, 1]
+    assert scalars['value'].tolist() == [1, 2, 3]
+    logger.close()
+    # File was replaced: decoded again from the start
+    Logger(str(tmpdir.join('other'))).log_value('x', 5, 0)
+    other, = tmpdir.join('other').listdir()
+    other.copy(tf_log)
+    scalars = load_scalars(str(tf_log))
+    assert scalars['tags'] == ['x']
+
+
+def test_run_collection(tmpdir):
+    _log_runs(tmpdir)
+    runs = RunCollection([str(tmpdir)], processes=2)
+    assert [os.path.basename(run) for run in runs.runs] == \
+        ['seed-0', 'seed-1', 'seed-2']
+    assert sorted(runs.tags) == ['acc', 'loss']
+    table = runs.query(tags='^lo', runs='seed-[01]', min_step=1, max_step=3)
+    assert len(table) == 6
+    steps, values = table.series(runs.runs[1], 'loss')
+    assert steps.tolist() == [1, 2, 3]
+    assert values.tolist() == [11, 12, 13]
+    steps, mean = runs.query().aggregate('loss', 'mean')
+    assert steps.tolist() == list(range(5))
+    assert mean.tolist() == [10, 11, 12, 13, 14]
+    assert runs.query().aggregate('loss', 'max')[1].tolist() == \
+        [20, 21, 22, 23, 24]
+    assert runs.query().aggregate('loss', 0.25)[1].tolist() == \
+        [5, 6, 7, 8, 9]
+    _, std = runs.query().aggregate('loss', 'std')
+    np.testing.assert_allclose(std, np.std([0, 10, 20]))
+    with pytest.raises(ValueError):
+        runs.query().aggregate('loss', 'mode')
+
+
+@pytest.mark.parametrize('processes', [1, 2])
+def test_corrupt_file(tmpdir, processes):
+    _log_runs(tmpdir, n_runs=2)
+    tf_log, = tmpdir.join('seed-1').listdir()
+    data = bytearray(tf_log.read_binary())
+    # Corrupt the length CRC of the record of "loss" at step 3
+    offsets = [offset for offset, _ in parse_records(bytes(data))]
+    data[offsets[7] + 8] ^= 0xff
+    tf_log.write_binary(bytes(data))
+    with pytest.warns(UserWarning, match='CRC mismatch'):
+        runs = RunCollection([str(tmpdir)], processes=processes)
+    assert list(runs.errors) == [str(tf_log)]
+    steps, values = runs.query().series(runs.runs[0], 'loss')
+    assert values.tolist() == [0, 1, 2, 3, 4]
+    steps, values = runs.query().series(runs.runs[1], 'loss')
+    assert values.tolist() == [10, 11, 12]
+    assert not os.path.exists(cache_path(str(tf_log)))
+
+
+def test_aggregate_restarted_run(tmpdir):
+    _log_runs(tmpdir, n_runs=2, n_steps=3)
+    # Restarted from step 1
+    logger = Logger(str(tmpdir.join('seed-0')), dummy_time=2e9)
+    logger.log_value('loss', 100, 1)
+    logger.close()
+    runs = RunCollection(str(tmpdir), processes=1)
+    steps, values = runs.query().aggregate('loss', 'min')
+    assert values.tolist() == [0, 11, 2]
+    _, counts = runs.query().aggregate('loss', 'count')
+    assert counts.tolist() == [2, 2, 2]
@@ -0,0 +1,73 @@
+# -*- coding: utf-8 -*-
+import multiprocessing
+import threading
+
+import numpy as np
+import pytest
+
+from tensorboard_logger import Logger
+from tensorboard_logger.reader import read_events
+
+shared_memory = pytest.importorskip('multiprocessing.shared_memory')
+
+from tensorboard_logger.shm import SharedMemoryTransport
+
+
+def _produce(transport, n_steps):
+    for step in range(n_steps):
+        transport.log_value('loss', 1. / (step + 1), step)
+        transport.log_histogram(
+            'weights', np.full((256, 256), step, dtype=np.float32), step)
+        transport.log_histogram('small', np.arange(3), step)
+    assert transport.stats() == {
+        'shared': n_steps, 'inline': n_steps, 'dropped': 0}
+    transport.close()
+
+
+def _histograms(tmpdir, tag):
+    tf_log, = tmpdir.listdir()
+    return [(e.step, v.histo) for e in read_events(str(tf_log))
+            for v in e.summary.value if v.tag == tag]
+
+
+def test_shared_memory_transport(tmpdir):
+    transport = SharedMemoryTransport(n_slots=2, slot_size=1 << 20)
+    producer = multiprocessing.Process(target=_produce, args=(transport, 10))
+    producer.start()
+    logger = Logger(str(tmpdir))
+    try:
+        transport.serve(logger)
+    finally:
+        transport.unlink()
+    producer.join()
+    assert producer.exitcode == 0
+    logger.close()
+    histograms = _histograms(tmpdir, 'weights')
+    assert [step for step, _ in histograms] == list(range(10))
+    for step, histo in histograms:
+        assert (histo.min, histo.max, histo.num) == (step, step, 256 * 256)
+    assert len(_histograms(tmpdir, 'small')) == 10
+
+
+def test_backpressure(tmpdir):
+    transport = SharedMemoryTransport(
+        n_slots=1, slot_size=1 << 20, min_size=0, timeout=0.01)
+    images = [np.zeros((8, 8), dtype=np.uint8)] * 2
+    transport.log_histogram('h', np.arange(10.), 0)
+    transport.log_images('images', images, 0)  # no free slot
+    assert transport.stats() == {'shared': 1, 'inline': 0, 'dropped': 1}
+    transport.timeout = None
+    thread = threading.Thread(
+        target=transport.log_histogram, args=('h', np.arange(10.), 1))
+    thread.start()
+    transport.close()
+    logger = Logger(str(tmpdir))
+    try:
+        transport.serve(logger)  # releases the slot
+        thread.join()
+        transport.close()
+        transport.serve(logger)
+    finally:
+        transport.unlink()
+    logger.close()
+    assert [step for step, _ in _histograms(tmpdir, 'h')] == [0, 1]
@@ -0,0 +1,146 @@
+# -*- coding: utf-8 -*-
+from functools import partial
+import threading
+import time
+
+import pytest
+
+from tensorboard_logger import Logger
+from tensorboard_logger.sinks import (
+    ChunkedUploadSink, CsvSink, FileSink, LocalDirectoryUploader, MemorySink,
+    FanOutSink, csv_path, fan_out)
+
+
+def _log_values(logger):
+    for step in range(100):
+        logger.log_value('v1', step * 1.5, step)
+        logger.log_value('v2', step ** 1.5 - 2, step)
+    logger.close()
+
+
+def _expected(tmpdir):
+    logger = Logger(str(tmpdir.join('local')), dummy_time=256.5)
+    _log_values(logger)
+    local_log, = tmpdir.join('local').listdir()
+    return local_log
+
+
+def test_memory_sink(tmpdir):
+    sinks = []
+
+    def sink(path):
+        sinks.append(MemorySink(path))
+        return sinks[-1]
+
+    logger = Logger('run', dummy_time=256.5, sink=sink)
+    _log_values(logger)
+    expected = _expected(tmpdir)
+    memory_sink, = sinks
+    assert memory_sink.path == 'run/' + expected.basename
+    assert memory_sink.getvalue() == expected.read_binary()
+
+
+def test_chunked_upload_sink(tmpdir):
+    uploader = LocalDirectoryUploader(str(tmpdir.join('bucket')))
+    uploaded = []
+
+    def upload_part(path, part_number, data):
+        uploaded.append(part_number)
+        uploader.upload_part(path, part_number, data)
+
+    logger = Logger('run', dummy_time=256.5, sink=partial(
+        ChunkedUploadSink, upload_part=upload_part,
+        complete=uploader.complete, part_size=1000, concurrency=3))
+    _log_values(logger)
+    expected = _expected(tmpdir)
+    uploaded_log, = tmpdir.join('bucket', 'run').listdir()
+    assert uploaded_log.basename == expected.basename
+    assert uploaded_log.read_binary() == expected.read_binary()
+    n_parts = (expected.size() + 999) // 1000
+    assert sorted(uploaded) == list(range(1, n_parts + 1))
+
+
+def test_chunked_upload_sink_error():
+    def upload_part(path, part_number, data):
+        raise IOError('upload failed')
+
+    sink = ChunkedUploadSink('run/events', upload_part, part_size=10)
+    sink.write(b'x' * 25)
+    with pytest.raises(IOError):
+        sink.close()
+
+
+class _StalledSink(MemorySink):
+    def __init__(self, path=None):
+        super(_StalledSink, self).__init__(path)
+        self.resume = threading.Event()
+
+    def write(self, data):
+        self.resume.wait()
+        super(_StalledSink, self).write(data)
+
+
+def test_fan_out(tmpdir):
+    memory = MemorySink()
+    stalled = _StalledSink()
+    logger = Logger(str(tmpdir), dummy_time=256.5, sink=fan_out(
+        FileSink, CsvSink, lambda path: memory, lambda path: stalled))
+    logger.log_value('v1', 1.5, 1)
+    logger.log_histogram('h', [1, 2, 3], 1)
+    logger.log_value('v2', -2., 2)
+    # A stalled sink does not block logging or other sinks
+    deadline = time.time() + 5
+    while b'v2' not in memory.getvalue() and time.time() < deadline:
+        time.sleep(0.01)
+    assert b'v2' in memory.getvalue()
+    assert not stalled.getvalue()
+    sinks = logger.stats()['sinks']
+    assert sorted(sinks) == ['0', '1', '2', '3']
+    assert sinks['3']['queue_bytes'] > 0
+    assert all(stats['dropped'] == 0 for stats in sinks.values())
+    stalled.resume.set()
+    logger.close()
+    tf_log, = tmpdir.listdir('*tfevents*')
+    assert tf_log.read_binary() == memory.getvalue() == stalled.getvalue()
+    csv_log, = tmpdir.listdir('*.csv')
+    assert csv_log.basename == csv_path(tf_log.basename)
+    assert csv_log.read().splitlines() == [
+        'wall_time,step,tag,value', '256.5,1,v1,1.5', '256.5,2,v2,-2.0']
+
+
+@pytest.mark.parametrize('overload', ['drop_oldest', 'block'])
+def test_fan_out_stalled_first(overload):
+    stalled, memory = _StalledSink(), MemorySink()
+    sink = FanOutSink([stalled, memory], max_pending_bytes=100,
+                      overload=overload, overload_timeout=1)
+    records = [b'%029d\n' % i for i in range(5)]
+    for i, record in enumerate(records):
+        # With "block", the record reaches the other sink while waiting
+        writer = threading.Thread(target=sink.write, args=(record,))
+        writer.start()
+        expected = b''.join(records[:i + 1])
+        deadline = time.time() + 0.5
+        while memory.getvalue() != expected and time.time() < deadline:
+            time.sleep(0.01)
+        assert memory.getvalue() == expected
+        writer.join()
+    assert sink.stats()['0']['dropped'] > 0
+    assert sink.stats()['1']['dropped'] == 0
+    stalled.resume.set()
+    sink.close()
+    # The first write is never dropped
+    assert stalled.getvalue().startswith(records[0])
+
+
+def test_fan_out_error(tmpdir):
+    class FailingSink(MemorySink):
+        def write(self, data):
+            raise IOError('disk full')
+
+    memory = MemorySink()
+    logger = Logger(str(tmpdir), sink=fan_out(
+        FailingSink, lambda path: memory))
+    logger.log_value('v', 1.0, 1)
+    with pytest.raises(IOError):
+        logger.close()
+    assert memory.getvalue()
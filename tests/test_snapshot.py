@@ -0,0 +1,36 @@
+# -*- coding: utf-8 -*-
+import pytest
+
+from tensorboard_logger import Logger
+from tensorboard_logger.snapshot import (
+    SNAPSHOT_NAME, decode_snapshot, read_snapshot)
+
+
+def test_snapshot(tmpdir):
+    logger = Logger(str(tmpdir), snapshot_secs=0, dummy_time=100.5)
+    assert read_snapshot(str(tmpdir)) == {}
+    logger.log_value('loss', 2.0, 1)
+    logger.log_value('loss', 1.5, 2)
+    logger.log_histogram('weights', [1, 2, 3], 2)
+    logger.log_stats('act', [1, 2, 3], 3, stats=('min', 'max'))
+    assert read_snapshot(str(tmpdir.join(SNAPSHOT_NAME))) == {
+        'loss': (2, 100.5, 1.5),
+        'act/min': (3, 100.5, 1.0),
+        'act/max': (3, 100.5, 3.0),
+    }
+    logger.close()
+    assert sorted(p.basename for p in tmpdir.listdir())[1:] == [SNAPSHOT_NAME]
+
+
+def test_snapshot_interval(tmpdir):
+    logger = Logger(str(tmpdir), snapshot_secs=3600, stats=True)
+    logger.log_value('loss', 2.0, 1)
+    # Written only with the first event, and on close
+    assert read_snapshot(str(tmpdir)) == {}
+    logger.close()
+    assert read_snapshot(str(tmpdir))['loss'][::2] == (1, 2.0)
+
+
+def test_bad_snapshot():
+    with pytest.raises(ValueError):
+        decode_snapshot(b'TBLX\x01\x00\x00\x00\x00\x00')
@@ -1,11 +1,18 @@
 # -*- coding: utf-8 -*-
 import time
+import gc
 import os
 import glob
+import struct
+import sys
+import threading
 import numpy as np
+import pytest
 
 from tensorboard_logger import Logger, configure, log_value
-from tensorboard_logger.tensorboard_logger import make_valid_tf_name
+from tensorboard_logger.sinks import FileSink
+from tensorboard_logger.tensorboard_logger import (
+    event_pb2, make_valid_tf_name, masked_crc32c)
 
 
 def test_smoke_default(tmpdir):
@@ -139,3 +146,344 @@ def test_real_image_data(tmpdir):
     logger.log_images('key', images, step=3)
     tf_log, = glob.glob(str(tmpdir) + '/*')
     assert os.path.basename(tf_log).startswith('events.out.tfevents.')
+
+
+def test_stats_disabled():
+    logger = Logger(None, is_dummy=True)
+    logger.log_value('v', 1.0, 1)
+    assert logger.stats() == {'queue_depth': 0}
+
+
+def test_stats(tmpdir):
+    logger = Logger(str(tmpdir), stats=True)
+    for step in range(3):
+        logger.log_value('v1', step, step)
+    logger.log_histogram('h', [1, 2, 3], step=1)
+    stats = logger.stats()
+    assert stats['events'] == 4
+    assert stats['tags']['v1']['events'] == 3
+    assert stats['bytes'] == sum(t['bytes'] for t in stats['tags'].values())
+    assert stats['bytes'] < tmpdir.listdir()[0].size()
+    assert set(stats['time']) == {'summary', 'encode', 'crc', 'io'}
+
+
+def test_stats_written():
+    logger = Logger(None, is_dummy=True, stats_secs=0)
+    logger.log_value('v', 1.0, 5)
+    assert logger.dummy_log['tensorboard_logger/events'] == [(5, 1)]
+    assert 'tensorboard_logger/time/io' in logger.dummy_log
+    with pytest.raises(ValueError):
+        logger.log_value('tensorboard_logger/events', 1.0)
+    # Only reserved when stats are written
+    logger = Logger(None, is_dummy=True, stats=True)
+    logger.log_value('tensorboard_logger/events', 1.0)
+    assert 'tensorboard_logger/events' in logger.dummy_log
+
+
+def test_timer():
+    logger = Logger(None, is_dummy=True)
+
+    @logger.timer('forward')
+    def forward():
+        with logger.timer('inner'):
+            pass
+
+    for step in range(2):
+        for _ in range(3):
+            with logger.timer('step'):
+                forward()
+        logger.log_timers(step)
+    assert set(logger.dummy_log) == {'forward', 'inner', 'step'}
+    (step0, (mean, max_, count)), _ = logger.dummy_log['step']
+    assert step0 == 0
+    assert count == ('count', 3)
+    assert 0 < mean[1] <= max_[1]
+
+
+def test_timer_sampling():
+    logger = Logger(None, is_dummy=True)
+    timer = logger.timer('hot', every=10)
+    for _ in range(25):
+        with timer:
+            pass
+    assert timer.count == 25
+    assert timer.n_sampled == 2
+    assert logger.timer('hot', every=10) is timer
+    with pytest.raises(ValueError):
+        logger.timer('hot')
+    logger.log_timers(1)
+    logger.log_timers(2)  # not called since previous log_timers
+    (step, values), = logger.dummy_log['hot']
+    assert dict(values)['count'] == 25
+
+
+def test_timer_secs():
+    logger = Logger(None, is_dummy=True, timer_secs=0)
+    logger.log_value('v', 1.0, step=7)
+    with logger.timer('t'):
+        pass
+    (step, values), = logger.dummy_log['t']
+    assert step == 7
+
+
+def _read_records(data):
+    """ Parse TFRecords checking length and data CRCs.
+    """
+    records = []
+    offset = 0
+    while offset < len(data):
+        header = data[offset:offset + 8]
+        length, = struct.unpack('Q', header)
+        header_crc, = struct.unpack('I', data[offset + 8:offset + 12])
+        assert header_crc == masked_crc32c(header)
+        record = data[offset + 12:offset + 12 + length]
+        data_crc, = struct.unpack(
+            'I', data[offset + 12 + length:offset + 16 + length])
+        assert data_crc == masked_crc32c(record)
+        records.append(record)
+        offset += 16 + length
+    return records
+
+
+def test_threads(tmpdir):
+    logger = Logger(str(tmpdir))
+    n_threads, n_steps = 8, 300
+    start = threading.Event()
+
+    def worker(i):
+        start.wait()
+        for step in range(n_steps):
+            logger.log_value('shared', step, step)
+            logger.log_value('thread {}'.format(i), i * step, step)
+            logger.log_value('new {} {}'.format(i, step % 10), step)
+
+    threads = [threading.Thread(target=worker, args=(i,))
+               for i in range(n_threads)]
+    for thread in threads:
+        thread.start()
+    start.set()
+    for thread in threads:
+        thread.join()
+    logger.close()
+    tf_log, = tmpdir.listdir()
+    records = _read_records(tf_log.read_binary())
+    assert len(records) == 1 + 3 * n_threads * n_steps
+    tags = set()
+    for record in records[1:]:
+        event = event_pb2.Event.FromString(record)
+        tags.add(event.summary.value[0].tag)
+    assert len(tags) == 1 + n_threads + n_threads * 10
+    assert 'shared' in tags and 'shared/1' not in tags
+
+
+def test_resume(tmpdir):
+    from tensorboard_logger.reader import read_events
+    logger = Logger(str(tmpdir), dummy_time=1e9)
+    logger.log_value('loss', 1.0, 1)
+    logger.log_value('a b', 1.0, 1)
+    logger.log_value('a:b', 2.0, 1)
+    logger.log_value('loss', 0.5, 2)
+    logger.close()
+    logger = Logger(str(tmpdir), dummy_time=2e9, resume_step=2)
+    logger.log_value('a b', 3.0, 2)
+    logger.log_value('a:b', 4.0, 2)
+    logger.log_value('loss', 0.7, 2)
+    logger.log_value('new', 1.0, 2)
+    logger.close()
+    _, resumed = sorted(str(p) for p in tmpdir.listdir())
+    events = read_events(resumed)
+    assert events[1].session_log.status == events[1].session_log.START
+    assert events[1].step == 2
+    assert [v.tag for e in events[2:] for v in e.summary.value] == [
+        'a_b', 'a_b/1', 'loss', 'new']
+
+
+def test_shards(tmpdir):
+    from tensorboard_logger.reader import read_events
+    logger = Logger(str(tmpdir), shards={
+        'histograms': {}, 'images': {},
+        'tensors': {'max_pending_bytes': 1 << 20}})
+    logger.log_value('loss', 1.0, 1)
+    logger.log_histogram('weights', [1, 2, 3], 1)
+    logger.log_tensor('emb', np.zeros((2, 2)), 1)
+    logger.log_value('loss', 0.5, 2)
+    assert set(logger.stats()['shards']) == {
+        'histograms', 'images', 'tensors'}
+    logger.close()
+    # No images were logged, so there is no images file
+    assert len(tmpdir.listdir()) == 3
+    paths = {}
+    for path in map(str, tmpdir.listdir()):
+        kind = path.rsplit('.', 1)[1]
+        paths[kind if kind in ('histograms', 'tensors') else 'main'] = path
+    assert paths['histograms'] == paths['main'] + '.histograms'
+    tags = {kind: [(e.step, v.tag) for e in read_events(path)
+                   for v in e.summary.value]
+            for kind, path in paths.items()}
+    assert tags == {
+        'main': [(1, 'loss'), (2, 'loss')],
+        'histograms': [(1, 'weights')],
+        'tensors': [(1, 'emb')],
+    }
+    with pytest.raises(ValueError):
+        Logger(str(tmpdir), shards={'audio': {}})
+
+
+@pytest.mark.skipif(not hasattr(os, 'register_at_fork'),
+                    reason='requires os.register_at_fork')
+def test_fork(tmpdir):
+    from tensorboard_logger.reader import iter_run_events, read_events
+    logger = Logger(str(tmpdir))
+    logger.log_value('loss', 1.0, 1)
+    pid = os.fork()
+    if pid == 0:
+        try:
+            logger.log_value('worker', 2.0, 2)
+            logger.close()
+        finally:
+            os._exit(0)
+    os.waitpid(pid, 0)
+    logger.log_value('loss', 3.0, 3)
+    logger.close()
+    paths = sorted(map(str, tmpdir.listdir()), key=len)
+    assert len(paths) == 2
+    assert paths[1].endswith('.{}'.format(pid))
+
+    def values(events):
+        return [(e.step, v.tag) for e in events for v in e.summary.value]
+
+    assert values(read_events(paths[0])) == [(1, 'loss'), (3, 'loss')]
+    assert values(read_events(paths[1])) == [(2, 'worker')]
+    assert values(iter_run_events(str(tmpdir))) == [
+        (1, 'loss'), (2, 'worker'), (3, 'loss')]
+
+
+class _BufferedFileSink(FileSink):
+    def flush(self):
+        pass  # records stay in the file buffer until close
+
+
+@pytest.mark.parametrize('max_pending_bytes', [None, 1 << 20])
+def test_fork_buffered(tmpdir, max_pending_bytes):
+    from tensorboard_logger.reader import read_events
+    logger = Logger(str(tmpdir), sink=_BufferedFileSink,
+                    max_pending_bytes=max_pending_bytes)
+    logger.log_value('loss', 1.0, 1)
+    deadline = time.time() + 5
+    while logger.stats().get('queue_bytes') and time.time() < deadline:
+        time.sleep(0.01)
+    pid = os.fork()
+    if pid == 0:
+        try:
+            gc.collect()
+            logger.log_value('worker', 2.0, 2)
+            logger.close()
+        finally:
+            os._exit(0)
+    os.waitpid(pid, 0)
+    logger.log_value('loss', 3.0, 3)
+    logger.close()
+    path, = [str(p) for p in tmpdir.listdir()
+             if not str(p).endswith('.{}'.format(pid))]
+    events = list(read_events(path))
+    assert [e.file_version for e in events].count('brain.Event:2') == 1
+    assert [(e.step, v.tag) for e in events for v in e.summary.value] == [
+        (1, 'loss'), (3, 'loss')]
+
+
+@pytest.mark.parametrize('max_pending_bytes', [None, 1 << 20])
+def test_fork_idle_children(tmpdir, max_pending_bytes):
+    from tensorboard_logger.reader import read_events
+    logger = Logger(str(tmpdir), shards=True,
+                    max_pending_bytes=max_pending_bytes)
+    logger.log_value('loss', 1.0, 1)
+    n_files = len(tmpdir.listdir())
+
+    def fork(child):
+        pid = os.fork()
+        if pid == 0:
+            try:
+                child()
+            finally:
+                os._exit(0)
+        os.waitpid(pid, 0)
+        return pid
+
+    def log_histogram():
+        logger.log_histogram('weights', [1, 2, 3], 2)
+        logger.close()
+
+    fork(lambda: None)
+    fork(logger.close)
+    pid = fork(log_histogram)
+    logger.close()
+    paths = [str(p) for p in tmpdir.listdir()]
+    assert len(paths) == n_files + 1
+    path, = [p for p in paths if '.{}.'.format(pid) in p]
+    assert path.endswith('.histograms')
+    events = list(read_events(path))
+    assert events[0].file_version == 'brain.Event:2'
+    assert [v.tag for e in events for v in e.summary.value] == ['weights']
+
+
+def test_max_tags():
+    logger = Logger(None, is_dummy=True, max_tags=2, tag_overflow='fold')
+    for i in range(5):
+        logger.log_value('loss/{}'.format(i), float(i), i)
+    logger.log_value('loss/0', 10., 5)
+    assert sorted(logger.dummy_log) == ['loss/0', 'loss/1', 'other']
+    assert logger.dummy_log['other'] == [(2, 2.), (3, 3.), (4, 4.)]
+    assert logger.dummy_log['loss/0'] == [(0, 0.), (5, 10.)]
+    assert logger.stats()['cardinality'] == {
+        'tags': 2, 'max_tags': 2, 'overflow': 3}
+
+    logger = Logger(None, is_dummy=True, max_tags=1)
+    logger.log_value('a', 1.)
+    with pytest.warns(UserWarning):
+        logger.log_value('b', 1.)
+    logger.log_histogram('c', [1, 2])
+    assert list(logger.dummy_log) == ['a']
+    assert logger.stats()['cardinality']['overflow'] == 2
+
+    logger = Logger(None, is_dummy=True, max_tags=1, tag_overflow='reject')
+    logger.log_value('a', 1.)
+    with pytest.raises(ValueError):
+        logger.log_value('b', 1.)
+
+
+def test_max_tags_fold_kinds(tmpdir):
+    logger = Logger(str(tmpdir), is_dummy=True, max_tags=1,
+                    tag_overflow='fold')
+    logger.log_value('a', 1., 0)
+    logger.log_histogram('h1', [1, 2], 0)
+    logger.log_histogram('h2', [3], 1)
+    logger.log_tensor('x', np.zeros(2), 0)
+    with pytest.warns(UserWarning):
+        logger.log_embedding('e', np.zeros((2, 2)), step=0)
+    assert sorted(logger.dummy_log) == [
+        'a', 'other/histograms', 'other/tensors']
+    assert [step for step, _ in logger.dummy_log['other/histograms']] == [0, 1]
+    assert logger.timer('t1') is logger.timer('t2')
+    assert len(logger._timers) == 1
+    with logger.timer('t3'):
+        pass
+    logger.log_timers(step=2)
+    assert 'other/timers' in logger.dummy_log
+
+
+def test_bad_tag_overflow(monkeypatch):
+    unraisable = []
+    monkeypatch.setattr(sys, 'unraisablehook', unraisable.append,
+                        raising=False)
+    with pytest.raises(ValueError):
+        Logger(None, is_dummy=True, tag_overflow='ignore')
+    gc.collect()
+    assert unraisable == []
+
+
+def test_many_colliding_names():
+    logger = Logger(None, is_dummy=True)
+    for i in range(2000):
+        logger.log_value('a' + ' ' * i + 'b', 1.)
+    assert len(logger.dummy_log) == 2000
+    assert 'a_b/1998' in logger.dummy_log